@@ -37,11 +37,14 @@ import inspect
 import json
 import logging
 import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
 import pandas as pd
 from advisor_prediction_contract import (
     build_prediction_contract_context as build_prediction_contract_payload,
@@ -155,14 +158,23 @@ class TradingAdvisor:
         # Cache
         self._market_status: Optional[MarketStatus] = None
         self._candidate_context_by_symbol: Dict[str, Dict] = {}
+        # Per-trading-day caches so a scan followed by get_recommendations
+        # doesn't refetch fundamentals or rescore the same history.
+        self._fund_cache: Dict[Tuple[str, date], Dict] = {}
+        self._tech_cache: Dict[Tuple[str, date], Tuple[Tuple, Dict]] = {}
+        self._day_cache_lock = threading.Lock()
         self._benchmark_history_cache: Dict[str, pd.DataFrame] = {}
     
     def get_market_status(self, refresh: bool = False) -> MarketStatus:
         """Get current market regime status."""
         if self._market_status is None or refresh:
-            self._market_status = self.market_detector.get_status()
+            self._market_status = self.market_detector.get_status(refresh=refresh)
         return self._market_status
 
+    def prime_market_status(self, status: MarketStatus) -> None:
+        """Use an already-known market status (e.g. a fresh cached one) instead of fetching."""
+        self._market_status = status
+
     def _get_benchmark_history(self, *, period: str = "1y") -> pd.DataFrame | None:
         cached = self._benchmark_history_cache.get(period)
         if cached is not None:
@@ -328,7 +340,7 @@ class TradingAdvisor:
         else:
             l_score = 0
 
-        daily_return = close.pct_change()
+        daily_return = close.pct_change(fill_method=None)
         up_days = daily_return > 0
         avg_up_volume = float(volume[up_days].mean()) if up_days.any() else 0.0
         avg_down_volume = float(volume[~up_days].mean()) if (~up_days).any() else 1.0
@@ -516,6 +528,62 @@ class TradingAdvisor:
         )
         return ordered
 
+    @staticmethod
+    def _trading_day() -> date:
+        return datetime.now(UTC).date()
+
+    def _prune_day_caches(self, today: date) -> None:
+        """Drop entries from previous trading days so the caches never serve stale data across sessions.
+
+        Callers must hold ``_day_cache_lock``.
+        """
+        for cache in (self._fund_cache, self._tech_cache):
+            for key in [key for key in cache if key[1] != today]:
+                del cache[key]
+
+    def _cached_fundamentals(self, symbol: str) -> Dict:
+        today = self._trading_day()
+        with self._day_cache_lock:
+            cached = self._fund_cache.get((symbol, today))
+        if cached is None:
+            # Fetch outside the lock; if another worker stored the symbol
+            # meanwhile, keep the first result.
+            fetched = self.fundamentals.get_fundamentals(symbol)
+            with self._day_cache_lock:
+                self._prune_day_caches(today)
+                cached = self._fund_cache.setdefault((symbol, today), fetched)
+        return dict(cached)
+
+    def _prefetch_fundamentals(self, symbols: List[str]) -> None:
+        """Warm the fundamentals cache for symbols not already fetched today, in one concurrent batch."""
+        today = self._trading_day()
+        with self._day_cache_lock:
+            self._prune_day_caches(today)
+            missing = [symbol for symbol in symbols if (symbol, today) not in self._fund_cache]
+        if not missing:
+            return
+        fetched = self.fundamentals.get_fundamentals_batch(missing)
+        with self._day_cache_lock:
+            self._prune_day_caches(today)
+            for symbol, fund in fetched.items():
+                self._fund_cache[(symbol, today)] = fund
+
+    def _cached_technical_score(self, symbol: str, hist: pd.DataFrame) -> Dict:
+        """Technical score keyed by (symbol, trading_day), reused only while the history is unchanged."""
+        if hist is None or hist.empty:
+            return self._calculate_technical_score_from_history(symbol, hist)
+        today = self._trading_day()
+        fingerprint = (len(hist), hist.index[-1], hist['Close'].iloc[-1])
+        with self._day_cache_lock:
+            cached = self._tech_cache.get((symbol, today))
+        if cached is not None and cached[0] == fingerprint:
+            return dict(cached[1])
+        tech = self._calculate_technical_score_from_history(symbol, hist)
+        with self._day_cache_lock:
+            self._prune_day_caches(today)
+            self._tech_cache[(symbol, today)] = (fingerprint, tech)
+        return dict(tech)
+
     def analyze_stock(
         self,
         symbol: str,
@@ -553,18 +621,20 @@ class TradingAdvisor:
         except Exception as e:
             return {'symbol': symbol, 'error': str(e)}
         
+        # Get technicals first: they only need the history we already have,
+        # so symbols without enough data drop out before the fundamentals
+        # round-trip.
+        tech = _time_block("technicals", lambda: self._cached_technical_score(symbol, hist))
+        
+        if 'error' in tech:
+            return {'symbol': symbol, 'error': tech['error']}
+        
         # Get fundamentals
-        fund = _time_block("fundamentals", lambda: self.fundamentals.get_fundamentals(symbol))
+        fund = _time_block("fundamentals", lambda: self._cached_fundamentals(symbol))
         fund_scores = _time_block("fundamental_scores", lambda: self.fundamentals.score_canslim_fundamentals(fund))
         candidate_context = self._candidate_context_by_symbol.get(symbol, {})
         sector_name = candidate_context.get("sector") or fund.get("sector")
         
-        # Get technicals
-        tech = _time_block("technicals", lambda: self._calculate_technical_score_from_history(symbol, hist))
-        
-        if 'error' in tech:
-            return {'symbol': symbol, 'error': tech['error']}
-        
         # Get market status
         market = _time_block("market_status", lambda: self.get_market_status())
         breakout = _time_block("breakout", lambda: score_breakout_follow_through(hist))
@@ -1591,6 +1661,10 @@ class TradingAdvisor:
         """
         price = tech_scores.get('price', 0)
         pct_from_high = tech_scores.get('pct_from_high', 0)
+        c_score = fund_scores.get('C', 0)
+        a_score = fund_scores.get('A', 0)
+        n_score = tech_scores.get('N_score', 0)
+        l_score = tech_scores.get('L_score', 0)
         breakout_score = int(breakout.get('score', 0))
         sentiment_score = int(sentiment_overlay.get('score', 0))
         exit_risk_score = int(exit_risk.get('score', 0))
@@ -1755,14 +1829,14 @@ class TradingAdvisor:
         # Build reasoning
         reasons = []
         
-        if fund_scores.get('C', 0) >= 2:
-            reasons.append(f"✅ Strong current earnings (C={fund_scores['C']})")
-        if fund_scores.get('A', 0) >= 2:
-            reasons.append(f"✅ Strong annual growth (A={fund_scores['A']})")
-        if tech_scores.get('L_score', 0) >= 2:
-            reasons.append(f"✅ Market leader (L={tech_scores['L_score']})")
-        if tech_scores.get('N_score', 0) >= 2:
-            reasons.append(f"✅ Near 52-week high (N={tech_scores['N_score']})")
+        if c_score >= 2:
+            reasons.append(f"✅ Strong current earnings (C={c_score})")
+        if a_score >= 2:
+            reasons.append(f"✅ Strong annual growth (A={a_score})")
+        if l_score >= 2:
+            reasons.append(f"✅ Market leader (L={l_score})")
+        if n_score >= 2:
+            reasons.append(f"✅ Near 52-week high (N={n_score})")
         if breakout_score >= 3:
             reasons.append(f"✅ Breakout follow-through {breakout_score}/5 ({breakout.get('status', 'mixed')})")
         if sentiment_score > 0:
@@ -1793,6 +1867,44 @@ class TradingAdvisor:
             **base_fields,
         }
     
+    @staticmethod
+    def _scan_enrichment_fields(analysis: Dict, row: Dict) -> Dict:
+        """Scan columns derived from one analyze_stock result (row supplies fallbacks)."""
+        scores = analysis.get('fundamental_scores', {})
+        rec = analysis.get('recommendation', {})
+        fields = {
+            'C_score': scores.get('C', 0),
+            'A_score': scores.get('A', 0),
+            'I_score': scores.get('I', 0),
+            'S_fund_score': scores.get('S', 0),
+            'total_score': analysis.get('total_score', 0),
+            'breakout_score': analysis.get('breakout_follow_through', {}).get('score', 0),
+            'sentiment_score': analysis.get('sentiment_overlay', {}).get('score', 0),
+            'exit_risk_score': analysis.get('exit_risk', {}).get('score', 0),
+            'sector_score': analysis.get('sector_context', {}).get('score', 0),
+            'catalyst_score': analysis.get('catalyst_weighting', {}).get('score', 0),
+            'rank_score': analysis.get('rank_score', analysis.get('total_score', 0)),
+            'confidence': rec.get('confidence', analysis.get('confidence', 0)),
+        }
+        fields['raw_confidence'] = analysis.get('raw_confidence', fields['confidence'])
+        fields['effective_confidence'] = analysis.get('effective_confidence', fields['confidence'])
+        fields['uncertainty_pct'] = analysis.get('uncertainty_pct', 0)
+        fields['market_regime'] = analysis.get('market_regime', row.get('market_regime'))
+        fields['abstain'] = analysis.get('abstain', False)
+        fields['abstain_reason_codes'] = analysis.get('abstain_reason_codes', [])
+        fields['position_size_pct'] = rec.get('position_size_pct', 0.0)
+        fields['size_label'] = rec.get('size_label', rec.get('sizing', {}).get('label', 'STANDARD'))
+        fields['action'] = rec.get('action', 'NO_BUY')
+        fields['trade_quality_score'] = analysis.get('trade_quality_score', rec.get('trade_quality_score', fields['rank_score']))
+        fields['opportunity_score'] = rec.get('opportunity_score', analysis.get('opportunity_score', fields['rank_score']))
+        fields['calibrated_confidence'] = rec.get('calibrated_confidence', analysis.get('calibrated_confidence'))
+        fields['downside_risk'] = rec.get('downside_risk', analysis.get('downside_risk'))
+        fields['strategy_family'] = rec.get('strategy_family', analysis.get('strategy_family', 'canslim'))
+        fields['v2_action_label'] = rec.get('v2_action_label', analysis.get('v2_action_label'))
+        fields['adverse_regime_score'] = analysis.get('adverse_regime', {}).get('score', 0.0)
+        fields['adverse_regime_label'] = analysis.get('adverse_regime', {}).get('label', 'normal')
+        return fields
+
     def scan_for_opportunities(
         self,
         quick: bool = False,
@@ -1835,55 +1947,33 @@ class TradingAdvisor:
         # Enrich with fundamental scores for top candidates
         print("\n📊 Enriching top candidates with fundamental data...")
         
-        enriched = []
+        top = results.head(15)
+        top_symbols = top['symbol'].tolist()
+        kept_positions: List[int] = []
+        enrichments: List[Dict] = []
         previous_context = dict(self._candidate_context_by_symbol)
-        self._candidate_context_by_symbol = {
-            row['symbol']: row.to_dict()
-            for _, row in results.head(15).iterrows()
-        }
+        self._candidate_context_by_symbol = dict(zip(top_symbols, top.to_dict('records')))
 
         try:
-            for _, row in results.head(15).iterrows():
-                symbol = row['symbol']
+            # Pull fundamentals for every top candidate up front in one
+            # concurrent batch instead of one blocking round-trip per symbol.
+            # They land in the trading-day cache, so analyze_stock here and
+            # in get_recommendations reuses them.
+            try:
+                self._prefetch_fundamentals(top_symbols)
+            except Exception as e:
+                LOGGER.warning("Batch fundamentals prefetch failed: %s", e)
 
+            for position, symbol in enumerate(top_symbols):
                 try:
                     analysis = self.analyze_stock(symbol, quiet=True)
                     if 'error' in analysis:
                         continue
 
-                    row_dict = row.to_dict()
-                    scores = analysis.get('fundamental_scores', {})
-                    rec = analysis.get('recommendation', {})
-                    row_dict['C_score'] = scores.get('C', 0)
-                    row_dict['A_score'] = scores.get('A', 0)
-                    row_dict['I_score'] = scores.get('I', 0)
-                    row_dict['S_fund_score'] = scores.get('S', 0)
-                    row_dict['total_score'] = analysis.get('total_score', 0)
-                    row_dict['breakout_score'] = analysis.get('breakout_follow_through', {}).get('score', 0)
-                    row_dict['sentiment_score'] = analysis.get('sentiment_overlay', {}).get('score', 0)
-                    row_dict['exit_risk_score'] = analysis.get('exit_risk', {}).get('score', 0)
-                    row_dict['sector_score'] = analysis.get('sector_context', {}).get('score', 0)
-                    row_dict['catalyst_score'] = analysis.get('catalyst_weighting', {}).get('score', 0)
-                    row_dict['rank_score'] = analysis.get('rank_score', analysis.get('total_score', 0))
-                    row_dict['confidence'] = rec.get('confidence', analysis.get('confidence', 0))
-                    row_dict['raw_confidence'] = analysis.get('raw_confidence', row_dict['confidence'])
-                    row_dict['effective_confidence'] = analysis.get('effective_confidence', row_dict['confidence'])
-                    row_dict['uncertainty_pct'] = analysis.get('uncertainty_pct', 0)
-                    row_dict['market_regime'] = analysis.get('market_regime', row_dict.get('market_regime'))
-                    row_dict['abstain'] = analysis.get('abstain', False)
-                    row_dict['abstain_reason_codes'] = analysis.get('abstain_reason_codes', [])
-                    row_dict['position_size_pct'] = rec.get('position_size_pct', 0.0)
-                    row_dict['size_label'] = rec.get('size_label', rec.get('sizing', {}).get('label', 'STANDARD'))
-                    row_dict['action'] = rec.get('action', 'NO_BUY')
-                    row_dict['trade_quality_score'] = analysis.get('trade_quality_score', rec.get('trade_quality_score', row_dict['rank_score']))
-                    row_dict['opportunity_score'] = rec.get('opportunity_score', analysis.get('opportunity_score', row_dict['rank_score']))
-                    row_dict['calibrated_confidence'] = rec.get('calibrated_confidence', analysis.get('calibrated_confidence'))
-                    row_dict['downside_risk'] = rec.get('downside_risk', analysis.get('downside_risk'))
-                    row_dict['strategy_family'] = rec.get('strategy_family', analysis.get('strategy_family', 'canslim'))
-                    row_dict['v2_action_label'] = rec.get('v2_action_label', analysis.get('v2_action_label'))
-                    row_dict['adverse_regime_score'] = analysis.get('adverse_regime', {}).get('score', 0.0)
-                    row_dict['adverse_regime_label'] = analysis.get('adverse_regime', {}).get('label', 'normal')
-                    enriched.append(row_dict)
+                    enrichments.append(
+                        self._scan_enrichment_fields(analysis, self._candidate_context_by_symbol[symbol])
+                    )
+                    kept_positions.append(position)
 
                 except Exception as e:
                     print(f"   ⚠️ Error enriching {symbol}: {e}")
@@ -1891,10 +1981,17 @@ class TradingAdvisor:
         finally:
             self._candidate_context_by_symbol = previous_context
 
-        if not enriched:
+        if not enrichments:
             return results
 
-        enriched_df = pd.DataFrame(enriched)
+        # Assign each enrichment field as a whole column on the surviving
+        # rows rather than rebuilding the frame from per-row dicts.
+        enriched_df = top.iloc[kept_positions].reset_index(drop=True)
+        for column in enrichments[0]:
+            enriched_df[column] = pd.Series(
+                [fields[column] for fields in enrichments],
+                index=enriched_df.index,
+            )
         enriched_df = self._apply_strategy_family_budgets(enriched_df)
         enriched_df = self._sort_runtime_candidates(
             enriched_df,
@@ -1939,18 +2036,16 @@ class TradingAdvisor:
         market = self.get_market_status(refresh=True)
         enriched = []
         previous_context = dict(self._candidate_context_by_symbol)
-        top_results = results.head(limit).copy()
-        self._candidate_context_by_symbol = {
-            row['symbol']: row.to_dict()
-            for _, row in top_results.iterrows()
-        }
+        top_results = results.head(limit)
+        top_symbols = top_results['symbol'].tolist()
+        top_rows = top_results.to_dict('records')
+        self._candidate_context_by_symbol = dict(zip(top_symbols, top_rows))
         emit_progress(
             f"Nightly discovery progress: enriching top {len(top_results)} candidates"
         )
 
         try:
-            for idx, (_, row) in enumerate(top_results.iterrows(), start=1):
-                symbol = row['symbol']
+            for idx, (symbol, row) in enumerate(zip(top_symbols, top_rows), start=1):
                 emit_progress(
                     f"Nightly discovery progress: enriching {idx}/{len(top_results)} {symbol}"
                 )
@@ -1964,7 +2059,7 @@ class TradingAdvisor:
                         continue
 
                     rec = analysis.get('recommendation', {})
-                    row_dict = row.to_dict()
+                    row_dict = dict(row)
                     row_dict['market_regime'] = getattr(getattr(market, 'regime', None), 'value', 'unknown')
                     row_dict['total_score'] = analysis.get('total_score', 0)
                     row_dict['rank_score'] = analysis.get('rank_score', analysis.get('total_score', 0))
@@ -2083,51 +2178,62 @@ class TradingAdvisor:
             buy_rows = buy_rows.sort_values(sort_columns, ascending=ascending, kind='mergesort')
 
         buy_symbols = buy_rows['symbol'].head(limit).tolist()
+        if not buy_symbols:
+            return []
 
-        recommendations = []
-
-        for symbol in buy_symbols:
-            analysis = self.analyze_stock(symbol)
-
-            if analysis.get('recommendation', {}).get('action') == 'BUY':
-                recommendations.append(analysis)
+        # Re-analysis is mostly network (history refresh, sentiment), so run
+        # the symbols side by side, quietly so their output can't interleave.
+        # map() keeps results in buy-rank order.
+        with ThreadPoolExecutor(max_workers=len(buy_symbols)) as executor:
+            analyses = list(executor.map(lambda symbol: self.analyze_stock(symbol, quiet=True), buy_symbols))
 
-        return recommendations
+        return [
+            analysis
+            for analysis in analyses
+            if analysis.get('recommendation', {}).get('action') == 'BUY'
+        ]
     
-    def print_recommendations(self, recommendations: List[Dict]):
-        """Print recommendations in a nice format."""
+    def print_recommendations(self, recommendations: List[Dict], file: Optional[TextIO] = None):
+        """Print recommendations in a nice format.
+
+        The report is assembled in one buffer and written in a single call,
+        to ``file`` if given (defaults to stdout).
+        """
+        out = file if file is not None else sys.stdout
         if not recommendations:
-            print("\n📭 No buy recommendations at this time.")
+            out.write("\n📭 No buy recommendations at this time.\n")
             return
         
-        print("\n" + "="*70)
-        print("📈 TRADE RECOMMENDATIONS")
-        print("="*70)
+        rule = "=" * 70
+        buf = io.StringIO()
+        write = buf.write
+        write(f"\n{rule}\n📈 TRADE RECOMMENDATIONS\n{rule}\n")
         
         for i, rec in enumerate(recommendations, 1):
             symbol = rec['symbol']
             r = rec['recommendation']
             
-            print(f"""
-{'─'*70}
-#{i} {symbol} — SCORE: {rec['total_score']}/12
-
-  Action: {r['action']}
-  Entry:  ${r['entry']:.2f}
-  Stop:   ${r['stop_loss']:.2f} ({r['stop_loss_pct']:.0f}% risk)
-  Size:   {r['position_size_pct']:.0f}% of portfolio
-  Conf:   {r.get('confidence', 0)}%
-  Wave2:  Breakout {r.get('breakout_score', 0)}/5 | Sentiment {r.get('sentiment_score', 0):+d} | Exit risk {r.get('exit_risk_score', 0)}/5
-
-  Reasons:
-{chr(10).join('    ' + reason for reason in r['reasons'])}
-
-  Market: {r['market_note']}
-""")
+            write(f"\n{'─'*70}\n")
+            write(f"#{i} {symbol} — SCORE: {rec['total_score']}/12\n\n")
+            write(f"  Action: {r['action']}\n")
+            write(f"  Entry:  ${r['entry']:.2f}\n")
+            write(f"  Stop:   ${r['stop_loss']:.2f} ({r['stop_loss_pct']:.0f}% risk)\n")
+            write(f"  Size:   {r['position_size_pct']:.0f}% of portfolio\n")
+            write(f"  Conf:   {r.get('confidence', 0)}%\n")
+            write(
+                f"  Wave2:  Breakout {r.get('breakout_score', 0)}/5 | "
+                f"Sentiment {r.get('sentiment_score', 0):+d} | "
+                f"Exit risk {r.get('exit_risk_score', 0)}/5\n\n"
+            )
+            write("  Reasons:\n")
+            for reason in r['reasons']:
+                write(f"    {reason}\n")
+            if not r['reasons']:
+                write("\n")
+            write(f"\n  Market: {r['market_note']}\n\n")
         
-        print("="*70)
-        print("⚠️  These are recommendations only. Execute at your own discretion.")
-        print("="*70)
+        write(f"{rule}\n⚠️  These are recommendations only. Execute at your own discretion.\n{rule}\n")
+        out.write(buf.getvalue())
 
 
 def main():
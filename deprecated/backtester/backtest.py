@@ -43,15 +43,41 @@ SIGNALS:
 =============================================================================
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Optional, List, Dict, Tuple
-from dataclasses import dataclass
+from typing import Dict, Optional, List
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 
 from strategies.base import Strategy
+from indicators import compute_suite, merge_indicator_specs
 from metrics import calculate_metrics, BacktestMetrics, quick_summary
-from outcomes import annotate_trade_outcomes, label_trade_outcome
+from numba_compat import njit
+from outcomes import label_trade_outcome
+
+
+# Exit reasons, indexed by the int8 codes the simulation kernel emits
+EXIT_REASONS = ('signal', 'stop_loss', 'end_of_data')
+_EXIT_SIGNAL, _EXIT_STOP_LOSS, _EXIT_END_OF_DATA = 0, 1, 2
+
+# Compact per-trade record: one contiguous buffer per run instead of a
+# Python object per trade. Dates are stored as bar positions into the
+# price data's index; reason indexes EXIT_REASONS.
+TRADE_DTYPE = np.dtype([
+    ('entry_idx', 'i4'),
+    ('exit_idx', 'i4'),
+    ('entry_price', 'f8'),
+    ('exit_price', 'f8'),
+    ('shares', 'i8'),
+    ('pnl', 'f8'),
+    ('pnl_pct', 'f8'),
+    ('reason', 'i1'),
+])
 
 
 @dataclass
@@ -74,6 +100,213 @@ class Trade:
     outcome_bucket: str
 
 
+@njit(nogil=True, cache=True)
+def _simulate(
+    closes: np.ndarray,
+    sigs: np.ndarray,
+    initial_cash: float,
+    slippage: float,
+    commission: float,
+    stop_factor: float,
+    use_stop: bool,
+):
+    """
+    Day-by-day trading simulation over raw arrays.
+    
+    This is the whole state machine from Backtester.run: trailing
+    stop-loss first, then BUY/SELL signals, then mark equity to the
+    close. Any position still open on the last bar is closed there.
+    
+    Only numbers go in and out so Numba can compile (and cache) it when
+    installed. use_stop is a plain runtime flag, one predictable branch per
+    bar. The trailing stop fires when the close falls to or below
+    highest_price * stop_factor, where stop_factor = 1 - stop_loss_pct.
+    
+    Returns:
+        (equity, entry_idx, exit_idx, entry_px, exit_px, shares,
+         reason_code, final_cash) where the per-trade arrays hold one
+        entry per completed round-trip and reason_code indexes
+        EXIT_REASONS.
+    """
+    n = closes.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    
+    # A round-trip spans at least two bars (except a final-bar entry
+    # closed at end of data), so this bounds the number of trades.
+    max_trades = n // 2 + 1
+    entry_idx = np.empty(max_trades, dtype=np.int64)
+    exit_idx = np.empty(max_trades, dtype=np.int64)
+    entry_px = np.empty(max_trades, dtype=np.float64)
+    exit_px = np.empty(max_trades, dtype=np.float64)
+    shares_out = np.empty(max_trades, dtype=np.int64)
+    reason_code = np.empty(max_trades, dtype=np.int8)
+    n_trades = 0
+    
+    cash = initial_cash
+    position = 0
+    entry_price = 0.0
+    entry_i = -1
+    highest_price = 0.0
+    
+    for i in range(n):
+        signal = sigs[i]
+        current_price = closes[i]
+        
+        # ----- CHECK STOP LOSS -----
+        if use_stop and position > 0:
+            # Track highest price for trailing stop-loss. A plain
+            # compare keeps the max() semantics (a NaN close never
+            # replaces the high) and compiles to a single maxsd.
+            if current_price > highest_price:
+                highest_price = current_price
+            
+            if current_price <= highest_price * stop_factor:
+                # Stop-loss triggered! Exit position and don't
+                # process other signals this day
+                fill_price = current_price * (1 - slippage)
+                cash += position * fill_price
+                cash -= commission
+                entry_idx[n_trades] = entry_i
+                exit_idx[n_trades] = i
+                entry_px[n_trades] = entry_price
+                exit_px[n_trades] = fill_price
+                shares_out[n_trades] = position
+                reason_code[n_trades] = _EXIT_STOP_LOSS
+                n_trades += 1
+                position = 0
+                equity[i] = cash
+                continue
+        
+        # ----- PROCESS SIGNALS -----
+        if signal == 1 and position == 0:
+            # BUY signal and we're not already in a position.
+            # Slippage means we pay slightly more than the "price".
+            fill_price = current_price * (1 + slippage)
+            # Whole shares we can afford: floor once, clamp "can't
+            # afford any" to zero and only then branch on the result.
+            shares = max(int(np.floor((cash - commission) / fill_price)), 0)
+            if shares > 0:
+                cash -= shares * fill_price
+                cash -= commission
+                position = shares
+                entry_price = fill_price
+                entry_i = i
+                highest_price = current_price  # Start tracking for trailing stop
+        
+        elif signal == -1 and position > 0:
+            # SELL signal and we have a position.
+            # Slippage means we receive slightly less than the "price".
+            fill_price = current_price * (1 - slippage)
+            cash += position * fill_price
+            cash -= commission
+            entry_idx[n_trades] = entry_i
+            exit_idx[n_trades] = i
+            entry_px[n_trades] = entry_price
+            exit_px[n_trades] = fill_price
+            shares_out[n_trades] = position
+            reason_code[n_trades] = _EXIT_SIGNAL
+            n_trades += 1
+            position = 0
+        
+        # Record portfolio value for this day: cash + shares × price
+        equity[i] = cash + position * current_price
+    
+    # Close any open position at end of data
+    if position > 0:
+        fill_price = closes[n - 1] * (1 - slippage)
+        cash += position * fill_price
+        cash -= commission
+        entry_idx[n_trades] = entry_i
+        exit_idx[n_trades] = n - 1
+        entry_px[n_trades] = entry_price
+        exit_px[n_trades] = fill_price
+        shares_out[n_trades] = position
+        reason_code[n_trades] = _EXIT_END_OF_DATA
+        n_trades += 1
+    
+    return (
+        equity,
+        entry_idx[:n_trades],
+        exit_idx[:n_trades],
+        entry_px[:n_trades],
+        exit_px[:n_trades],
+        shares_out[:n_trades],
+        reason_code[:n_trades],
+        cash,
+    )
+
+
+def _trade_records(
+    entry_idx: np.ndarray,
+    exit_idx: np.ndarray,
+    entry_px: np.ndarray,
+    exit_px: np.ndarray,
+    shares: np.ndarray,
+    reason_codes: np.ndarray,
+) -> np.ndarray:
+    """
+    Pack the kernel's per-trade arrays into one TRADE_DTYPE array.
+    
+    Prices are the slippage-adjusted fills, so P&L reflects what we
+    actually paid and received.
+    """
+    records = np.empty(len(entry_idx), dtype=TRADE_DTYPE)
+    records['entry_idx'] = entry_idx
+    records['exit_idx'] = exit_idx
+    records['entry_price'] = entry_px
+    records['exit_price'] = exit_px
+    records['shares'] = shares
+    records['pnl'] = (exit_px - entry_px) * shares
+    records['pnl_pct'] = ((exit_px / entry_px) - 1) * 100
+    records['reason'] = reason_codes
+    return records
+
+
+def _build_trades_frame(dates: pd.DatetimeIndex, records: np.ndarray) -> pd.DataFrame:
+    """
+    Build the trades table column by column from TRADE_DTYPE records.
+    
+    Columns follow the Trade field order and add what the records
+    leave out: calendar dates, business-day holding period and the
+    outcome label.
+    """
+    if len(records) == 0:
+        return pd.DataFrame()
+    
+    entry_dates = pd.DatetimeIndex(dates[records['entry_idx']])
+    exit_dates = pd.DatetimeIndex(dates[records['exit_idx']])
+    pnl_pct = records['pnl_pct']
+    holding_days = np.maximum(
+        np.busday_count(_calendar_days(entry_dates), _calendar_days(exit_dates)), 0
+    )
+    reasons = [EXIT_REASONS[code] for code in records['reason']]
+    outcomes = [
+        label_trade_outcome(pct, reason, days)
+        for pct, reason, days in zip(pnl_pct.tolist(), reasons, holding_days.tolist())
+    ]
+    
+    return pd.DataFrame({
+        'entry_date': entry_dates,
+        'exit_date': exit_dates,
+        'entry_price': records['entry_price'],
+        'exit_price': records['exit_price'],
+        'shares': records['shares'],
+        'pnl': records['pnl'],
+        'pnl_pct': pnl_pct,
+        'exit_reason': reasons,
+        'holding_days': holding_days,
+        'outcome_label': [o.label for o in outcomes],
+        'outcome_bucket': [o.bucket for o in outcomes],
+    })
+
+
+def _calendar_days(index: pd.DatetimeIndex) -> np.ndarray:
+    """Local calendar dates as datetime64[D] (for np.busday_count)."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype('datetime64[D]')
+
+
 class Backtester:
     """
     The main backtesting engine.
@@ -108,19 +341,15 @@ class Backtester:
         
         # These get set during run()
         self.cash = initial_cash
-        self.position = 0           # Number of shares held
-        self.entry_price = 0.0      # Price we bought at
-        self.entry_date = None      # When we bought
-        self.highest_price = 0.0    # For trailing stop-loss
-        
-        self.trades: List[Trade] = []
-        self.equity_curve: List[Tuple[datetime, float]] = []
+        self.trade_records = np.empty(0, dtype=TRADE_DTYPE)
+        self.equity_curve: Optional[pd.Series] = None
     
     def run(
         self,
         strategy: Strategy,
         data: pd.DataFrame,
         benchmark: Optional[pd.DataFrame] = None,
+        indicators: Optional[Dict] = None,
     ) -> 'BacktestResult':
         """
         Run the backtest.
@@ -134,6 +363,8 @@ class Backtester:
             strategy: The trading strategy to test
             data: Price data with columns: open, high, low, close, volume
             benchmark: Optional benchmark data for comparison (e.g., SPY)
+            indicators: Optional precomputed compute_suite() results, passed
+                to strategies that declare required_indicators()
         
         Returns:
             BacktestResult with equity curve, trades, and metrics
@@ -145,86 +376,79 @@ class Backtester:
         # STEP 1: Generate signals
         # =================================================================
         # Ask the strategy what to do on each day
-        signals = strategy.generate_signals(data)
+        if indicators is not None and strategy.required_indicators():
+            signals = strategy.generate_signals(data, indicators=indicators)
+        else:
+            signals = strategy.generate_signals(data)
         
         # =================================================================
         # STEP 2: Simulate trading day by day
         # =================================================================
-        for i, (date, row) in enumerate(data.iterrows()):
-            signal = signals.iloc[i]
-            current_price = row['close']
-            
-            # Track highest price for trailing stop-loss
-            if self.position > 0:
-                self.highest_price = max(self.highest_price, current_price)
-            
-            # ----- CHECK STOP LOSS -----
-            if self.position > 0 and strategy.should_use_stop_loss():
-                stop_price = self.highest_price * (1 - strategy.stop_loss_pct())
-                
-                if current_price <= stop_price:
-                    # Stop-loss triggered! Exit position
-                    self._sell(date, current_price, reason='stop_loss')
-                    # Don't process other signals this day
-                    self._record_equity(date, current_price)
-                    continue
-            
-            # ----- PROCESS SIGNALS -----
-            if signal == 1 and self.position == 0:
-                # BUY signal and we're not already in a position
-                self._buy(date, current_price)
-            
-            elif signal == -1 and self.position > 0:
-                # SELL signal and we have a position
-                self._sell(date, current_price, reason='signal')
-            
-            # Record portfolio value for this day
-            self._record_equity(date, current_price)
+        # Pull the columns out as plain arrays once and hand them to the
+        # simulation kernel. Strategy settings are resolved up front so
+        # the kernel only ever sees numbers (and can be JIT-compiled).
+        closes = data['close'].to_numpy(dtype=np.float64)
+        # Signals are only ever -1/0/1, so keep them as int8.
+        sigs = Strategy.signals_to_raw(signals)
+        dates = data.index
+        
+        # Stop-loss settings are constant for the whole run: ask once.
+        use_stop = bool(strategy.should_use_stop_loss())
+        stop_pct = float(strategy.stop_loss_pct()) if use_stop else 0.0
+        one_minus_stop = 1.0 - stop_pct
+        
+        (
+            equity,
+            entry_idx,
+            exit_idx,
+            entry_px,
+            exit_px,
+            shares,
+            reason_codes,
+            self.cash,
+        ) = _simulate(
+            closes,
+            sigs,
+            float(self.initial_cash),
+            float(self.slippage),
+            float(self.commission),
+            one_minus_stop,
+            use_stop,
+        )
         
         # =================================================================
-        # STEP 3: Close any open position at end of data
+        # STEP 3: Turn the raw fills into trade records
         # =================================================================
-        if self.position > 0:
-            final_price = data['close'].iloc[-1]
-            final_date = data.index[-1]
-            self._sell(final_date, final_price, reason='end_of_data')
+        # Trades stay in one structured array; Trade objects are only
+        # built if someone asks for BacktestResult.trades.
+        self.trade_records = _trade_records(
+            entry_idx, exit_idx, entry_px, exit_px, shares, reason_codes
+        )
+        trades_df = _build_trades_frame(dates, self.trade_records)
         
         # =================================================================
         # STEP 4: Calculate metrics
         # =================================================================
-        # Convert equity curve to Series
-        equity_df = pd.DataFrame(self.equity_curve, columns=['date', 'equity'])
-        equity_df.set_index('date', inplace=True)
-        equity_series = equity_df['equity']
-        
-        # Convert trades to DataFrame
-        if self.trades:
-            trades_df = pd.DataFrame([
-                {
-                    'entry_date': t.entry_date,
-                    'exit_date': t.exit_date,
-                    'entry_price': t.entry_price,
-                    'exit_price': t.exit_price,
-                    'shares': t.shares,
-                    'pnl': t.pnl,
-                    'pnl_pct': t.pnl_pct,
-                    'exit_reason': t.exit_reason,
-                    'holding_days': t.holding_days,
-                    'outcome_label': t.outcome_label,
-                    'outcome_bucket': t.outcome_bucket,
-                }
-                for t in self.trades
-            ])
-            trades_df = annotate_trade_outcomes(trades_df)
-        else:
-            trades_df = pd.DataFrame()
+        # Wrap the kernel's preallocated equity buffer as a Series. The
+        # buffer is ours alone, so skip the defensive copy pandas would
+        # otherwise make (one float64 array for the whole run).
+        equity_series = pd.Series(equity, index=dates.rename('date'), name='equity', copy=False)
+        self.equity_curve = equity_series
         
         # Calculate benchmark curve if provided
         benchmark_curve = None
         if benchmark is not None:
-            # Scale benchmark to same starting value
-            benchmark_curve = benchmark['close'] / benchmark['close'].iloc[0] * self.initial_cash
-            benchmark_curve = benchmark_curve.loc[equity_series.index[0]:equity_series.index[-1]]
+            # Scale benchmark to same starting value, keeping only the bars
+            # inside the backtest window. The window is found with a binary
+            # search on the (sorted) index and sliced positionally.
+            bench_close = benchmark['close'].to_numpy(dtype=np.float64)
+            start_i = benchmark.index.searchsorted(dates[0], side='left')
+            end_i = benchmark.index.searchsorted(dates[-1], side='right')
+            benchmark_curve = pd.Series(
+                bench_close[start_i:end_i] / bench_close[0] * self.initial_cash,
+                index=benchmark.index[start_i:end_i],
+                name='close',
+            )
         
         # Calculate all metrics
         metrics = calculate_metrics(equity_series, trades_df, benchmark_curve)
@@ -232,98 +456,17 @@ class Backtester:
         return BacktestResult(
             strategy=strategy,
             equity_curve=equity_series,
-            trades=self.trades,
+            trade_records=self.trade_records,
             metrics=metrics,
             signals=signals,
+            trades_frame=trades_df,
         )
     
     def _reset(self):
         """Reset all state for a fresh backtest run."""
         self.cash = self.initial_cash
-        self.position = 0
-        self.entry_price = 0.0
-        self.entry_date = None
-        self.highest_price = 0.0
-        self.trades = []
-        self.equity_curve = []
-    
-    def _buy(self, date: datetime, price: float):
-        """
-        Execute a buy order.
-        
-        Uses all available cash to buy as many shares as possible.
-        Includes slippage (slightly worse fill price).
-        """
-        # Apply slippage (we pay slightly more than the "price")
-        fill_price = price * (1 + self.slippage)
-        
-        # Calculate how many shares we can buy
-        available = self.cash - self.commission
-        shares = int(available / fill_price)
-        
-        if shares <= 0:
-            return  # Can't afford any shares
-        
-        # Execute the buy
-        cost = shares * fill_price + self.commission
-        self.cash -= cost
-        self.position = shares
-        self.entry_price = fill_price
-        self.entry_date = date
-        self.highest_price = price  # Start tracking for trailing stop
-    
-    def _sell(self, date: datetime, price: float, reason: str):
-        """
-        Execute a sell order and record the trade.
-        
-        Includes slippage (slightly worse fill price).
-        """
-        if self.position <= 0:
-            return
-        
-        # Apply slippage (we receive slightly less than the "price")
-        fill_price = price * (1 - self.slippage)
-        
-        # Execute the sell
-        proceeds = self.position * fill_price - self.commission
-        self.cash += proceeds
-        
-        # Calculate profit/loss
-        pnl = (fill_price - self.entry_price) * self.position
-        pnl_pct = ((fill_price / self.entry_price) - 1) * 100
-        holding_days = max(int(np.busday_count(self.entry_date.date(), date.date())), 0)
-        outcome = label_trade_outcome(pnl_pct, reason, holding_days)
-
-        # Record the completed trade
-        trade = Trade(
-            entry_date=self.entry_date,
-            exit_date=date,
-            entry_price=self.entry_price,
-            exit_price=fill_price,
-            shares=self.position,
-            pnl=pnl,
-            pnl_pct=pnl_pct,
-            exit_reason=reason,
-            holding_days=holding_days,
-            outcome_label=outcome.label,
-            outcome_bucket=outcome.bucket,
-        )
-        self.trades.append(trade)
-        
-        # Clear position
-        self.position = 0
-        self.entry_price = 0.0
-        self.entry_date = None
-        self.highest_price = 0.0
-    
-    def _record_equity(self, date: datetime, current_price: float):
-        """
-        Record the portfolio value for this day.
-        
-        Equity = cash + (shares × current price)
-        """
-        equity = self.cash + (self.position * current_price)
-        self.equity_curve.append((date, equity))
+        self.trade_records = np.empty(0, dtype=TRADE_DTYPE)
+        self.equity_curve = None
 
 
 @dataclass
@@ -335,9 +478,15 @@ class BacktestResult:
     """
     strategy: Strategy
     equity_curve: pd.Series
-    trades: List[Trade]
+    trade_records: np.ndarray       # TRADE_DTYPE, one row per trade
     metrics: BacktestMetrics
     signals: pd.Series
+    trades_frame: pd.DataFrame = field(default_factory=pd.DataFrame, repr=False)
+    
+    @cached_property
+    def trades(self) -> List[Trade]:
+        """Completed trades as Trade records (built on first access)."""
+        return [Trade(*row) for row in self.trades_frame.itertuples(index=False, name=None)]
     
     def print_trades(self, limit: int = 10):
         """Print a summary of trades."""
@@ -380,12 +529,32 @@ def compare_strategies(
     Returns:
         DataFrame comparing key metrics for each strategy
     """
-    results = []
+    if not strategies:
+        return pd.DataFrame()
     
-    for strategy in strategies:
-        backtester = Backtester(initial_cash=initial_cash)
-        result = backtester.run(strategy, data)
-        
+    # Each backtest is independent and spends most of its time in
+    # NumPy/pandas and the nogil JIT kernel, which release the GIL, so the
+    # strategies run side by side. Backtester keeps per-run state, so each
+    # worker thread gets its own instance and reuses it (run() resets it).
+    local = threading.local()
+    
+    # Indicators the strategies share (e.g. the same RSI or trend SMA) are
+    # computed once over the closes, and each strategy reads its own columns.
+    spec = merge_indicator_specs(strategy.required_indicators() for strategy in strategies)
+    indicators = compute_suite(data['close'], spec) if spec else None
+    
+    def _run(strategy: Strategy) -> 'BacktestResult':
+        backtester = getattr(local, 'backtester', None)
+        if backtester is None:
+            backtester = local.backtester = Backtester(initial_cash=initial_cash)
+        return backtester.run(strategy, data, indicators=indicators)
+    
+    max_workers = min(len(strategies), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        runs = list(executor.map(_run, strategies))
+    
+    results = []
+    for strategy, result in zip(strategies, runs):
         results.append({
             'Strategy': strategy.name,
             'Return (%)': result.metrics.total_return,
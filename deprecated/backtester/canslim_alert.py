@@ -12,6 +12,7 @@ from pathlib import Path
 import sys
 import time
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -39,6 +40,7 @@ from strategy_alert_pipeline import (
     append_pipeline_contract_signals as _append_pipeline_contract_signals,
     append_pipeline_contract_summary as _append_pipeline_contract_summary,
     dedupe_reason as _dedupe_reason,
+    get_alert_market_status as _get_alert_market_status,
     market_degraded_warning_line as _market_degraded_warning_line,
     market_recovery_line as _market_recovery_line,
     apply_buy_readiness,
@@ -478,10 +480,24 @@ def _execution_quality_line(overlay: dict) -> str:
 
 def _analyze_for_alert(advisor: TradingAdvisor, symbol: str) -> dict:
     try:
-        return _run_quiet(advisor.analyze_stock, symbol, False, "bulk_scan")
+        return advisor.analyze_stock(symbol, False, "bulk_scan")
     except TypeError:
         # Test doubles and older signatures may not accept analysis_profile yet.
-        return _run_quiet(advisor.analyze_stock, symbol)
+        return advisor.analyze_stock(symbol)
+
+
+def _analyze_symbols_for_alert(advisor: TradingAdvisor, symbols: list[str]) -> list[dict]:
+    """Analyze symbols concurrently, returning results in input order.
+
+    Each analysis is mostly waiting on market-data/fundamentals/sentiment I/O.
+    The caller silences output around the whole pool: redirect_stdout swaps the
+    process-wide sys.stdout, so it can't be applied per worker thread.
+    """
+    if not symbols:
+        return []
+    max_workers = int(os.getenv("TRADING_ALERT_ANALYSIS_CONCURRENCY", "8") or 8)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as pool:
+        return list(pool.map(lambda symbol: _analyze_for_alert(advisor, symbol), symbols))
 
 
 def _format_timing_line(phase_timings: dict[str, float], nested_timings: dict[str, float]) -> str:
@@ -702,7 +718,7 @@ def build_alert_payload(
 
     start = time.perf_counter()
     advisor = TradingAdvisor()
-    market = _run_quiet(advisor.get_market_status, True)
+    market = _get_alert_market_status(advisor)
     phase_timings["market"] = time.perf_counter() - start
     save_market_data_freshness_lane(market, generated_at=generated_at)
 
@@ -833,8 +849,8 @@ def build_alert_payload(
     max_input_staleness = 0.0
 
     analyze_start = time.perf_counter()
-    for symbol in symbols:
-        analysis = _analyze_for_alert(advisor, symbol)
+    analyses = _run_quiet(_analyze_symbols_for_alert, advisor, symbols)
+    for symbol, analysis in zip(symbols, analyses):
         if analysis.get("error"):
             analysis_error_count += 1
             continue
@@ -945,9 +961,10 @@ def build_alert_payload(
     save_buy_readiness_summary(readiness_summary)
     _persist_predictions(market=market, records=candidates)
 
-    buy_count = sum(1 for c in candidates if c["action"] == "BUY")
-    watch_count = sum(1 for c in candidates if c["action"] == "WATCH")
-    no_buy_count = sum(1 for c in candidates if c["action"] == "NO_BUY")
+    action_counts = Counter(c["action"] for c in candidates)
+    buy_count = action_counts["BUY"]
+    watch_count = action_counts["WATCH"]
+    no_buy_count = action_counts["NO_BUY"]
 
     posture_line = describe_alert_posture(market_regime=regime_value, buy_count=buy_count, watch_count=watch_count)
     if posture_line:
@@ -972,10 +989,10 @@ def build_alert_payload(
         lines.append(f"Why no buys: {why}")
     elif candidates:
         _append_pipeline_contract_signals(lines, candidates)
-        preview = []
-        for c in candidates[: min(limit, 3)]:
-            preview.append(f"{c['symbol']} {c['action']} ({c['score']}/12)")
-        lines.append("Leaders: " + " | ".join(preview))
+        lines.append(
+            "Leaders: "
+            + " | ".join(f"{c['symbol']} {c['action']} ({c['score']}/12)" for c in candidates[: min(limit, 3)])
+        )
         review_pool = candidates[: min(limit, max(review_detail_limit, 5))]
         lines.extend(render_decision_review(review_pool, detail_limit=review_detail_limit))
 
@@ -5,9 +5,11 @@ Loads API keys and settings from files/environment.
 Keeps sensitive data separate from code.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
+from typing import Optional
 
 
 # =============================================================================
@@ -54,21 +56,39 @@ def load_alpaca_keys() -> dict:
     return keys
 
 
-# Load keys at module import time (so other modules can use them)
-# Wrapped in try/except so the module can still be imported for testing
-try:
-    ALPACA_KEYS = load_alpaca_keys()
-    ALPACA_KEY_ID = ALPACA_KEYS["key_id"]
-    ALPACA_SECRET_KEY = ALPACA_KEYS["secret_key"]
-    ALPACA_BASE_URL = ALPACA_KEYS["base_url"]
-    ALPACA_DATA_URL = ALPACA_KEYS.get("data_url", "https://data.alpaca.markets")
-except FileNotFoundError:
-    # Keys not found - will fail when actually trying to use them
-    ALPACA_KEYS = None
-    ALPACA_KEY_ID = None
-    ALPACA_SECRET_KEY = None
-    ALPACA_BASE_URL = None
-    ALPACA_DATA_URL = None
+@functools.lru_cache(maxsize=1)
+def get_alpaca_keys() -> Optional[dict]:
+    """
+    Load the Alpaca keys once, on first use.
+    
+    Returns None when the keys file doesn't exist, so the module can
+    still be imported (and tested) without credentials. Callers then
+    fail when they actually try to talk to Alpaca.
+    """
+    try:
+        return load_alpaca_keys()
+    except FileNotFoundError:
+        return None
+
+
+# Credential constants, resolved lazily (see __getattr__ below) so that
+# importing config doesn't read the keys file until someone needs it.
+_LAZY_ALPACA_SETTINGS = {
+    "ALPACA_KEY_ID": lambda keys: keys["key_id"],
+    "ALPACA_SECRET_KEY": lambda keys: keys["secret_key"],
+    "ALPACA_BASE_URL": lambda keys: keys["base_url"],
+    "ALPACA_DATA_URL": lambda keys: keys.get("data_url", "https://data.alpaca.markets"),
+}
+
+
+def __getattr__(name: str):
+    """Resolve ALPACA_KEYS / ALPACA_* on first access (PEP 562)."""
+    if name == "ALPACA_KEYS":
+        return get_alpaca_keys()
+    if name in _LAZY_ALPACA_SETTINGS:
+        keys = get_alpaca_keys()
+        return _LAZY_ALPACA_SETTINGS[name](keys) if keys is not None else None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -104,9 +124,10 @@ if __name__ == "__main__":
     print(f"Services directory: {SERVICES_DIR}")
     print(f"Alpaca keys file: {ALPACA_KEYS_FILE}")
     
-    if ALPACA_KEYS:
-        print(f"Alpaca environment: {ALPACA_KEYS.get('environment', 'unknown')}")
-        print(f"Alpaca base URL: {ALPACA_BASE_URL}")
+    keys = get_alpaca_keys()
+    if keys:
+        print(f"Alpaca environment: {keys.get('environment', 'unknown')}")
+        print(f"Alpaca base URL: {keys['base_url']}")
         print("✅ Configuration loaded successfully!")
     else:
         print("❌ Alpaca keys not loaded")
@@ -8,22 +8,129 @@ Alpaca provides free historical data for stocks, which makes it perfect
 for backtesting before trading with real money.
 """
 
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, List
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 
 # Import our configuration
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from config import (
-    ALPACA_KEY_ID, 
-    ALPACA_SECRET_KEY, 
-    ALPACA_DATA_URL,
-    DEFAULT_TIMEFRAME,
-    DEFAULT_LOOKBACK_YEARS
-)
+import config
+import json_compat
+from config import DEFAULT_TIMEFRAME, DEFAULT_LOOKBACK_YEARS
+
+try:
+    import pyarrow  # noqa: F401  (only needed for the Parquet cache)
+except ImportError:  # pragma: no cover - optional dependency
+    PARQUET_AVAILABLE = False
+else:
+    PARQUET_AVAILABLE = True
+
+
+# =============================================================================
+# SHARED HTTP SESSION
+# =============================================================================
+# Every request goes to the same Alpaca host. Reusing one Session keeps the
+# TCP/TLS connection alive between symbols instead of handshaking each time.
+
+HTTP_POOL_SIZE = 20
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _new_session(headers: Optional[dict] = None) -> requests.Session:
+    """Create a Session with a connection pool big enough for parallel fetches."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Return the module-wide Session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _new_session()
+    return _session
+
+
+# =============================================================================
+# PARSING ALPACA BARS
+# =============================================================================
+
+def _fetch_all_bars(
+    session: requests.Session,
+    url: str,
+    params: dict,
+    headers: Optional[dict] = None
+) -> List[dict]:
+    """
+    Request bars, following Alpaca's next_page_token until it runs out.
+    
+    A single response holds at most `limit` bars (10,000), which a
+    3-year daily window never reaches but a multi-year intraday window
+    does. Each page's token comes from the previous page, so pages are
+    fetched one after another on the same keep-alive connection.
+    
+    Returns:
+        All bar records, in order
+    """
+    bars: List[dict] = []
+    page_params = dict(params)
+    while True:
+        response = session.get(url, headers=headers, params=page_params)
+        
+        # Check for errors
+        if response.status_code != 200:
+            raise Exception(f"API Error {response.status_code}: {response.text}")
+        
+        # Decode the raw body ourselves: orjson (when installed) is several
+        # times faster than requests' stdlib-based .json() on big pages.
+        data = json_compat.loads(response.content)
+        bars.extend(data.get("bars") or [])
+        
+        token = data.get("next_page_token")
+        if not token:
+            return bars
+        page_params["page_token"] = token
+
+
+def _bars_to_frame(bars: List[dict]) -> pd.DataFrame:
+    """
+    Turn Alpaca's bar records into an OHLCV DataFrame.
+    
+    Alpaca sends each bar as {t, o, h, l, c, v, n, vw}. We only keep
+    timestamp + OHLCV, so the columns are pulled straight out of the
+    JSON into arrays instead of building a full DataFrame (including
+    the unused trade-count and VWAP columns) and then renaming and
+    dropping.
+    
+    Returns:
+        DataFrame with columns open, high, low, close, volume and a
+        datetime index named "timestamp"
+    """
+    count = len(bars)
+    index = pd.DatetimeIndex(pd.to_datetime([bar['t'] for bar in bars]), name='timestamp')
+    columns = {
+        name: np.fromiter((bar[key] for bar in bars), dtype=np.float64, count=count)
+        for name, key in (('open', 'o'), ('high', 'h'), ('low', 'l'), ('close', 'c'))
+    }
+    # Volume keeps its natural (normally integer) dtype
+    columns['volume'] = np.asarray([bar['v'] for bar in bars])
+    return pd.DataFrame(columns, index=index)
 
 
 # =============================================================================
@@ -34,18 +141,25 @@ def get_historical_data(
     symbol: str,
     start: Optional[str] = None,
     end: Optional[str] = None,
-    timeframe: str = DEFAULT_TIMEFRAME
+    timeframe: str = DEFAULT_TIMEFRAME,
+    use_cache: bool = True
 ) -> pd.DataFrame:
     """
     Fetch historical OHLCV data for a symbol from Alpaca.
     
     OHLCV = Open, High, Low, Close, Volume — the standard price data format.
     
+    Windows that end before today can't change any more, so they are
+    kept on disk (see save_data) and later requests for the exact same
+    symbol/start/end/timeframe are served from there without touching
+    the API. Windows that include today are always fetched fresh.
+    
     Args:
         symbol: Stock ticker (e.g., "AAPL", "MSFT", "SPY")
         start: Start date as string "YYYY-MM-DD" (default: 3 years ago)
         end: End date as string "YYYY-MM-DD" (default: today)
         timeframe: Bar size - "1Day", "1Hour", "1Min", etc.
+        use_cache: Read/write the on-disk cache for closed windows
     
     Returns:
         DataFrame with columns: open, high, low, close, volume
@@ -67,16 +181,25 @@ def get_historical_data(
         start_date = datetime.now() - timedelta(days=365 * DEFAULT_LOOKBACK_YEARS)
         start = start_date.strftime("%Y-%m-%d")
     
+    cache_name = _bars_cache_name(symbol, start, end, timeframe)
+    cacheable = use_cache and end < datetime.now().strftime("%Y-%m-%d")
+    if cacheable:
+        try:
+            return load_data(cache_name, BARS_CACHE_DIR)
+        except FileNotFoundError:
+            pass
+    
     print(f"📊 Fetching {symbol} data from {start} to {end}...")
     
     # Build the API request
     # Alpaca's data API endpoint for historical bars
-    url = f"{ALPACA_DATA_URL}/v2/stocks/{symbol}/bars"
+    # (credentials are read from config on first use, not at import)
+    url = f"{config.ALPACA_DATA_URL}/v2/stocks/{symbol}/bars"
     
     # Request headers with authentication
     headers = {
-        "APCA-API-KEY-ID": ALPACA_KEY_ID,
-        "APCA-API-SECRET-KEY": ALPACA_SECRET_KEY
+        "APCA-API-KEY-ID": config.ALPACA_KEY_ID,
+        "APCA-API-SECRET-KEY": config.ALPACA_SECRET_KEY
     }
     
     # Query parameters
@@ -88,46 +211,24 @@ def get_historical_data(
         "adjustment": "split"  # Adjust for stock splits
     }
     
-    # Make the request
-    response = requests.get(url, headers=headers, params=params)
-    
-    # Check for errors
-    if response.status_code != 200:
-        raise Exception(f"API Error {response.status_code}: {response.text}")
-    
-    # Parse the response
-    data = response.json()
-    bars = data.get("bars", [])
+    # Make the request(s) over the shared keep-alive session.
+    # Long intraday windows come back in several pages.
+    bars = _fetch_all_bars(_get_session(), url, params, headers=headers)
     
     if not bars:
         raise ValueError(f"No data returned for {symbol}")
     
     # Convert to DataFrame
-    df = pd.DataFrame(bars)
-    
-    # Rename columns to standard format
-    # Alpaca uses: t, o, h, l, c, v, n, vw
-    column_map = {
-        't': 'timestamp',
-        'o': 'open',
-        'h': 'high',
-        'l': 'low',
-        'c': 'close',
-        'v': 'volume',
-        'n': 'trades',      # Number of trades
-        'vw': 'vwap'        # Volume-weighted average price
-    }
-    df = df.rename(columns=column_map)
-    
-    # Convert timestamp to datetime and set as index
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df = df.set_index('timestamp')
-    
-    # Keep only the columns we need for backtesting
-    df = df[['open', 'high', 'low', 'close', 'volume']]
+    df = _bars_to_frame(bars)
     
     print(f"✅ Fetched {len(df)} bars for {symbol}")
     
+    if cacheable:
+        try:
+            save_data(df, cache_name, BARS_CACHE_DIR)
+        except OSError as e:
+            print(f"⚠️ Could not cache {symbol} bars: {e}")
+    
     return df
 
 
@@ -135,36 +236,49 @@ def get_multiple_symbols(
     symbols: List[str],
     start: Optional[str] = None,
     end: Optional[str] = None,
-    timeframe: str = DEFAULT_TIMEFRAME
+    timeframe: str = DEFAULT_TIMEFRAME,
+    max_workers: int = 8
 ) -> dict:
     """
     Fetch historical data for multiple symbols.
     
     Useful when backtesting strategies that trade multiple stocks.
     
+    Each fetch is one HTTPS round-trip that spends nearly all its time
+    waiting on the network, so up to max_workers symbols are fetched at
+    once. Total time is roughly the slowest request instead of the sum.
+    
     Args:
         symbols: List of tickers (e.g., ["AAPL", "MSFT", "GOOGL"])
         start: Start date
         end: End date
         timeframe: Bar size
+        max_workers: Maximum number of concurrent requests
     
     Returns:
-        Dictionary mapping symbol -> DataFrame
+        Dictionary mapping symbol -> DataFrame, in the order given.
+        Symbols that fail to fetch are left out.
         
     Example:
         >>> data = get_multiple_symbols(["AAPL", "MSFT"])
         >>> aapl_data = data["AAPL"]
         >>> msft_data = data["MSFT"]
     """
-    results = {}
-    
-    for symbol in symbols:
+    def fetch(symbol: str) -> Optional[pd.DataFrame]:
         try:
-            results[symbol] = get_historical_data(symbol, start, end, timeframe)
+            return get_historical_data(symbol, start, end, timeframe)
         except Exception as e:
             print(f"⚠️ Failed to fetch {symbol}: {e}")
+            return None
+    
+    if not symbols:
+        return {}
     
-    return results
+    workers = max(1, min(int(max_workers or 1), len(symbols)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(fetch, symbols))
+    
+    return {symbol: df for symbol, df in zip(symbols, frames) if df is not None}
 
 
 def get_spy_benchmark(
@@ -192,12 +306,31 @@ def get_spy_benchmark(
 # HELPER: SAVE/LOAD DATA LOCALLY
 # =============================================================================
 
+# Closed-window bar downloads, one file per (symbol, start, end, timeframe)
+BARS_CACHE_DIR = "cache/bars"
+
+
+def _bars_cache_name(symbol: str, start: str, end: str, timeframe: str) -> str:
+    """File stem for one cached bar request, e.g. "AAPL_3f2a9c0d1b7e4a65"."""
+    key = hashlib.sha1(f"{symbol}|{start}|{end}|{timeframe}|split".encode()).hexdigest()[:16]
+    return f"{symbol}_{key}"
+
+
+def _cache_path(symbol: str, directory: str, suffix: str) -> Path:
+    """Where a symbol's cached bars live for a given file format."""
+    return Path(__file__).parent / directory / f"{symbol}{suffix}"
+
+
 def save_data(df: pd.DataFrame, symbol: str, directory: str = "cache") -> str:
     """
-    Save fetched data to a CSV file for later use.
+    Save fetched data to disk for later use.
     
     Avoids hitting the API repeatedly for the same data.
     
+    Uses Parquet (zstd-compressed) when pyarrow is installed: it loads
+    much faster than CSV, is smaller on disk, and keeps dtypes and the
+    timezone-aware index intact. Without pyarrow it falls back to CSV.
+    
     Args:
         df: DataFrame to save
         symbol: Stock symbol (used in filename)
@@ -206,13 +339,14 @@ def save_data(df: pd.DataFrame, symbol: str, directory: str = "cache") -> str:
     Returns:
         Path to the saved file
     """
-    from pathlib import Path
-    
-    cache_dir = Path(__file__).parent / directory
-    cache_dir.mkdir(exist_ok=True)
-    
-    filepath = cache_dir / f"{symbol}.csv"
-    df.to_csv(filepath)
+    if PARQUET_AVAILABLE:
+        filepath = _cache_path(symbol, directory, ".parquet")
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(filepath, engine="pyarrow", compression="zstd")
+    else:
+        filepath = _cache_path(symbol, directory, ".csv")
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(filepath)
     
     print(f"💾 Saved {symbol} data to {filepath}")
     return str(filepath)
@@ -220,7 +354,10 @@ def save_data(df: pd.DataFrame, symbol: str, directory: str = "cache") -> str:
 
 def load_data(symbol: str, directory: str = "cache") -> pd.DataFrame:
     """
-    Load previously saved data from CSV.
+    Load previously saved data from disk.
+    
+    Reads the Parquet file when there is one (and pyarrow is available),
+    otherwise the CSV written by older versions or by CSV-only installs.
     
     Args:
         symbol: Stock symbol
@@ -229,14 +366,16 @@ def load_data(symbol: str, directory: str = "cache") -> pd.DataFrame:
     Returns:
         DataFrame with OHLCV data
     """
-    from pathlib import Path
-    
-    filepath = Path(__file__).parent / directory / f"{symbol}.csv"
-    
-    if not filepath.exists():
+    parquet_path = _cache_path(symbol, directory, ".parquet")
+    csv_path = _cache_path(symbol, directory, ".csv")
+    
+    if PARQUET_AVAILABLE and parquet_path.exists():
+        df = pd.read_parquet(parquet_path, engine="pyarrow")
+    elif csv_path.exists():
+        df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+    else:
         raise FileNotFoundError(f"No cached data for {symbol}")
     
-    df = pd.read_csv(filepath, index_col=0, parse_dates=True)
     print(f"📂 Loaded {symbol} data from cache ({len(df)} bars)")
     
     return df
@@ -268,7 +407,12 @@ class AlpacaDataFetcher:
         """
         self.api_key = api_key
         self.secret_key = secret_key
-        self.data_url = data_url or ALPACA_DATA_URL or "https://data.alpaca.markets"
+        self.data_url = data_url or config.ALPACA_DATA_URL or "https://data.alpaca.markets"
+        # One keep-alive session per fetcher, with the auth headers set once
+        self._session = _new_session({
+            "APCA-API-KEY-ID": api_key,
+            "APCA-API-SECRET-KEY": secret_key
+        })
     
     def get_bars(
         self,
@@ -291,11 +435,6 @@ class AlpacaDataFetcher:
         """
         url = f"{self.data_url}/v2/stocks/{symbol}/bars"
         
-        headers = {
-            "APCA-API-KEY-ID": self.api_key,
-            "APCA-API-SECRET-KEY": self.secret_key
-        }
-        
         params = {
             "start": f"{start}T00:00:00Z",
             "end": f"{end}T23:59:59Z",
@@ -304,35 +443,12 @@ class AlpacaDataFetcher:
             "adjustment": "split"
         }
         
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            raise Exception(f"API Error {response.status_code}: {response.text}")
-        
-        data = response.json()
-        bars = data.get("bars", [])
+        bars = _fetch_all_bars(self._session, url, params)
         
         if not bars:
             raise ValueError(f"No data returned for {symbol}")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(bars)
-        
-        column_map = {
-            't': 'timestamp',
-            'o': 'open',
-            'h': 'high',
-            'l': 'low',
-            'c': 'close',
-            'v': 'volume',
-        }
-        df = df.rename(columns=column_map)
-        
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.set_index('timestamp')
-        df = df[['open', 'high', 'low', 'close', 'volume']]
-        
-        return df
+        return _bars_to_frame(bars)
 
 
 if __name__ == "__main__":
@@ -8,54 +8,158 @@ owns external IO and provider fallback.
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timedelta
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Union
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 
+import json_compat
+
 from .market_data_service_client import MarketDataServiceClient
 
+LOGGER = logging.getLogger(__name__)
+
+# An ISO ``YYYY-MM-DD`` string, or an already-parsed date that backtest loops
+# can pass straight through without formatting it themselves.
+AsOfDate = Union[str, date, np.datetime64, None]
+DEFAULT_BATCH_MAX_WORKERS = 8
+
+# Offset-aware event times are read as US market wall time, so an after-hours
+# report keeps its local calendar date.
+MARKET_TZ = ZoneInfo("America/New_York")
+_OFFSET_SUFFIX = r"(?:Z|[+-]\d{2}:?\d{2})$"
+
+# How long a cached payload stays usable. Current fundamentals move with each
+# earnings report and ownership filing, so they are refreshed daily. A
+# point-in-time payload for a past date describes a closed period and is kept
+# for a week.
+CURRENT_FUNDAMENTALS_MAX_AGE = timedelta(hours=24)
+POINT_IN_TIME_FUNDAMENTALS_MAX_AGE = timedelta(days=7)
+
+# Parsed cache files kept in memory per FundamentalsCache; enough for a full
+# universe of current payloads plus a point-in-time sweep's working set.
+PARSED_CACHE_MAXSIZE = 2048
+
+# Numeric payload fields that vary by as_of_date.
+POINT_IN_TIME_FIELDS = (
+    "eps_growth",
+    "annual_eps_growth",
+    "revenue_growth",
+    "institutional_pct",
+    "float_shares",
+    "shares_outstanding",
+    "short_ratio",
+    "short_pct_of_float",
+)
+
 
 class FundamentalsCache:
-    """Small JSON cache to avoid hammering the local service repeatedly."""
+    """Small compact-JSON cache to avoid hammering the local service repeatedly."""
 
     def __init__(self, cache_dir: str = None):
         if cache_dir is None:
             cache_dir = Path(__file__).parent / "cache"
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        # Parsed payloads keyed by path, tagged with the file mtime they were
+        # read at, so repeat lookups skip the JSON parse until the file changes.
+        # Least recently used entries are dropped past PARSED_CACHE_MAXSIZE,
+        # and an entry goes as soon as its file is found expired.
+        self._parsed: "OrderedDict[Path, tuple[float, dict]]" = OrderedDict()
+        self._parsed_lock = threading.Lock()
 
     def _cache_path(self, symbol: str, data_type: str) -> Path:
         return self.cache_dir / f"{symbol}_{data_type}.json"
 
-    def get(self, symbol: str, data_type: str) -> Optional[dict]:
+    def get(
+        self,
+        symbol: str,
+        data_type: str,
+        max_age: timedelta = CURRENT_FUNDAMENTALS_MAX_AGE,
+    ) -> Optional[dict]:
         path = self._cache_path(symbol, data_type)
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if time.time() - mtime > max_age.total_seconds():
+            with self._parsed_lock:
+                self._parsed.pop(path, None)
             return None
-        mtime = datetime.fromtimestamp(path.stat().st_mtime)
-        if datetime.now() - mtime > timedelta(hours=24):
+        with self._parsed_lock:
+            parsed = self._parsed.get(path)
+            if parsed is not None and parsed[0] == mtime:
+                self._parsed.move_to_end(path)
+                # Top-level copy: callers add and replace keys on what they get.
+                return dict(parsed[1])
+        try:
+            data = json_compat.loads(path.read_bytes())
+        except (OSError, ValueError):
+            # Unreadable or corrupt file: treat it as a miss and refetch.
             return None
-        with open(path, "r") as f:
-            return json.load(f)
+        with self._parsed_lock:
+            self._parsed[path] = (mtime, data)
+            self._parsed.move_to_end(path)
+            while len(self._parsed) > PARSED_CACHE_MAXSIZE:
+                self._parsed.popitem(last=False)
+        return dict(data)
 
     def set(self, symbol: str, data_type: str, data: dict):
         path = self._cache_path(symbol, data_type)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        # Write to a private temp file and rename it into place, so a reader in
+        # another process or thread never sees a half-written payload.
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(json_compat.dumps(data, default=str))
+        os.replace(tmp, path)
+        with self._parsed_lock:
+            self._parsed.pop(path, None)
+
+
+_shared_cache: Optional[FundamentalsCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def _get_shared_cache() -> FundamentalsCache:
+    """Return the process-wide default cache, creating it on first use.
+
+    Fetchers built by different strategies share it, so a payload parsed for
+    one is served from memory to the rest.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = FundamentalsCache()
+    return _shared_cache
 
 
 class FundamentalsFetcher:
     """Fetch normalized fundamentals from the local market-data service."""
 
     def __init__(self, service_client: MarketDataServiceClient | None = None):
-        self.cache = FundamentalsCache()
+        self.cache = _get_shared_cache()
         self.service_client = service_client or MarketDataServiceClient()
 
-    def _load_payload(self, symbol: str, as_of_date: str = None) -> Dict:
+    @staticmethod
+    def _cache_max_age(as_of_date: Optional[str] = None) -> timedelta:
+        """Cache lifetime for a payload; the single place fundamentals TTLs are decided."""
+        if as_of_date and as_of_date < datetime.now().strftime("%Y-%m-%d"):
+            return POINT_IN_TIME_FUNDAMENTALS_MAX_AGE
+        return CURRENT_FUNDAMENTALS_MAX_AGE
+
+    def _load_payload(self, symbol: str, as_of_date: AsOfDate = None) -> Dict:
+        as_of_date = _as_of_key(as_of_date)
         cache_key = f"fundamentals_{as_of_date}" if as_of_date else "fundamentals"
-        cached = self.cache.get(symbol, cache_key)
+        cached = self.cache.get(symbol, cache_key, max_age=self._cache_max_age(as_of_date))
         if cached is not None:
             return cached
 
@@ -88,18 +192,20 @@ class FundamentalsFetcher:
             "quarterly_financials": data.get("quarterly_financials", []),
             "institutional_holders": data.get("institutional_holders", []),
         }
-        self.cache.set(symbol, cache_key, normalized)
+        # No payload means the service was down, throttled, or rejected the
+        # request. Don't pin that empty result in the cache for a day; the
+        # next call should simply try again.
+        if payload is not None:
+            self.cache.set(symbol, cache_key, normalized)
         return normalized
 
     def get_earnings_history(self, symbol: str) -> pd.DataFrame:
-        rows = self._load_payload(symbol).get("earnings_history", [])
-        return pd.DataFrame(rows) if isinstance(rows, list) else pd.DataFrame()
+        return _rows_frame(self._load_payload(symbol).get("earnings_history", []))
 
     def get_earnings_event_window(self, symbol: str) -> pd.DataFrame:
-        rows = self._load_payload(symbol).get("earnings_event_window", [])
-        return pd.DataFrame(rows) if isinstance(rows, list) else pd.DataFrame()
+        return _rows_frame(self._load_payload(symbol).get("earnings_event_window", []))
 
-    def get_eps_growth(self, symbol: str, as_of_date: str = None) -> Optional[float]:
+    def get_eps_growth(self, symbol: str, as_of_date: AsOfDate = None) -> Optional[float]:
         return _maybe_float(self._load_payload(symbol, as_of_date).get("eps_growth"))
 
     def get_annual_eps_growth(self, symbol: str, years: int = 5) -> Optional[float]:
@@ -107,20 +213,24 @@ class FundamentalsFetcher:
             return None
 
         payload = self._load_payload(symbol)
-        rows = payload.get("earnings_history", [])
-        earnings = pd.DataFrame(rows) if isinstance(rows, list) else pd.DataFrame()
+        earnings = _rows_frame(payload.get("earnings_history", []))
 
         if not earnings.empty and {"date", "eps_actual"}.issubset(earnings.columns):
-            annual = earnings.copy()
-            annual["date"] = pd.to_datetime(annual["date"], errors="coerce")
+            # ``earnings`` was just built from the payload, so it is safe to
+            # coerce in place rather than copying it first.
+            annual = earnings
+            annual["date"] = _market_dates(annual["date"])
             annual["eps_actual"] = pd.to_numeric(annual["eps_actual"], errors="coerce")
             annual = annual.dropna(subset=["date", "eps_actual"]).sort_values("date")
             if not annual.empty:
-                annual["year"] = annual["date"].dt.year
-                annual_eps = annual.groupby("year")["eps_actual"].sum().sort_index()
+                # Rows are date-sorted, so each calendar year is a contiguous
+                # run; sum the runs directly instead of building a groupby.
+                year = annual["date"].dt.year.to_numpy()
+                starts = np.flatnonzero(np.r_[True, year[1:] != year[:-1]])
+                annual_eps = np.add.reduceat(annual["eps_actual"].to_numpy(dtype=float), starts)
                 if len(annual_eps) >= years:
-                    oldest_eps = annual_eps.iloc[-years]
-                    newest_eps = annual_eps.iloc[-1]
+                    oldest_eps = annual_eps[-years]
+                    newest_eps = annual_eps[-1]
                     if oldest_eps > 0 and newest_eps > 0:
                         cagr = ((newest_eps / oldest_eps) ** (1 / years) - 1) * 100
                         return float(cagr)
@@ -130,15 +240,13 @@ class FundamentalsFetcher:
         return _maybe_float(payload.get("annual_eps_growth"))
 
     def get_quarterly_financials(self, symbol: str) -> pd.DataFrame:
-        rows = self._load_payload(symbol).get("quarterly_financials", [])
-        return pd.DataFrame(rows) if isinstance(rows, list) else pd.DataFrame()
+        return _rows_frame(self._load_payload(symbol).get("quarterly_financials", []))
 
-    def get_revenue_growth(self, symbol: str, as_of_date: str = None) -> Optional[float]:
+    def get_revenue_growth(self, symbol: str, as_of_date: AsOfDate = None) -> Optional[float]:
         return _maybe_float(self._load_payload(symbol, as_of_date).get("revenue_growth"))
 
     def get_institutional_holders(self, symbol: str) -> pd.DataFrame:
-        rows = self._load_payload(symbol).get("institutional_holders", [])
-        return pd.DataFrame(rows) if isinstance(rows, list) else pd.DataFrame()
+        return _rows_frame(self._load_payload(symbol).get("institutional_holders", []))
 
     def get_institutional_ownership_pct(self, symbol: str) -> Optional[float]:
         return _maybe_float(self._load_payload(symbol).get("institutional_pct"))
@@ -154,25 +262,92 @@ class FundamentalsFetcher:
             "industry": payload.get("industry"),
         }
 
-    def get_fundamentals(self, symbol: str, as_of_date: str = None) -> Dict:
+    def get_fundamentals(self, symbol: str, as_of_date: AsOfDate = None) -> Dict:
         result = self._load_payload(symbol, as_of_date).copy()
-        events = self.get_earnings_event_window(symbol)
+        # The event window always comes from the current payload; when that is
+        # the payload just loaded, reuse it rather than re-reading the cache.
+        current = result if as_of_date is None else self._load_payload(symbol)
+        events = _rows_frame(current.get("earnings_event_window", []))
         if not events.empty and "date" in events.columns:
-            events = events.copy()
-            events["date"] = pd.to_datetime(events["date"], errors="coerce").dt.tz_localize(None)
+            events["date"] = _market_dates(events["date"])
             events = events.dropna(subset=["date"]).sort_values("date").reset_index(drop=True)
-            now_ts = pd.Timestamp.now().tz_localize(None)
-            past_events = events[events["date"] <= now_ts]
-            future_events = events[events["date"] > now_ts]
+            # Dates are sorted, so one binary search splits past from future
+            # events without materializing either half.
+            dates = events["date"]
+            now = pd.Timestamp.now(tz=MARKET_TZ).tz_localize(None)
+            split = int(dates.searchsorted(now, side="right"))
             result["earnings_event_window"] = events.to_dict("records")
             result["last_earnings_date"] = (
-                past_events.iloc[-1]["date"].strftime("%Y-%m-%d") if not past_events.empty else None
+                dates.iloc[split - 1].strftime("%Y-%m-%d") if split > 0 else None
             )
             result["next_earnings_date"] = (
-                future_events.iloc[0]["date"].strftime("%Y-%m-%d") if not future_events.empty else None
+                dates.iloc[split].strftime("%Y-%m-%d") if split < len(dates) else None
             )
         return result
 
+    def get_fundamentals_batch(
+        self,
+        symbols: Sequence[str],
+        as_of_date: AsOfDate = None,
+        *,
+        max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+    ) -> Dict[str, Dict]:
+        """Fetch fundamentals for several symbols concurrently.
+
+        The service only exposes a per-symbol fundamentals route, so requests are
+        fanned out over a small thread pool; wall time is roughly one round-trip
+        per ``max_workers`` symbols instead of one per symbol. Symbols that fail
+        are left out of the result.
+        """
+        unique_symbols = list(dict.fromkeys(symbol for symbol in symbols if symbol))
+        if not unique_symbols:
+            return {}
+        as_of_date = _as_of_key(as_of_date)
+
+        results: Dict[str, Dict] = {}
+        workers = max(1, min(int(max_workers or 1), len(unique_symbols)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.get_fundamentals, symbol, as_of_date): symbol
+                for symbol in unique_symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as exc:
+                    LOGGER.warning("Fundamentals fetch failed for %s: %s", symbol, exc)
+        return {symbol: results[symbol] for symbol in unique_symbols if symbol in results}
+
+    def get_fundamentals_at_dates(
+        self,
+        symbol: str,
+        dates: Sequence,
+        *,
+        max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+    ) -> pd.DataFrame:
+        """Point-in-time numeric fundamentals for one symbol across many dates.
+
+        Each distinct calendar date is loaded once (and cached per date), fanned
+        out over a thread pool. The result has one row per requested date,
+        indexed by date, in the shape ``score_canslim_fundamentals_batch`` takes.
+        """
+        index = pd.DatetimeIndex(pd.to_datetime(list(dates)), name="date")
+        keys = list(index.strftime("%Y-%m-%d"))
+        unique_keys = list(dict.fromkeys(keys))
+        payloads: Dict[str, Dict] = {}
+        if unique_keys:
+            workers = max(1, min(int(max_workers or 1), len(unique_keys)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = pool.map(lambda key: self._load_payload(symbol, key), unique_keys)
+                payloads = dict(zip(unique_keys, loaded))
+        return pd.DataFrame(
+            [{field: payloads[key].get(field) for field in POINT_IN_TIME_FIELDS} for key in keys],
+            index=index,
+            columns=list(POINT_IN_TIME_FIELDS),
+            dtype=float,
+        )
+
     def score_canslim_fundamentals(self, fundamentals: Dict) -> Dict:
         scores = {}
 
@@ -219,6 +394,76 @@ class FundamentalsFetcher:
         scores["fundamental_total"] = scores["C"] + scores["A"] + scores["I"] + scores["S"]
         return scores
 
+    def score_canslim_fundamentals_batch(self, fundamentals: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized ``score_canslim_fundamentals`` over one row per symbol.
+
+        Missing columns and missing values score 0, matching the scalar path.
+        """
+
+        def column(name: str) -> np.ndarray:
+            if name not in fundamentals.columns:
+                return np.full(len(fundamentals), np.nan)
+            return pd.to_numeric(fundamentals[name], errors="coerce").to_numpy(dtype=float)
+
+        # NaN fails every comparison below, so missing values fall to the 0 default.
+        eps = column("eps_growth")
+        annual = column("annual_eps_growth")
+        inst = column("institutional_pct")
+        float_shares = column("float_shares")
+        scores = pd.DataFrame(
+            {
+                "C": np.select([eps > 50, eps > 25], [2, 1], default=0),
+                "A": np.select([annual > 40, annual > 25], [2, 1], default=0),
+                "I": np.select(
+                    [(inst >= 0.20) & (inst <= 0.60), (inst >= 0.10) & (inst <= 0.80)],
+                    [2, 1],
+                    default=0,
+                ),
+                "S": np.select(
+                    [float_shares < 25_000_000, float_shares < 50_000_000],
+                    [2, 1],
+                    default=0,
+                ),
+            },
+            index=fundamentals.index,
+        )
+        scores["fundamental_total"] = scores[["C", "A", "I", "S"]].sum(axis=1)
+        return scores
+
+
+def _as_of_key(as_of_date: AsOfDate) -> Optional[str]:
+    """Normalize ``as_of_date`` to the ISO date string used for cache keys and the service."""
+    if as_of_date is None or isinstance(as_of_date, str):
+        return as_of_date
+    return pd.Timestamp(as_of_date).strftime("%Y-%m-%d")
+
+
+def _market_dates(values: pd.Series) -> pd.Series:
+    """Parse date entries into naive market wall time.
+
+    Naive and offset-aware inputs (even mixed offsets) land in one datetime64
+    column; aware ones are converted to MARKET_TZ before the zone is dropped.
+    Unparseable entries become NaT.
+    """
+    aware = values.astype(str).str.contains(_OFFSET_SUFFIX)
+    parts = []
+    if aware.any():
+        parts.append(
+            pd.to_datetime(values[aware], utc=True, format="mixed", errors="coerce")
+            .dt.tz_convert(MARKET_TZ)
+            .dt.tz_localize(None)
+        )
+    if not aware.all():
+        parts.append(pd.to_datetime(values[~aware], format="mixed", errors="coerce"))
+    if not parts:
+        return pd.Series(index=values.index, dtype="datetime64[ns]")
+    # Each half is parsed in one vectorized call; stitch them back in row order.
+    return pd.concat(parts).reindex(values.index).astype("datetime64[ns]")
+
+
+def _rows_frame(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows) if isinstance(rows, list) else pd.DataFrame()
+
 
 def _maybe_float(value) -> Optional[float]:
     try:
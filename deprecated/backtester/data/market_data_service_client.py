@@ -7,6 +7,10 @@ from typing import Any, Dict, Optional
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Enough keep-alive connections for the fundamentals batch thread pool.
+HTTP_POOL_SIZE = 16
 
 
 class MarketDataServiceClient:
@@ -33,13 +37,19 @@ class MarketDataServiceClient:
             self.enabled = raw not in {"0", "false", "no", "off"}
         else:
             self.enabled = enabled
+        # One keep-alive session per client, so batch lookups reuse connections
+        # to the service instead of opening a new socket per symbol.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def get_payload(self, path: str, *, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         if not self.enabled:
             return None
         url = f"{self.base_url}{path}"
         try:
-            response = requests.get(url, params=params, timeout=self.timeout_seconds)
+            response = self.session.get(url, params=params, timeout=self.timeout_seconds)
         except Exception:
             return None
         if response.status_code != 200:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 import unicodedata
 from dataclasses import dataclass
@@ -26,6 +27,18 @@ class MarketRegime(Enum):
     RALLY_ATTEMPT = "rally_attempt"
 
 
+_BUYABLE_REGIMES = frozenset(
+    {MarketRegime.CONFIRMED_UPTREND, MarketRegime.UPTREND_UNDER_PRESSURE, MarketRegime.RALLY_ATTEMPT}
+)
+
+_REGIME_EMOJI = {
+    MarketRegime.CONFIRMED_UPTREND: "🟢",
+    MarketRegime.UPTREND_UNDER_PRESSURE: "🟡",
+    MarketRegime.RALLY_ATTEMPT: "🟡",
+    MarketRegime.CORRECTION: "🔴",
+}
+
+
 @dataclass
 class MarketStatus:
     regime: MarketRegime
@@ -83,14 +96,8 @@ class MarketStatus:
         return "\n".join([top, header, divider, *rows, bottom])
 
     def __str__(self) -> str:
-        emoji = {
-            MarketRegime.CONFIRMED_UPTREND: "🟢",
-            MarketRegime.UPTREND_UNDER_PRESSURE: "🟡",
-            MarketRegime.RALLY_ATTEMPT: "🟡",
-            MarketRegime.CORRECTION: "🔴",
-        }
         lines = [
-            f"Regime: {emoji.get(self.regime, '')} {self.regime.value.upper()}",
+            f"Regime: {_REGIME_EMOJI.get(self.regime, '')} {self.regime.value.upper()}",
             f"Data Status: {self.status.upper()} ({self.data_source})",
             f"Distribution Days (25d): {self.distribution_days}",
             f"Last Follow-Through: {self.last_ftd or 'None recent'}",
@@ -145,6 +152,7 @@ class MarketRegimeDetector:
         transient_retry_attempts: int = 2,
         transient_retry_backoff_seconds: float = 1.5,
         stale_fallback_max_age_hours: float = 168.0,
+        status_ttl_seconds: float = 300.0,
     ):
         self.symbol = symbol
         self._data: Optional[pd.DataFrame] = None
@@ -164,6 +172,10 @@ class MarketRegimeDetector:
         self.stale_fallback_max_age_hours = float(
             os.getenv("MARKET_REGIME_STALE_FALLBACK_MAX_AGE_HOURS", str(stale_fallback_max_age_hours))
         )
+        # A live ("ok") status is reused for this long so repeated get_status /
+        # should_buy calls don't refetch history and premarket quotes.
+        self.status_ttl_seconds = float(os.getenv("MARKET_REGIME_STATUS_TTL_SECONDS", str(status_ttl_seconds)))
+        self._status_cache: Optional[Tuple[float, MarketStatus]] = None
         self.data_provider = MarketDataProvider(
             cache_ttl_seconds=self.cache_ttl_seconds,
             max_retries=int(os.getenv("MARKET_REGIME_FETCH_MAX_RETRIES", str(max_retries))),
@@ -369,7 +381,8 @@ class MarketRegimeDetector:
     def fetch_data(self, days: int = 90) -> pd.DataFrame:
         try:
             result = self.data_provider.get_history(self.symbol, period=f"{days}d", subsystem="market_regime")
-            self._data = result.frame
+            # Regime math only reads Close and Volume; don't carry OHLC around.
+            self._data = result.frame[["Close", "Volume"]]
             self.last_data_source = result.source
             self.last_provider_mode = result.provider_mode
             self.last_fallback_engaged = result.fallback_engaged
@@ -381,17 +394,19 @@ class MarketRegimeDetector:
         except MarketDataError as exc:
             raise MarketDataFetchError(str(exc), transient=exc.transient) from exc
 
+    @staticmethod
+    def _daily_return_and_volume_up(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Day-over-day close return and higher-volume flag for rows 1..n-1."""
+        close = data["Close"].to_numpy(dtype=float)
+        volume = data["Volume"].to_numpy()
+        return (close[1:] - close[:-1]) / close[:-1], volume[1:] > volume[:-1]
+
     def count_distribution_days(self, lookback: int = 25) -> List[datetime]:
         if self._data is None:
             self.fetch_data()
         data = self._data.tail(lookback + 1)
-        distribution_days: List[datetime] = []
-        for i in range(1, len(data)):
-            today = data.iloc[i]
-            yesterday = data.iloc[i - 1]
-            daily_return = (today["Close"] - yesterday["Close"]) / yesterday["Close"]
-            if daily_return < -0.002 and today["Volume"] > yesterday["Volume"]:
-                distribution_days.append(data.index[i])
+        daily_return, volume_up = self._daily_return_and_volume_up(data)
+        distribution_days: List[datetime] = list(data.index[1:][(daily_return < -0.002) & volume_up])
         self._distribution_days = distribution_days
         return distribution_days
 
@@ -399,23 +414,22 @@ class MarketRegimeDetector:
         if self._data is None:
             self.fetch_data()
         data = self._data.tail(lookback)
-        ftd_dates: List[datetime] = []
-        for i in range(4, len(data)):
-            today = data.iloc[i]
-            yesterday = data.iloc[i - 1]
-            daily_return = (today["Close"] - yesterday["Close"]) / yesterday["Close"]
-            if daily_return > 0.015 and today["Volume"] > yesterday["Volume"]:
-                ftd_dates.append(data.index[i])
+        daily_return, volume_up = self._daily_return_and_volume_up(data)
+        # A follow-through day needs at least day 4 of the window, i.e. return index 3+.
+        is_ftd = (daily_return > 0.015) & volume_up
+        ftd_dates: List[datetime] = list(data.index[1:][3:][is_ftd[3:]])
         self._ftd_dates = ftd_dates
         return ftd_dates
 
     def get_trend_direction(self) -> str:
         if self._data is None:
             self.fetch_data()
-        close = self._data["Close"]
-        sma_20 = close.rolling(20).mean()
-        sma_50 = close.rolling(50).mean()
-        current, s20, s50 = close.iloc[-1], sma_20.iloc[-1], sma_50.iloc[-1]
+        close = self._data["Close"].to_numpy(dtype=float)
+        # Only the latest SMA values matter, so average the tails directly.
+        # Short histories keep the rolling-window behaviour (no SMA -> sideways).
+        if len(close) < 50:
+            return "sideways"
+        current, s20, s50 = close[-1], close[-20:].mean(), close[-50:].mean()
         if current > s20 > s50:
             return "up"
         if current < s20 < s50:
@@ -502,7 +516,17 @@ class MarketRegimeDetector:
             follow_through_active=follow_through_active,
         )
 
-    def get_status(self) -> MarketStatus:
+    def get_status(self, refresh: bool = False) -> MarketStatus:
+        if not refresh and self._status_cache is not None:
+            cached_at, cached_status = self._status_cache
+            if time.monotonic() - cached_at < self.status_ttl_seconds:
+                return cached_status
+        status = self._compute_status()
+        # Degraded and emergency statuses are not reused; the next call retries.
+        self._status_cache = (time.monotonic(), status) if status.status == "ok" else None
+        return status
+
+    def _compute_status(self) -> MarketStatus:
         last_exc: MarketDataFetchError | None = None
         attempts = max(self.transient_retry_attempts, 0) + 1
         for attempt_index in range(attempts):
@@ -608,7 +632,7 @@ class MarketRegimeDetector:
 
     def should_buy(self) -> Tuple[bool, float]:
         status = self.get_status()
-        if status.regime == MarketRegime.CORRECTION:
+        if status.regime not in _BUYABLE_REGIMES:
             return False, 0.0
         return True, status.position_sizing
 
@@ -640,13 +664,27 @@ class MarketRegimeDetector:
 
 
 
+_default_detector: Optional[MarketRegimeDetector] = None
+_default_detector_lock = threading.Lock()
+
+
+def _get_default_detector() -> MarketRegimeDetector:
+    """Process-wide SPY detector for the module helpers, so its status TTL applies across calls."""
+    global _default_detector
+    if _default_detector is None:
+        with _default_detector_lock:
+            if _default_detector is None:
+                _default_detector = MarketRegimeDetector()
+    return _default_detector
+
+
 def get_market_status() -> MarketStatus:
-    return MarketRegimeDetector().get_status()
+    return _get_default_detector().get_status()
 
 
 
 def can_buy() -> Tuple[bool, float]:
-    return MarketRegimeDetector().should_buy()
+    return _get_default_detector().should_buy()
 
 
 if __name__ == "__main__":
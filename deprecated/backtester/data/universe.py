@@ -29,8 +29,11 @@ import logging
 import os
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
+from numba_compat import njit
+
 from .market_data_provider import MarketDataError, MarketDataProvider
 from .market_data_service_client import MarketDataServiceClient
 from .polymarket_context import load_watchlist_entries
@@ -122,6 +125,8 @@ SP500_TICKERS = [
     # === Industrials / Aerospace Growth ===
     "ARES", "KKR", "APO", "OWL", "STEP",
 ]
+# The sections above overlap; keep the first occurrence of each ticker.
+SP500_TICKERS = list(dict.fromkeys(SP500_TICKERS))
 
 # Growth/momentum stocks to always include in scans
 GROWTH_WATCHLIST = [
@@ -162,6 +167,20 @@ GROWTH_WATCHLIST = [
     # Alt energy / private equity growth
     "ENPH", "FSLR", "KKR", "APO", "ARES",
 ]
+GROWTH_WATCHLIST = list(dict.fromkeys(GROWTH_WATCHLIST))
+
+# Screen results carry small integer CANSLIM scores; store them compactly
+# instead of letting pandas infer int64 per column.
+CANDIDATE_SCORE_DTYPES = {
+    'N_score': 'int8',
+    'L_score': 'int8',
+    'S_score': 'int8',
+    'technical_score': 'int8',
+}
+
+# Company metadata (market cap, float, sector) moves slowly; serve it from disk
+# for this long before asking the service again.
+DEFAULT_METADATA_CACHE_TTL_SECONDS = 3600
 
 UNIVERSE_PROFILE_QUICK = "quick"
 UNIVERSE_PROFILE_STANDARD = "standard"
@@ -173,6 +192,48 @@ UNIVERSE_PROFILES = {
 }
 
 
+@njit(nogil=True, cache=True)
+def _technical_stats(close: np.ndarray, volume: np.ndarray):
+    """
+    Single pass over a price/volume history for the N, L and S inputs.
+
+    Returns (52-week high, last close, 6-month momentum %, up/down volume ratio).
+    The first day has no prior close, so it counts as a down day. Days with a
+    missing (NaN) volume are left out of the volume averages, like a pandas
+    mean. Released from the GIL under Numba so screening threads score in
+    parallel.
+    """
+    n = close.shape[0]
+    high_52w = close[0]
+    up_sum = 0.0
+    up_count = 0
+    down_sum = 0.0
+    down_count = 0
+    if not np.isnan(volume[0]):
+        down_sum = volume[0]
+        down_count = 1
+    for i in range(1, n):
+        if close[i] > high_52w:
+            high_52w = close[i]
+        if np.isnan(volume[i]):
+            continue
+        if close[i] / close[i - 1] - 1.0 > 0.0:
+            up_sum += volume[i]
+            up_count += 1
+        else:
+            down_sum += volume[i]
+            down_count += 1
+
+    current = close[n - 1]
+    base = close[n - 126] if n >= 126 else close[0]
+    momentum_6m = (current / base - 1.0) * 100.0
+
+    avg_up_volume = up_sum / up_count if up_count > 0 else 0.0
+    avg_down_volume = down_sum / down_count if down_count > 0 else 0.0
+    vol_ratio = avg_up_volume / avg_down_volume if avg_down_volume > 0 else 0.0
+    return high_52w, current, momentum_6m, vol_ratio
+
+
 class UniverseScreener:
     """
     Screens stocks to find CANSLIM candidates.
@@ -200,6 +261,9 @@ class UniverseScreener:
             base_url=self._service_base_url,
             timeout_seconds=self._service_timeout_seconds,
         )
+        self.metadata_cache_ttl_seconds = float(
+            os.getenv("MARKET_DATA_METADATA_CACHE_TTL_SECONDS", str(DEFAULT_METADATA_CACHE_TTL_SECONDS))
+        )
 
     def _service_request(self, path: str, method: str = "GET", **kwargs):
         try:
@@ -339,12 +403,73 @@ class UniverseScreener:
             LOGGER.debug("Skipping %s during provider history fetch: %s", symbol, exc)
             return None
 
+    def _fetch_price_histories(
+        self,
+        symbols: List[str],
+        period: str = "1y",
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """Fetch price history for many symbols at once, keyed in input order.
+
+        Provider round-trips dominate screening time, so they are overlapped on a
+        thread pool sized like the provider's own cache-refresh pool.
+        """
+        if not symbols:
+            return {}
+
+        def _fetch_one(symbol: str) -> Optional[pd.DataFrame]:
+            try:
+                return self._fetch_price_history(symbol, period)
+            except Exception as exc:
+                LOGGER.debug("Skipping %s during bulk history fetch: %s", symbol, exc)
+                return None
+
+        with ThreadPoolExecutor(max_workers=self._worker_count(len(symbols))) as pool:
+            return dict(zip(symbols, pool.map(_fetch_one, symbols)))
+
+    def _worker_count(self, jobs: int) -> int:
+        """Thread pool size for provider/service fan-out, matching the provider's refresh pool."""
+        return max(1, min(int(getattr(self.market_data, "refresh_concurrency", 8) or 8), jobs))
+
+    def _metadata_cache_path(self, symbol: str) -> Path:
+        safe_symbol = "".join(c if c.isalnum() else "_" for c in symbol.upper())
+        return self.cache_dir / "metadata" / f"{safe_symbol}.json"
+
+    def _load_cached_metadata(self, symbol: str) -> Optional[Dict]:
+        path = self._metadata_cache_path(symbol)
+        if not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            generated_at = datetime.fromisoformat(str(payload.get("generated_at")))
+            if generated_at.tzinfo is None:
+                generated_at = generated_at.replace(tzinfo=UTC)
+            age_seconds = max((datetime.now(UTC) - generated_at).total_seconds(), 0.0)
+            if age_seconds > self.metadata_cache_ttl_seconds:
+                return None
+            metadata = payload.get("metadata")
+            return metadata if isinstance(metadata, dict) else None
+        except Exception:
+            return None
+
+    def _write_cached_metadata(self, symbol: str, metadata: Dict) -> None:
+        payload = {"generated_at": datetime.now(UTC).isoformat(), "metadata": metadata}
+        path = self._metadata_cache_path(symbol)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload), encoding="utf-8")
+        except Exception:
+            # Cache write failure should never block screening.
+            return
+
     def _fetch_stock_metadata(self, symbol: str) -> Dict:
+        cached = self._load_cached_metadata(symbol)
+        if cached is not None:
+            return cached
         payload = self.service_client.get_symbol_payload("metadata", symbol)
         data = self.service_client.extract_data(payload) or {}
         if not isinstance(data, dict):
             return {}
-        return {
+        metadata = {
             'name': data.get('name', symbol),
             'market_cap': data.get('market_cap'),
             'float_shares': data.get('float_shares'),
@@ -352,6 +477,10 @@ class UniverseScreener:
             'sector': data.get('sector'),
             'industry': data.get('industry'),
         }
+        # Only remember real answers; an unreachable service should be retried.
+        if payload is not None:
+            self._write_cached_metadata(symbol, metadata)
+        return metadata
 
     def load_sp500_constituents(self, *, refresh: bool = False, max_age_hours: float = 24.0) -> List[str]:
         if not refresh:
@@ -622,9 +751,14 @@ class UniverseScreener:
             if close.empty or volume.empty:
                 return {'symbol': symbol, 'error': 'Insufficient data'}
             
+            # Volume is aligned to the close dates before both go to the kernel;
+            # dates without a volume come through as NaN and are skipped there.
+            high_52w, current, momentum_6m, vol_ratio = _technical_stats(
+                close.to_numpy(dtype=np.float64),
+                volume.reindex(close.index).to_numpy(dtype=np.float64),
+            )
+            
             # N — New High (proximity to 52-week high)
-            high_52w = close.max()
-            current = close.iloc[-1]
             pct_from_high = current / high_52w
             
             if pct_from_high >= 0.95:
@@ -635,11 +769,6 @@ class UniverseScreener:
                 n_score = 0
             
             # L — Leader (relative strength / momentum)
-            if len(close) >= 126:
-                momentum_6m = (current / close.iloc[-126] - 1) * 100
-            else:
-                momentum_6m = (current / close.iloc[0] - 1) * 100
-            
             if momentum_6m >= 25:
                 l_score = 2
             elif momentum_6m >= 10:
@@ -648,14 +777,6 @@ class UniverseScreener:
                 l_score = 0
             
             # S — Supply/Demand (volume on up days vs down days)
-            daily_return = close.pct_change()
-            up_days = daily_return > 0
-            
-            avg_up_volume = volume[up_days].mean() if up_days.any() else 0
-            avg_down_volume = volume[~up_days].mean() if (~up_days).any() else 1
-            
-            vol_ratio = avg_up_volume / avg_down_volume if avg_down_volume > 0 else 0
-            
             if vol_ratio >= 1.5:
                 s_score = 2 if vol_ratio >= 2.0 else 1
             else:
@@ -677,13 +798,49 @@ class UniverseScreener:
         except Exception as e:
             return {'symbol': symbol, 'error': str(e)}
     
+    def _screen_symbol(
+        self,
+        symbol: str,
+        history: Optional[pd.DataFrame],
+        min_technical_score: int,
+        sleep_seconds: float = 0.0,
+    ) -> Optional[Dict]:
+        """Apply the basic filters and technical score to one symbol; None if it is filtered."""
+        if history is None or history.empty:
+            return None
+
+        # Get basic info
+        info = self.get_stock_info(symbol, history=history)
+
+        # Apply basic filters
+        if not self.passes_basic_filters(info):
+            return None
+
+        # Calculate technical scores
+        tech = self.calculate_technical_score(symbol, history=history)
+        if 'error' in tech:
+            return None
+
+        # Apply minimum score filter
+        if tech['technical_score'] < min_technical_score:
+            return None
+
+        # Optional per-worker pacing for rate-limited environments
+        if sleep_seconds > 0:
+            time.sleep(sleep_seconds)
+
+        return {
+            **info,
+            **tech,
+        }
+
     def screen(
         self,
         symbols: List[str] = None,
         min_technical_score: int = 3,
         verbose: bool = True,
         progress_callback: Optional[Callable[[str], None]] = None,
-        sleep_seconds: float = 0.2,
+        sleep_seconds: float = 0.0,
     ) -> pd.DataFrame:
         """
         Screen stocks and calculate CANSLIM scores.
@@ -710,49 +867,25 @@ class UniverseScreener:
         candidates = []
         passed = 0
         failed = 0
-        
-        for i, symbol in enumerate(symbols):
-            if progress_callback is not None:
-                progress_callback(f"Nightly discovery progress: screening {i + 1}/{len(symbols)} {symbol}")
-            if verbose and (i + 1) % 10 == 0:
-                print(f"   Progress: {i + 1}/{len(symbols)} ({passed} passed, {failed} filtered)")
-
-            history = self._fetch_price_history(symbol)
-            if history is None or history.empty:
-                failed += 1
-                continue
-            
-            # Get basic info
-            info = self.get_stock_info(symbol, history=history)
-            
-            # Apply basic filters
-            if not self.passes_basic_filters(info):
-                failed += 1
-                continue
-            
-            # Calculate technical scores
-            tech = self.calculate_technical_score(symbol, history=history)
-            
-            if 'error' in tech:
-                failed += 1
-                continue
-            
-            # Apply minimum score filter
-            if tech['technical_score'] < min_technical_score:
-                failed += 1
-                continue
-            
-            # Combine info
-            candidate = {
-                **info,
-                **tech,
-            }
-            candidates.append(candidate)
-            passed += 1
-            
-            # Gentle pacing for local screening loops
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
+        histories = self._fetch_price_histories(symbols)
+
+        def _screen_one(symbol: str) -> Optional[Dict]:
+            return self._screen_symbol(symbol, histories.get(symbol), min_technical_score, sleep_seconds)
+
+        # Metadata lookups overlap on the pool; results come back in input order,
+        # so progress reporting and candidate order match a serial run.
+        with ThreadPoolExecutor(max_workers=self._worker_count(len(symbols))) as pool:
+            for i, (symbol, candidate) in enumerate(zip(symbols, pool.map(_screen_one, symbols))):
+                if progress_callback is not None:
+                    progress_callback(f"Nightly discovery progress: screening {i + 1}/{len(symbols)} {symbol}")
+                if verbose and (i + 1) % 10 == 0:
+                    print(f"   Progress: {i + 1}/{len(symbols)} ({passed} passed, {failed} filtered)")
+
+                if candidate is None:
+                    failed += 1
+                    continue
+                candidates.append(candidate)
+                passed += 1
         
         if verbose:
             print(f"\n✅ Screening complete!")
@@ -762,7 +895,7 @@ class UniverseScreener:
         if not candidates:
             return pd.DataFrame()
         
-        df = pd.DataFrame(candidates)
+        df = pd.DataFrame(candidates).astype(CANDIDATE_SCORE_DTYPES)
         
         # Sort by technical score
         df = df.sort_values('technical_score', ascending=False)
@@ -830,39 +963,33 @@ def find_breakouts(days: int = 5) -> pd.DataFrame:
     symbols = screener.get_universe()
     
     breakouts = []
+    histories = screener._fetch_price_histories(symbols, period="3mo")
     
     for symbol in symbols:
         try:
-            hist = screener._fetch_price_history(symbol, period="3mo")
+            hist = histories.get(symbol)
             
             if hist is None or len(hist) < 20:
                 continue
             
             # Check if made new 20-day high in last N days
-            close = hist['Close']
-            volume = hist['Volume']
-            
-            rolling_high = close.rolling(20).max()
-            recent = close.iloc[-days:]
-            recent_highs = rolling_high.iloc[-days:]
-            
-            # Breakout = price crosses above rolling high
-            for i in range(len(recent)):
-                if i == 0:
-                    continue
-                if recent.iloc[i] > recent_highs.iloc[i-1]:
-                    # Check volume confirmation
-                    avg_vol = volume.rolling(50).mean().iloc[-1]
-                    if volume.iloc[-days + i] > avg_vol * 1.5:
-                        breakouts.append({
-                            'symbol': symbol,
-                            'breakout_date': recent.index[i].strftime('%Y-%m-%d'),
-                            'price': recent.iloc[i],
-                            'volume_ratio': volume.iloc[-days + i] / avg_vol,
-                        })
-                        break
+            close = hist['Close'].to_numpy(dtype=float)
+            volume = hist['Volume'].to_numpy(dtype=float)
+            rolling_high = hist['Close'].rolling(20).max().to_numpy()
+            avg_vol = hist['Volume'].rolling(50).mean().iloc[-1]
             
-            time.sleep(0.1)
+            # Breakout = close above the prior day's 20-day high, on volume
+            # at least 1.5x the current 50-day average. Take the first one.
+            start = len(close) - days
+            is_breakout = (close[start + 1:] > rolling_high[start:-1]) & (volume[start + 1:] > avg_vol * 1.5)
+            if is_breakout.any():
+                pos = start + 1 + int(np.argmax(is_breakout))
+                breakouts.append({
+                    'symbol': symbol,
+                    'breakout_date': hist.index[pos].strftime('%Y-%m-%d'),
+                    'price': close[pos],
+                    'volume_ratio': volume[pos] / avg_vol,
+                })
             
         except Exception:
             continue
@@ -283,7 +283,7 @@ def score_exit_risk(history: pd.DataFrame, breakout: Optional[Dict] = None) -> D
     atr_pct = float(tr.rolling(14).mean().iloc[-1] / current * 100.0)
 
     volume_avg_20d = volume.rolling(20).mean()
-    daily_return = close.pct_change()
+    daily_return = close.pct_change(fill_method=None)
     distribution_days = int(
         (
             (daily_return < -0.015)
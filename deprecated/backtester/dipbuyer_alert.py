@@ -41,6 +41,7 @@ from strategy_alert_pipeline import (
     append_pipeline_contract_signals as _append_pipeline_contract_signals,
     append_pipeline_contract_summary as _append_pipeline_contract_summary,
     dedupe_reason as _dedupe_reason,
+    get_alert_market_status as _get_alert_market_status,
     market_degraded_warning_line as _market_degraded_warning_line,
     market_recovery_line as _market_recovery_line,
     apply_buy_readiness,
@@ -917,7 +918,7 @@ def build_alert_payload(
     phase_timings["setup"] = time.perf_counter() - setup_start
 
     market_start = time.perf_counter()
-    market = _run_quiet(advisor.get_market_status, True)
+    market = _get_alert_market_status(advisor)
     phase_timings["market"] = time.perf_counter() - market_start
     save_market_data_freshness_lane(market, generated_at=generated_at)
 
@@ -9,14 +9,180 @@ Technical indicators are mathematical calculations based on price/volume
 that traders use to predict future price movements.
 """
 
+from typing import Dict, Iterable, Union
+
 import pandas as pd
 import numpy as np
 
+from numba_compat import njit, prange
+
 
 # =============================================================================
 # MOVING AVERAGES
 # =============================================================================
 
+@njit(cache=True)
+def _rolling_mean(values: np.ndarray, period: int, out: np.ndarray) -> None:
+    """Running-sum moving average; a window containing NaN yields NaN, like pandas.
+
+    The warm-up bars are peeled off so the steady-state loop carries no
+    bar-index checks.
+    """
+    n = len(values)
+    total = 0.0
+    nan_count = 0
+    # Warm-up: fill the first window; the last bar of it gets the first mean.
+    for i in range(min(period, n)):
+        value = values[i]
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            total += value
+        out[i] = np.nan
+    if n >= period and nan_count == 0:
+        out[period - 1] = total / period
+    # Steady state: one value enters and one leaves per bar.
+    for i in range(period, n):
+        value = values[i]
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            total += value
+        leaving = values[i - period]
+        if np.isnan(leaving):
+            nan_count -= 1
+        else:
+            total -= leaving
+        out[i] = total / period if nan_count == 0 else np.nan
+
+
+@njit(cache=True)
+def _dual_rolling_mean(
+    values: np.ndarray, short: int, long: int, out_short: np.ndarray, out_long: np.ndarray
+) -> None:
+    """_rolling_mean for two window lengths in one read of ``values``.
+
+    Each window keeps its own running sum and NaN count, updated in the same
+    order as _rolling_mean, so the results are identical to two separate calls.
+    """
+    n = len(values)
+    short_total = long_total = 0.0
+    short_nans = long_nans = 0
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            short_nans += 1
+            long_nans += 1
+        else:
+            short_total += value
+            long_total += value
+        if i >= short:
+            leaving = values[i - short]
+            if np.isnan(leaving):
+                short_nans -= 1
+            else:
+                short_total -= leaving
+        if i >= long:
+            leaving = values[i - long]
+            if np.isnan(leaving):
+                long_nans -= 1
+            else:
+                long_total -= leaving
+        if i >= short - 1 and short_nans == 0:
+            out_short[i] = short_total / short
+        else:
+            out_short[i] = np.nan
+        if i >= long - 1 and long_nans == 0:
+            out_long[i] = long_total / long
+        else:
+            out_long[i] = np.nan
+
+
+@njit(cache=True)
+def _dual_rolling_max(
+    values: np.ndarray, short: int, long: int, out_short: np.ndarray, out_long: np.ndarray
+) -> None:
+    """Monotonic-deque rolling max for two window lengths in one read of ``values``.
+
+    A window containing NaN yields NaN, like pandas.
+    """
+    n = len(values)
+    short_window = np.empty(n, dtype=np.int64)
+    long_window = np.empty(n, dtype=np.int64)
+    short_head = short_tail = 0
+    long_head = long_tail = 0
+    short_nans = long_nans = 0
+    for i in range(n):
+        value = values[i]
+        if np.isnan(value):
+            short_nans += 1
+            long_nans += 1
+        else:
+            while short_tail > short_head and values[short_window[short_tail - 1]] <= value:
+                short_tail -= 1
+            short_window[short_tail] = i
+            short_tail += 1
+            while long_tail > long_head and values[long_window[long_tail - 1]] <= value:
+                long_tail -= 1
+            long_window[long_tail] = i
+            long_tail += 1
+        if i >= short:
+            if np.isnan(values[i - short]):
+                short_nans -= 1
+            while short_tail > short_head and short_window[short_head] <= i - short:
+                short_head += 1
+        if i >= long:
+            if np.isnan(values[i - long]):
+                long_nans -= 1
+            while long_tail > long_head and long_window[long_head] <= i - long:
+                long_head += 1
+        if i >= short - 1 and short_nans == 0:
+            out_short[i] = values[short_window[short_head]]
+        else:
+            out_short[i] = np.nan
+        if i >= long - 1 and long_nans == 0:
+            out_long[i] = values[long_window[long_head]]
+        else:
+            out_long[i] = np.nan
+
+
+@njit(cache=True)
+def _ewm_update(state: np.ndarray, value: float, alpha: float) -> float:
+    """Advance one ``ewm(alpha=alpha, adjust=False)`` step and return the average.
+
+    ``state`` holds (average, old_weight, new_weight) and starts as (nan, 1, alpha).
+    NaNs carry the previous average forward and still decay its weight, which is
+    pandas' default ``ignore_na=False`` behavior.
+    """
+    average = state[0]
+    observed = not np.isnan(value)
+    if np.isnan(average):
+        if observed:
+            state[0] = value
+        return state[0]
+    old_weight = state[1] * (1.0 - alpha)
+    new_weight = state[2]
+    if alpha == 0.5:
+        # pandas rebalances the weights after gaps when com == 1
+        new_weight = 1.0 - old_weight
+    if observed:
+        if average != value:
+            average = (old_weight * average + new_weight * value) / (old_weight + new_weight)
+        old_weight = 1.0
+    state[0] = average
+    state[1] = old_weight
+    state[2] = new_weight
+    return average
+
+
+@njit(cache=True)
+def _ewm_mean(values: np.ndarray, alpha: float, out: np.ndarray) -> None:
+    """Recursive EMA, same as ``ewm(alpha=alpha, adjust=False).mean()``."""
+    state = np.array([np.nan, 1.0, alpha])
+    for i in range(len(values)):
+        out[i] = _ewm_update(state, values[i], alpha)
+
+
 def sma(prices: pd.Series, period: int) -> pd.Series:
     """
     Simple Moving Average (SMA)
@@ -44,7 +210,12 @@ def sma(prices: pd.Series, period: int) -> pd.Series:
         3    12.0  # (11 + 12 + 13) / 3
         4    13.0  # (12 + 13 + 14) / 3
     """
-    return prices.rolling(window=period).mean()
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    values = prices.to_numpy(dtype=np.float64)
+    out = np.empty(len(values), dtype=np.float64)
+    _rolling_mean(values, int(period), out)
+    return pd.Series(out, index=prices.index, name=prices.name)
 
 
 def ema(prices: pd.Series, period: int) -> pd.Series:
@@ -65,13 +236,47 @@ def ema(prices: pd.Series, period: int) -> pd.Series:
     Returns:
         Series of EMA values
     """
-    return prices.ewm(span=period, adjust=False).mean()
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    values = prices.to_numpy(dtype=np.float64)
+    out = np.empty(len(values), dtype=np.float64)
+    _ewm_mean(values, 2.0 / (period + 1.0), out)
+    return pd.Series(out, index=prices.index, name=prices.name)
 
 
 # =============================================================================
 # MOMENTUM INDICATORS
 # =============================================================================
 
+@njit(cache=True)
+def _rsi_kernel(prices: np.ndarray, period: int, out: np.ndarray) -> None:
+    """Fused RSI pass: gains/losses plus Wilder averages (adjusted EWM, com=period-1)."""
+    decay = 1.0 - 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    old_weight = 1.0
+    for i in range(len(prices)):
+        # The first change is undefined; like a NaN change it counts as 0 gain and 0 loss.
+        delta = prices[i] - prices[i - 1] if i > 0 else 0.0
+        if np.isnan(delta):
+            delta = 0.0
+        # Branchless split: exactly delta or 0 (0.5 * 2d is exact in floating point)
+        magnitude = abs(delta)
+        gain = 0.5 * (delta + magnitude)
+        loss = 0.5 * (magnitude - delta)
+        if i > 0:
+            old_weight *= decay
+            if avg_gain != gain:
+                avg_gain = (old_weight * avg_gain + gain) / (old_weight + 1.0)
+            if avg_loss != loss:
+                avg_loss = (old_weight * avg_loss + loss) / (old_weight + 1.0)
+            old_weight += 1.0
+        if i >= period - 1:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / (avg_loss + 1e-10))
+        else:
+            out[i] = np.nan
+
+
 def rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     """
     Relative Strength Index (RSI)
@@ -98,28 +303,14 @@ def rsi(prices: pd.Series, period: int = 14) -> pd.Series:
         4. RS = Average Gain / Average Loss
         5. RSI = 100 - (100 / (1 + RS))
     """
-    # Step 1: Calculate price changes from day to day
-    delta = prices.diff()
-    
-    # Step 2: Separate gains and losses
-    # gains = positive changes only (losses replaced with 0)
-    # losses = negative changes only (as positive numbers)
-    gains = delta.where(delta > 0, 0)
-    losses = -delta.where(delta < 0, 0)
-    
-    # Step 3: Calculate average gain/loss over the period
-    # Using exponential moving average for smoother results
-    avg_gain = gains.ewm(com=period - 1, min_periods=period).mean()
-    avg_loss = losses.ewm(com=period - 1, min_periods=period).mean()
-    
-    # Step 4: Calculate Relative Strength (RS)
-    # Add small epsilon to avoid division by zero
-    rs = avg_gain / (avg_loss + 1e-10)
-    
-    # Step 5: Convert to RSI (0-100 scale)
-    rsi_values = 100 - (100 / (1 + rs))
-    
-    return rsi_values
+    # All five steps run in one pass over the prices (see _rsi_kernel); the
+    # averages are Wilder-style exponential averages with com = period - 1.
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    values = prices.to_numpy(dtype=np.float64)
+    out = np.empty(len(values), dtype=np.float64)
+    _rsi_kernel(values, int(period), out)
+    return pd.Series(out, index=prices.index, name=prices.name)
 
 
 def rate_of_change(prices: pd.Series, period: int) -> pd.Series:
@@ -144,7 +335,37 @@ def rate_of_change(prices: pd.Series, period: int) -> pd.Series:
         If price was $100 ten days ago and is $110 now:
         ROC(10) = ((110 - 100) / 100) * 100 = 10%
     """
-    return ((prices - prices.shift(period)) / prices.shift(period)) * 100
+    if period < 1:
+        return ((prices - prices.shift(period)) / prices.shift(period)) * 100
+
+    out = _roc_values(prices.to_numpy(dtype=np.float64), period)
+    return pd.Series(out, index=prices.index, name=prices.name)
+
+
+def _roc_values(values: np.ndarray, period: int) -> np.ndarray:
+    """Array form of rate_of_change (period >= 1) along the last axis."""
+    out = np.full(values.shape, np.nan)
+    current, previous = values[..., period:], values[..., :-period]
+    roc = out[..., period:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.subtract(current, previous, out=roc)
+        np.divide(roc, previous, out=roc)
+    np.multiply(roc, 100, out=roc)
+    return out
+
+
+@njit(cache=True)
+def _macd_kernel(prices: np.ndarray, fast_alpha: float, slow_alpha: float, signal_alpha: float, out: np.ndarray) -> None:
+    """Write MACD, signal and histogram columns into ``out`` in a single pass."""
+    fast_state = np.array([np.nan, 1.0, fast_alpha])
+    slow_state = np.array([np.nan, 1.0, slow_alpha])
+    signal_state = np.array([np.nan, 1.0, signal_alpha])
+    for i in range(len(prices)):
+        macd_value = _ewm_update(fast_state, prices[i], fast_alpha) - _ewm_update(slow_state, prices[i], slow_alpha)
+        signal_value = _ewm_update(signal_state, macd_value, signal_alpha)
+        out[i, 0] = macd_value
+        out[i, 1] = signal_value
+        out[i, 2] = macd_value - signal_value
 
 
 def macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
@@ -173,30 +394,87 @@ def macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) ->
     Returns:
         DataFrame with columns: 'macd', 'signal', 'histogram'
     """
-    # Calculate the fast and slow EMAs
-    fast_ema = ema(prices, fast)
-    slow_ema = ema(prices, slow)
-    
-    # MACD line = difference between fast and slow EMAs
-    macd_line = fast_ema - slow_ema
-    
-    # Signal line = EMA of the MACD line
-    signal_line = ema(macd_line, signal)
-    
-    # Histogram = MACD - Signal (shows momentum direction/strength)
-    histogram = macd_line - signal_line
-    
-    return pd.DataFrame({
-        'macd': macd_line,
-        'signal': signal_line,
-        'histogram': histogram
-    })
+    # Fast EMA, slow EMA and the signal EMA of their difference all advance
+    # together in one pass (see _macd_kernel).
+    if min(fast, slow, signal) < 1:
+        raise ValueError("periods must be >= 1")
+    values = prices.to_numpy(dtype=np.float64)
+    out = np.empty((len(values), 3), dtype=np.float64)
+    _macd_kernel(values, 2.0 / (fast + 1.0), 2.0 / (slow + 1.0), 2.0 / (signal + 1.0), out)
+    return pd.DataFrame(out, index=prices.index, columns=['macd', 'signal', 'histogram'])
 
 
 # =============================================================================
 # VOLATILITY INDICATORS
 # =============================================================================
 
+@njit(cache=True)
+def _bollinger_kernel(values: np.ndarray, period: int, std_dev: float, out: np.ndarray) -> None:
+    """Write middle/upper/lower bands in one pass over ``values``.
+
+    The middle band is a running-sum mean. The sample std (ddof=1, like
+    ``rolling().std()``) comes from a compensated running mean/variance that
+    drops the leaving value before adding the entering one, as pandas does.
+    A window containing NaN yields NaN bands.
+    """
+    total = 0.0
+    nan_count = 0
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    compensation_add = 0.0
+    compensation_remove = 0.0
+    same_run = 0
+    previous = np.nan
+    for i in range(len(values)):
+        if i >= period:
+            leaving = values[i - period]
+            if np.isnan(leaving):
+                nan_count -= 1
+            else:
+                total -= leaving
+                count -= 1
+                if count:
+                    prev_mean = mean - compensation_remove
+                    y = leaving - compensation_remove
+                    t = y - mean
+                    compensation_remove = t + mean - y
+                    mean -= t / count
+                    m2 -= (leaving - prev_mean) * (leaving - mean)
+                else:
+                    mean = 0.0
+                    m2 = 0.0
+        value = values[i]
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            total += value
+            same_run = same_run + 1 if value == previous else 1
+            previous = value
+            count += 1
+            prev_mean = mean - compensation_add
+            y = value - compensation_add
+            t = y - mean
+            compensation_add = t + mean - y
+            mean += t / count
+            m2 += (value - prev_mean) * (value - mean)
+        if i >= period - 1 and nan_count == 0:
+            middle = total / period
+            if period == 1:
+                std = np.nan
+            elif same_run >= count:
+                std = 0.0
+            else:
+                std = np.sqrt(max(m2, 0.0) / (period - 1))
+            out[i, 0] = middle
+            out[i, 1] = middle + std * std_dev
+            out[i, 2] = middle - std * std_dev
+        else:
+            out[i, 0] = np.nan
+            out[i, 1] = np.nan
+            out[i, 2] = np.nan
+
+
 def bollinger_bands(prices: pd.Series, period: int = 20, std_dev: float = 2.0) -> pd.DataFrame:
     """
     Bollinger Bands
@@ -222,21 +500,27 @@ def bollinger_bands(prices: pd.Series, period: int = 20, std_dev: float = 2.0) -
     Returns:
         DataFrame with columns: 'middle', 'upper', 'lower'
     """
-    # Middle band is just the SMA
-    middle = sma(prices, period)
-    
-    # Calculate rolling standard deviation
-    rolling_std = prices.rolling(window=period).std()
-    
-    # Upper and lower bands
-    upper = middle + (rolling_std * std_dev)
-    lower = middle - (rolling_std * std_dev)
-    
-    return pd.DataFrame({
-        'middle': middle,
-        'upper': upper,
-        'lower': lower
-    })
+    # Middle band (the SMA) and the rolling sample standard deviation come
+    # from one running mean/variance pass; see _bollinger_kernel.
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    values = prices.to_numpy(dtype=np.float64)
+    out = np.empty((len(values), 3), dtype=np.float64)
+    _bollinger_kernel(values, int(period), float(std_dev), out)
+    return pd.DataFrame(out, index=prices.index, columns=['middle', 'upper', 'lower'])
+
+
+@njit(cache=True)
+def _atr_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, alpha: float, out: np.ndarray) -> None:
+    """True range (NaN-skipping max of the three spans) fed straight into the EMA state."""
+    state = np.array([np.nan, 1.0, alpha])
+    for i in range(len(close)):
+        true_range = high[i] - low[i]
+        if i > 0:
+            for span in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                if not np.isnan(span) and (np.isnan(true_range) or span > true_range):
+                    true_range = span
+        out[i] = _ewm_update(state, true_range, alpha)
 
 
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
@@ -264,18 +548,20 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
     # 1. Current High - Current Low
     # 2. Abs(Current High - Previous Close)
     # 3. Abs(Current Low - Previous Close)
-    
-    prev_close = close.shift(1)
-    
-    tr1 = high - low
-    tr2 = abs(high - prev_close)
-    tr3 = abs(low - prev_close)
-    
-    # True Range = maximum of the three
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    
-    # ATR = smoothed average of True Range
-    return true_range.ewm(span=period, adjust=False).mean()
+    # The first bar has no previous close, so only High - Low counts there.
+    #
+    # ATR = smoothed average of True Range; both run bar by bar in _atr_kernel.
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    out = np.empty(len(close), dtype=np.float64)
+    _atr_kernel(
+        high.to_numpy(dtype=np.float64),
+        low.to_numpy(dtype=np.float64),
+        close.to_numpy(dtype=np.float64),
+        2.0 / (period + 1.0),
+        out,
+    )
+    return pd.Series(out, index=close.index)
 
 
 # =============================================================================
@@ -303,14 +589,174 @@ def relative_strength(stock_prices: pd.Series, benchmark_prices: pd.Series, peri
     Returns:
         Series of relative strength ratios
     """
-    # Calculate returns over the period
-    stock_return = stock_prices.pct_change(period)
-    benchmark_return = benchmark_prices.pct_change(period)
-    
-    # Relative strength = (1 + stock return) / (1 + benchmark return)
-    rs = (1 + stock_return) / (1 + benchmark_return)
-    
-    return rs
+    if period < 1 or not stock_prices.index.equals(benchmark_prices.index):
+        # Differently dated series keep pandas' per-series returns + label alignment
+        stock_return = stock_prices.pct_change(period, fill_method=None)
+        benchmark_return = benchmark_prices.pct_change(period, fill_method=None)
+        return (1 + stock_return) / (1 + benchmark_return)
+
+    out = _relative_strength_values(
+        stock_prices.to_numpy(dtype=np.float64), benchmark_prices.to_numpy(dtype=np.float64), period
+    )
+    return pd.Series(out, index=stock_prices.index)
+
+
+def _relative_strength_values(stock: np.ndarray, bench: np.ndarray, period: int) -> np.ndarray:
+    """Array form of relative_strength for equally dated prices (period >= 1)."""
+    # Relative strength = (1 + stock return) / (1 + benchmark return), and
+    # 1 + return over the period is just price / price N periods ago, so:
+    #   rs = (stock[t] * bench[t-N]) / (bench[t] * stock[t-N])
+    out = np.full(len(stock), np.nan)
+    numerator = out[period:]
+    denominator = np.multiply(bench[period:], stock[:-period])
+    np.multiply(stock[period:], bench[:-period], out=numerator)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(numerator, denominator, out=numerator)
+    return out
+
+
+# =============================================================================
+# BATCHED INDICATORS (many symbols at once)
+# =============================================================================
+
+@njit(parallel=True, cache=True)
+def _sma_rows(values: np.ndarray, period: int, out: np.ndarray) -> None:
+    for row in prange(values.shape[0]):
+        _rolling_mean(values[row], period, out[row])
+
+
+@njit(parallel=True, cache=True)
+def _ema_rows(values: np.ndarray, alpha: float, out: np.ndarray) -> None:
+    for row in prange(values.shape[0]):
+        _ewm_mean(values[row], alpha, out[row])
+
+
+@njit(parallel=True, cache=True)
+def _rsi_rows(values: np.ndarray, period: int, out: np.ndarray) -> None:
+    for row in prange(values.shape[0]):
+        _rsi_kernel(values[row], period, out[row])
+
+
+def _run_rows(prices: pd.DataFrame, kernel, param, dtype) -> pd.DataFrame:
+    """Run a row kernel over a (dates x symbols) frame, one symbol per row.
+
+    ``dtype`` only sets the storage of the input/output arrays; the kernels keep
+    their running sums and averages in float64 either way.
+    """
+    values = np.ascontiguousarray(prices.to_numpy(dtype=dtype).T)
+    out = np.empty_like(values)
+    kernel(values, param, out)
+    return pd.DataFrame(out.T, index=prices.index, columns=prices.columns)
+
+
+def sma_batch(prices: pd.DataFrame, period: int, dtype=np.float64) -> pd.DataFrame:
+    """
+    SMA for many symbols at once.
+
+    Args:
+        prices: DataFrame of prices, one column per symbol (e.g. closes indexed by date)
+        period: Number of periods to average
+        dtype: Array dtype for input/output; np.float32 halves memory traffic on
+            large universes at ~1e-7 relative precision
+
+    Returns:
+        DataFrame shaped like `prices`; each column equals sma() of that column.
+        With numba installed the symbols are processed in parallel.
+    """
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    return _run_rows(prices, _sma_rows, int(period), dtype)
+
+
+def ema_batch(prices: pd.DataFrame, period: int, dtype=np.float64) -> pd.DataFrame:
+    """EMA for many symbols at once; each column equals ema() of that column."""
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    return _run_rows(prices, _ema_rows, 2.0 / (period + 1.0), dtype)
+
+
+def rsi_batch(prices: pd.DataFrame, period: int = 14, dtype=np.float64) -> pd.DataFrame:
+    """RSI for many symbols at once; each column equals rsi() of that column."""
+    if period < 1:
+        raise ValueError("period must be >= 1")
+    return _run_rows(prices, _rsi_rows, int(period), dtype)
+
+
+def _periods(value: Union[int, Iterable[int]]) -> list:
+    periods = [value] if isinstance(value, (int, np.integer)) else list(value)
+    if any(period < 1 for period in periods):
+        raise ValueError("periods must be >= 1")
+    return list(dict.fromkeys(int(period) for period in periods))
+
+
+def compute_suite(prices: pd.Series, spec: Dict) -> Dict[str, Union[pd.Series, pd.DataFrame]]:
+    """
+    Compute several indicators for one price series in one call.
+
+    The prices are converted to a float64 array once, and every requested
+    kernel runs over that same buffer (still hot in cache) instead of each
+    indicator re-reading and re-wrapping the Series.
+
+    Args:
+        prices: Series of prices
+        spec: Which indicators to compute, e.g.
+            {'sma': [20, 50], 'ema': 12, 'rsi': 14, 'macd': (12, 26, 9)}
+
+    Returns:
+        Dict keyed 'sma_20', 'sma_50', 'ema_12', 'rsi_14' (Series) and
+        'macd' (DataFrame shaped like macd()); values equal the single
+        indicator functions.
+    """
+    unknown = set(spec) - {'sma', 'ema', 'rsi', 'macd'}
+    if unknown:
+        raise ValueError(f"Unknown indicators in spec: {sorted(unknown)}")
+
+    values = prices.to_numpy(dtype=np.float64)
+    n = len(values)
+    results: Dict[str, Union[pd.Series, pd.DataFrame]] = {}
+
+    def _series(out: np.ndarray) -> pd.Series:
+        return pd.Series(out, index=prices.index, name=prices.name)
+
+    for period in _periods(spec.get('sma', ())):
+        out = np.empty(n, dtype=np.float64)
+        _rolling_mean(values, period, out)
+        results[f'sma_{period}'] = _series(out)
+    for period in _periods(spec.get('ema', ())):
+        out = np.empty(n, dtype=np.float64)
+        _ewm_mean(values, 2.0 / (period + 1.0), out)
+        results[f'ema_{period}'] = _series(out)
+    for period in _periods(spec.get('rsi', ())):
+        out = np.empty(n, dtype=np.float64)
+        _rsi_kernel(values, period, out)
+        results[f'rsi_{period}'] = _series(out)
+    if spec.get('macd') is not None:
+        fast, slow, signal = (int(period) for period in spec['macd'])
+        if min(fast, slow, signal) < 1:
+            raise ValueError("periods must be >= 1")
+        out = np.empty((n, 3), dtype=np.float64)
+        _macd_kernel(values, 2.0 / (fast + 1.0), 2.0 / (slow + 1.0), 2.0 / (signal + 1.0), out)
+        results['macd'] = pd.DataFrame(out, index=prices.index, columns=['macd', 'signal', 'histogram'])
+    return results
+
+
+def merge_indicator_specs(specs: Iterable[Dict]) -> Dict:
+    """
+    Combine several compute_suite() specs into one.
+
+    Periods for 'sma', 'ema' and 'rsi' are unioned. 'macd' must agree across
+    specs because a suite holds a single MACD.
+    """
+    merged: Dict = {}
+    for spec in specs:
+        for name, value in spec.items():
+            if name == 'macd':
+                if merged.get('macd', tuple(value)) != tuple(value):
+                    raise ValueError("Conflicting MACD settings in indicator specs")
+                merged['macd'] = tuple(value)
+            else:
+                merged[name] = _periods(merged.get(name, []) + _periods(value))
+    return merged
 
 
 # =============================================================================
@@ -331,8 +777,12 @@ def crossover(series1: pd.Series, series2: pd.Series) -> pd.Series:
     Returns:
         Boolean series (True on crossover bars)
     """
-    # Crossover = series1 was below series2, now it's above
-    return (series1 > series2) & (series1.shift(1) <= series2.shift(1))
+    # Crossover = series1 was below series2, now it's above; one spread
+    # series1 - series2 serves both bars (NaN on either side compares False)
+    spread = np.subtract(series1.to_numpy(dtype=np.float64), series2.to_numpy(dtype=np.float64))
+    out = np.zeros(len(spread), dtype=bool)
+    np.logical_and(spread[1:] > 0.0, spread[:-1] <= 0.0, out=out[1:])
+    return pd.Series(out, index=series1.index)
 
 
 def crossunder(series1: pd.Series, series2: pd.Series) -> pd.Series:
@@ -349,7 +799,10 @@ def crossunder(series1: pd.Series, series2: pd.Series) -> pd.Series:
         Boolean series (True on crossunder bars)
     """
     # Crossunder = series1 was above series2, now it's below
-    return (series1 < series2) & (series1.shift(1) >= series2.shift(1))
+    spread = np.subtract(series1.to_numpy(dtype=np.float64), series2.to_numpy(dtype=np.float64))
+    out = np.zeros(len(spread), dtype=bool)
+    np.logical_and(spread[1:] < 0.0, spread[:-1] >= 0.0, out=out[1:])
+    return pd.Series(out, index=series1.index)
 
 
 if __name__ == "__main__":
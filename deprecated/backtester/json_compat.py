@@ -0,0 +1,82 @@
+"""Optional orjson support for hot JSON encode/decode paths.
+
+orjson is not a hard dependency. When it is installed, ``loads`` and
+``dumps`` use it; otherwise they fall back to the standard library. ``loads``
+accepts ``bytes`` or ``str``; ``dumps`` always returns compact UTF-8 ``bytes``.
+
+Both backends write the same bytes: NumPy scalars and arrays become plain
+JSON numbers and lists, non-finite floats (NaN, Infinity) become ``null``,
+and datetimes go through ``default`` like any other unsupported type. So the
+on-disk format doesn't depend on which one is installed. ``loads`` still
+accepts the bare ``NaN``/``Infinity`` tokens that ``json.dump`` wrote before,
+so older files on disk stay readable with either backend.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional at test time
+    _orjson = None
+
+ORJSON_AVAILABLE = _orjson is not None
+
+if _orjson is not None:
+    _ORJSON_OPTIONS = _orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document, using orjson when available."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens the stdlib encoder emits;
+            # let the stdlib parser read those (and report real errors).
+            pass
+    return json.loads(data)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of ``obj`` with non-finite floats replaced by None (orjson's encoding)."""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        obj = obj.tolist()
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_default(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """``default`` hook for ``json.dumps`` that encodes NumPy values like orjson does."""
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, (np.generic, np.ndarray)):
+            return value.tolist()
+        if default is None:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+        return default(value)
+
+    return encode
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode ``obj`` as compact JSON bytes, using orjson when available."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+    encode = _stdlib_default(default)
+    try:
+        text = json.dumps(obj, separators=(",", ":"), default=encode, allow_nan=False)
+    except ValueError:
+        # Only payloads holding NaN/Infinity pay for the copy.
+        text = json.dumps(_finite(obj), separators=(",", ":"), default=encode, allow_nan=False)
+    return text.encode("utf-8")
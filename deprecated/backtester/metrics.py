@@ -28,6 +28,7 @@ import numpy as np
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from numba_compat import njit
 from outcomes import annotate_trade_outcomes, summarize_outcomes
 
 
@@ -119,7 +120,12 @@ def total_return(equity_curve: pd.Series) -> float:
     Returns:
         Total return as percentage (e.g., 25.5 for 25.5% return)
     """
-    return ((equity_curve.iloc[-1] / equity_curve.iloc[0]) - 1) * 100
+    return _total_return_pct(equity_curve.to_numpy(dtype=np.float64))
+
+
+def _total_return_pct(values: np.ndarray) -> float:
+    """(last / first - 1) as a percentage; shared by total_return and the fused paths."""
+    return ((values[-1] / values[0]) - 1) * 100
 
 
 def cagr(equity_curve: pd.Series) -> float:
@@ -137,15 +143,18 @@ def cagr(equity_curve: pd.Series) -> float:
     Returns:
         CAGR as percentage
     """
+    index = equity_curve.index
+    values = equity_curve.to_numpy()
+
     # Calculate number of years
-    days = (equity_curve.index[-1] - equity_curve.index[0]).days
+    days = (index[-1] - index[0]).days
     years = days / 365.25
     
     if years <= 0:
         return 0.0
     
     # Calculate CAGR
-    total = equity_curve.iloc[-1] / equity_curve.iloc[0]
+    total = values[-1] / values[0]
     annual = (total ** (1 / years)) - 1
     
     return annual * 100
@@ -168,7 +177,14 @@ def volatility(returns: pd.Series, annualize: bool = True) -> float:
     Returns:
         Volatility as percentage
     """
-    vol = returns.std()
+    # Welford pass skips NaNs like Series.std() and is NaN below two returns
+    _, _, variance, _, _ = _returns_moments(returns.to_numpy(dtype=np.float64))
+    return _volatility_from_variance(variance, annualize)
+
+
+def _volatility_from_variance(variance: float, annualize: bool = True) -> float:
+    """Volatility percentage from the variance of daily returns."""
+    vol = np.sqrt(variance)
     
     if annualize:
         # 252 trading days per year
@@ -177,6 +193,34 @@ def volatility(returns: pd.Series, annualize: bool = True) -> float:
     return vol * 100
 
 
+@njit(cache=True, error_model="numpy")
+def _drawdown_step(
+    peak: float, max_dd: float, streak: int, longest: int, value: float
+) -> Tuple[float, float, int, int]:
+    """Fold one equity value into a running (peak, max drawdown, streak, longest streak)."""
+    if not np.isnan(value) and (np.isnan(peak) or value > peak):
+        peak = value
+    drawdown = (value - peak) / peak
+    if not np.isnan(drawdown) and (np.isnan(max_dd) or drawdown < max_dd):
+        max_dd = drawdown
+    if drawdown < 0:
+        streak += 1
+        if streak > longest:
+            longest = streak
+    else:
+        streak = 0
+    return peak, max_dd, streak, longest
+
+
+@njit(cache=True, error_model="numpy")
+def _drawdown_scan(values: np.ndarray) -> Tuple[float, int]:
+    """Return (deepest drawdown fraction, longest underwater streak); NaNs break streaks."""
+    peak, max_dd, streak, longest = np.nan, np.nan, 0, 0
+    for value in values:
+        peak, max_dd, streak, longest = _drawdown_step(peak, max_dd, streak, longest, value)
+    return max_dd, longest
+
+
 def max_drawdown(equity_curve: pd.Series) -> Tuple[float, int]:
     """
     Calculate maximum drawdown and its duration.
@@ -194,39 +238,118 @@ def max_drawdown(equity_curve: pd.Series) -> Tuple[float, int]:
     Returns:
         Tuple of (max_drawdown_pct, duration_in_days)
     """
-    # Calculate running maximum (the peak at each point)
-    rolling_max = equity_curve.expanding().max()
-    
-    # Drawdown = how far below the peak we are
-    drawdowns = (equity_curve - rolling_max) / rolling_max
-    
-    # Maximum drawdown (most negative value)
-    max_dd = drawdowns.min() * 100  # Convert to percentage
-    
-    # Calculate drawdown duration (longest time underwater)
-    # "Underwater" = below a previous peak
-    underwater = drawdowns < 0
-    
-    # Find the longest streak of being underwater
-    if underwater.any():
-        # Create groups of consecutive underwater periods
-        underwater_groups = (underwater != underwater.shift()).cumsum()
-        underwater_groups = underwater_groups[underwater]
-        
-        if len(underwater_groups) > 0:
-            duration = underwater_groups.value_counts().max()
-        else:
-            duration = 0
-    else:
-        duration = 0
-    
-    return max_dd, duration
+    # One pass: track the running peak, the deepest drawdown below it, and
+    # the longest streak of consecutive days spent underwater.
+    values = equity_curve.to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):  # zero peaks, as in pandas
+        max_dd, duration = _drawdown_scan(values)
+    return max_dd * 100, int(duration)  # Convert to percentage
 
 
 # =============================================================================
 # RISK-ADJUSTED RETURN CALCULATIONS
 # =============================================================================
 
+@njit(cache=True)
+def _welford_add(count: int, mean: float, m2: float, value: float) -> Tuple[int, float, float]:
+    """Fold one observation into a running (count, mean, sum of squared deviations)."""
+    count += 1
+    delta = value - mean
+    mean += delta / count
+    m2 += delta * (value - mean)
+    return count, mean, m2
+
+
+@njit(cache=True)
+def _moments_add(
+    count: int, mean: float, m2: float, neg_count: int, neg_mean: float, neg_m2: float, value: float
+) -> Tuple[int, float, float, int, float, float]:
+    """Fold one return into the running moments of all returns and of the negative ones."""
+    count, mean, m2 = _welford_add(count, mean, m2, value)
+    if value < 0:
+        neg_count, neg_mean, neg_m2 = _welford_add(neg_count, neg_mean, neg_m2, value)
+    return count, mean, m2, neg_count, neg_mean, neg_m2
+
+
+@njit(cache=True)
+def _moments_result(
+    count: int, mean: float, m2: float, neg_count: int, neg_m2: float
+) -> Tuple[int, float, float, float, int]:
+    """Finish running moments as (count, mean, variance, downside variance, negative count)."""
+    return (
+        count,
+        mean if count else np.nan,
+        m2 / (count - 1) if count > 1 else np.nan,
+        neg_m2 / (neg_count - 1) if neg_count > 1 else np.nan,
+        neg_count,
+    )
+
+
+@njit(cache=True)
+def _returns_moments(returns: np.ndarray) -> Tuple[int, float, float, float, int]:
+    """
+    One pass over the returns: (count, mean, variance, downside variance, negative count).
+
+    NaNs are skipped like pandas. Both variances are sample variances (ddof=1)
+    from Welford updates, and are NaN with fewer than two observations.
+    """
+    count, mean, m2 = 0, 0.0, 0.0
+    neg_count, neg_mean, neg_m2 = 0, 0.0, 0.0
+    for value in returns:
+        if np.isnan(value):
+            continue
+        count, mean, m2, neg_count, neg_mean, neg_m2 = _moments_add(
+            count, mean, m2, neg_count, neg_mean, neg_m2, value
+        )
+    return _moments_result(count, mean, m2, neg_count, neg_m2)
+
+
+@njit(cache=True, error_model="numpy")
+def _equity_scan(values: np.ndarray) -> Tuple[float, int, int, float, float, float, int]:
+    """
+    Drawdown and daily-return moments of an equity curve in a single pass.
+
+    Returns (max drawdown fraction, longest underwater streak) as in
+    _drawdown_scan followed by the _returns_moments tuple of
+    ``pct_change().dropna()``. Both share the per-value update helpers.
+    """
+    peak, max_dd, streak, longest = np.nan, np.nan, 0, 0
+    count, mean, m2 = 0, 0.0, 0.0
+    neg_count, neg_mean, neg_m2 = 0, 0.0, 0.0
+    previous = np.nan
+    for value in values:
+        peak, max_dd, streak, longest = _drawdown_step(peak, max_dd, streak, longest, value)
+
+        daily = value / previous - 1
+        previous = value
+        if np.isnan(daily):
+            continue
+        count, mean, m2, neg_count, neg_mean, neg_m2 = _moments_add(
+            count, mean, m2, neg_count, neg_mean, neg_m2, daily
+        )
+    return (max_dd, longest) + _moments_result(count, mean, m2, neg_count, neg_m2)
+
+
+def _sharpe_from_moments(mean: float, variance: float, risk_free_rate: float) -> float:
+    annual_return = mean * 252
+    annual_vol = np.sqrt(variance) * np.sqrt(252)
+    if annual_vol == 0:
+        return 0.0
+    return (annual_return - risk_free_rate) / annual_vol
+
+
+def _sortino_from_moments(
+    mean: float, downside_variance: float, negative_count: int, risk_free_rate: float
+) -> float:
+    if negative_count == 0:
+        return np.inf  # No negative returns = infinite Sortino
+    annual_return = mean * 252
+    downside_vol = np.sqrt(downside_variance) * np.sqrt(252)
+    if downside_vol == 0:
+        return 0.0
+    return (annual_return - risk_free_rate) / downside_vol
+
+
 def sharpe_ratio(returns: pd.Series, risk_free_rate: float = 0.02) -> float:
     """
     Sharpe Ratio: Return per unit of TOTAL risk.
@@ -249,16 +372,8 @@ def sharpe_ratio(returns: pd.Series, risk_free_rate: float = 0.02) -> float:
     Returns:
         Annualized Sharpe ratio
     """
-    # Annualized return
-    annual_return = returns.mean() * 252
-    
-    # Annualized volatility
-    annual_vol = returns.std() * np.sqrt(252)
-    
-    if annual_vol == 0:
-        return 0.0
-    
-    return (annual_return - risk_free_rate) / annual_vol
+    _, mean, variance, _, _ = _returns_moments(returns.to_numpy(dtype=np.float64))
+    return _sharpe_from_moments(mean, variance, risk_free_rate)
 
 
 def sortino_ratio(returns: pd.Series, risk_free_rate: float = 0.02) -> float:
@@ -279,21 +394,8 @@ def sortino_ratio(returns: pd.Series, risk_free_rate: float = 0.02) -> float:
     Returns:
         Annualized Sortino ratio
     """
-    # Annualized return
-    annual_return = returns.mean() * 252
-    
-    # Downside volatility (only negative returns)
-    negative_returns = returns[returns < 0]
-    
-    if len(negative_returns) == 0:
-        return np.inf  # No negative returns = infinite Sortino
-    
-    downside_vol = negative_returns.std() * np.sqrt(252)
-    
-    if downside_vol == 0:
-        return 0.0
-    
-    return (annual_return - risk_free_rate) / downside_vol
+    _, mean, _, downside_variance, negative_count = _returns_moments(returns.to_numpy(dtype=np.float64))
+    return _sortino_from_moments(mean, downside_variance, negative_count, risk_free_rate)
 
 
 def calmar_ratio(equity_curve: pd.Series) -> float:
@@ -310,9 +412,14 @@ def calmar_ratio(equity_curve: pd.Series) -> float:
     Returns:
         Calmar ratio
     """
-    annual = cagr(equity_curve) / 100  # Convert back to decimal
     max_dd, _ = max_drawdown(equity_curve)
-    max_dd = abs(max_dd) / 100  # Convert to positive decimal
+    return _calmar_from_pcts(cagr(equity_curve), max_dd)
+
+
+def _calmar_from_pcts(annual_return_pct: float, max_drawdown_pct: float) -> float:
+    """Calmar ratio from CAGR and max drawdown, both as percentages."""
+    annual = annual_return_pct / 100  # Convert back to decimal
+    max_dd = abs(max_drawdown_pct) / 100  # Convert to positive decimal
     
     if max_dd == 0:
         return 0.0
@@ -324,22 +431,39 @@ def calmar_ratio(equity_curve: pd.Series) -> float:
 # TRADE ANALYSIS
 # =============================================================================
 
-def analyze_trades(trades: pd.DataFrame) -> Dict:
+@njit(cache=True)
+def _trade_stats(pnl: np.ndarray) -> Tuple[int, int, float, float]:
+    """One pass over trade pnl: (wins, losses, gross profit, net loss); NaN counts as neither."""
+    n_wins = 0
+    n_losses = 0
+    gross_profit = 0.0
+    net_loss = 0.0
+    for value in pnl:
+        if value > 0:
+            n_wins += 1
+            gross_profit += value
+        elif value <= 0:
+            n_losses += 1
+            net_loss += value
+    return n_wins, n_losses, gross_profit, net_loss
+
+
+def analyze_trades_arr(pnl_pct: np.ndarray) -> Dict:
     """
-    Analyze completed trades to calculate trade-level metrics.
+    Trade-level metrics from a bare array of per-trade percentage P&L.
+    
+    Same numbers as analyze_trades (minus the outcome breakdown) for callers
+    that already hold the pnl column and don't need a DataFrame.
     
     Args:
-        trades: DataFrame with columns:
-            - entry_date: When position was opened
-            - exit_date: When position was closed
-            - entry_price: Price at entry
-            - exit_price: Price at exit
-            - pnl_pct: Percentage profit/loss
+        pnl_pct: Percentage profit/loss of each completed trade
     
     Returns:
         Dictionary of trade metrics
     """
-    if len(trades) == 0:
+    pnl = np.asarray(pnl_pct, dtype=np.float64)
+    total_trades = len(pnl)
+    if total_trades == 0:
         return {
             'total_trades': 0,
             'win_rate': 0.0,
@@ -347,41 +471,61 @@ def analyze_trades(trades: pd.DataFrame) -> Dict:
             'avg_loss': 0.0,
             'profit_factor': 0.0,
             'avg_trade': 0.0,
-            'outcome_breakdown': {},
         }
-
-    trades = annotate_trade_outcomes(trades)
     
-    # Separate winners and losers
-    winners = trades[trades['pnl_pct'] > 0]
-    losers = trades[trades['pnl_pct'] <= 0]
+    n_wins, n_losses, gross_profit, net_loss = _trade_stats(pnl)
+    n_valid = n_wins + n_losses
     
     # Win rate
-    win_rate = (len(winners) / len(trades)) * 100
+    win_rate = (n_wins / total_trades) * 100
     
     # Average win/loss
-    avg_win = winners['pnl_pct'].mean() if len(winners) > 0 else 0.0
-    avg_loss = losers['pnl_pct'].mean() if len(losers) > 0 else 0.0
+    avg_win = gross_profit / n_wins if n_wins > 0 else 0.0
+    avg_loss = net_loss / n_losses if n_losses > 0 else 0.0
     
     # Profit factor = gross profit / gross loss
-    gross_profit = winners['pnl_pct'].sum() if len(winners) > 0 else 0
-    gross_loss = abs(losers['pnl_pct'].sum()) if len(losers) > 0 else 0.001
+    gross_loss = abs(net_loss) if n_losses > 0 else 0.001
     profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
     
     # Average trade
-    avg_trade = trades['pnl_pct'].mean()
+    avg_trade = (gross_profit + net_loss) / n_valid if n_valid > 0 else np.nan
     
     return {
-        'total_trades': len(trades),
+        'total_trades': total_trades,
         'win_rate': win_rate,
         'avg_win': avg_win,
         'avg_loss': avg_loss,
         'profit_factor': profit_factor,
         'avg_trade': avg_trade,
-        'outcome_breakdown': summarize_outcomes(trades),
     }
 
 
+def analyze_trades(trades: pd.DataFrame) -> Dict:
+    """
+    Analyze completed trades to calculate trade-level metrics.
+    
+    Args:
+        trades: DataFrame with columns:
+            - entry_date: When position was opened
+            - exit_date: When position was closed
+            - entry_price: Price at entry
+            - exit_price: Price at exit
+            - pnl_pct: Percentage profit/loss
+    
+    Returns:
+        Dictionary of trade metrics
+    """
+    if len(trades) == 0:
+        return {**analyze_trades_arr(np.empty(0)), 'outcome_breakdown': {}}
+
+    trades = annotate_trade_outcomes(trades)
+    
+    # Only the pnl column feeds the numbers; the rest is for outcome labels.
+    stats = analyze_trades_arr(trades['pnl_pct'].to_numpy(dtype=np.float64))
+    stats['outcome_breakdown'] = summarize_outcomes(trades)
+    return stats
+
+
 # =============================================================================
 # MAIN METRICS CALCULATION
 # =============================================================================
@@ -405,11 +549,16 @@ def calculate_metrics(
     Returns:
         BacktestMetrics object with all calculated metrics
     """
-    # Calculate daily returns from equity curve
-    returns = equity_curve.pct_change().dropna()
+    # One fused scan yields the drawdown and the daily-return moments
+    values = equity_curve.to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        (
+            max_dd_frac, dd_duration, _, mean_return,
+            return_var, downside_var, negative_count,
+        ) = _equity_scan(values)
     
     # Return metrics
-    total_ret = total_return(equity_curve)
+    total_ret = _total_return_pct(values)
     annual_ret = cagr(equity_curve)
     
     # Benchmark comparison
@@ -421,13 +570,14 @@ def calculate_metrics(
         excess_ret = 0.0
     
     # Risk metrics
-    vol = volatility(returns)
-    max_dd, dd_duration = max_drawdown(equity_curve)
+    vol = _volatility_from_variance(return_var)
+    max_dd = max_dd_frac * 100
+    dd_duration = int(dd_duration)
     
     # Risk-adjusted metrics
-    sharpe = sharpe_ratio(returns)
-    sortino = sortino_ratio(returns)
-    calmar = calmar_ratio(equity_curve)
+    sharpe = _sharpe_from_moments(mean_return, return_var, 0.02)
+    sortino = _sortino_from_moments(mean_return, downside_var, negative_count, 0.02)
+    calmar = _calmar_from_pcts(annual_ret, max_dd)
     
     # Trade metrics
     trade_stats = analyze_trades(trades)
@@ -474,11 +624,13 @@ def quick_summary(equity_curve: pd.Series) -> str:
     
     Useful for comparing multiple strategies quickly.
     """
-    returns = equity_curve.pct_change().dropna()
+    values = equity_curve.to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_dd_frac, _, _, mean_return, return_var, _, _ = _equity_scan(values)
     
-    total_ret = total_return(equity_curve)
-    max_dd, _ = max_drawdown(equity_curve)
-    sharpe = sharpe_ratio(returns)
+    total_ret = _total_return_pct(values)
+    max_dd = max_dd_frac * 100
+    sharpe = _sharpe_from_moments(mean_return, return_var, 0.02)
     
     return f"Return: {total_ret:+.1f}% | MaxDD: {max_dd:.1f}% | Sharpe: {sharpe:.2f}"
 
@@ -501,8 +653,10 @@ if __name__ == "__main__":
         'exit_date': pd.date_range('2023-01-20', periods=20, freq='15D'),
         'entry_price': np.random.uniform(95, 105, 20),
         'exit_price': np.random.uniform(90, 115, 20),
+        'exit_reason': 'signal',
     })
-    trades['pnl_pct'] = ((trades['exit_price'] - trades['entry_price']) / trades['entry_price']) * 100
+    # Same form the backtester uses when it packs trade records
+    trades['pnl_pct'] = (trades['exit_price'].to_numpy() / trades['entry_price'].to_numpy() - 1) * 100
     
     # Calculate metrics
     metrics = calculate_metrics(equity_curve, trades)
@@ -100,7 +100,9 @@ def build_report(
 
     leaders = []
     if not discoveries.empty:
-        for _, row in discoveries.head(limit).iterrows():
+        # Plain dict rows: same .get() fallbacks as before without building a
+        # Series per candidate.
+        for row in discoveries.head(limit).to_dict("records"):
             leaders.append(
                 {
                     "symbol": row["symbol"],
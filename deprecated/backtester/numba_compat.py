@@ -0,0 +1,36 @@
+"""Optional Numba JIT support for the numeric hot loops.
+
+Numba is not a hard dependency. When it is installed, ``njit`` compiles the
+decorated kernel in nopython mode; otherwise it returns the plain Python
+function so callers keep identical behavior, just without the speedup.
+``prange`` likewise falls back to ``range`` for ``parallel=True`` kernels.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+except ImportError:  # pragma: no cover - optional at test time
+    _numba_njit = None
+    prange = range
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Drop-in for ``numba.njit`` that degrades to a no-op decorator.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorate
@@ -0,0 +1,53 @@
+"""
+Synthetic OHLCV data for the strategy modules' ``__main__`` demos.
+
+Both the momentum and CANSLIM demos used to rebuild the same seeded random
+walk inline. This builds it once per (n, seed, ...) combination and caches it.
+Set ``SKIP_DEMOS`` in the environment to make the demo blocks return early
+(e.g. when smoke-testing that every module still runs as a script).
+"""
+
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+def demos_disabled() -> bool:
+    """True when the ``SKIP_DEMOS`` environment variable is set to anything non-empty."""
+    return bool(os.getenv("SKIP_DEMOS"))
+
+
+@lru_cache(maxsize=4)
+def demo_ohlcv(
+    n: int = 200,
+    seed: int = 42,
+    start: str = "2024-01-01",
+    drift: float = 0.0005,
+    log_returns: bool = False,
+) -> pd.DataFrame:
+    """
+    Build a seeded random-walk OHLCV frame with daily dates.
+
+    Returns are ``randn * 0.02 + drift``; prices compound them as simple
+    returns (``cumprod(1 + r)``) or, with ``log_returns=True``, as log returns
+    (``exp(cumsum(r))``). Draws come from a private ``RandomState`` in the
+    same order the demos used after ``np.random.seed(seed)``, so the data is
+    identical without touching the global RNG.
+
+    The result is cached and shared between callers — don't mutate it.
+    """
+    rng = np.random.RandomState(seed)
+    dates = pd.date_range(start, periods=n, freq='D')
+
+    returns = rng.randn(n) * 0.02 + drift
+    prices = 100 * (np.exp(np.cumsum(returns)) if log_returns else np.cumprod(1 + returns))
+
+    return pd.DataFrame({
+        'open': prices * (1 + rng.randn(n) * 0.005),
+        'high': prices * (1 + np.abs(rng.randn(n)) * 0.01),
+        'low': prices * (1 - np.abs(rng.randn(n)) * 0.01),
+        'close': prices,
+        'volume': rng.randint(1000000, 5000000, n),
+    }, index=dates)
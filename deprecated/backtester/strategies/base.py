@@ -30,8 +30,9 @@ certain methods so the backtester knows how to use it.
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Strategy(ABC):
@@ -99,6 +100,28 @@ class Strategy(ABC):
         """
         pass
     
+    def required_indicators(self) -> Dict:
+        """
+        Indicators this strategy reads from the closing prices.
+
+        Returned as an indicators.compute_suite() spec, e.g.
+        {'sma': [50], 'rsi': 14}. Strategies that declare a spec must accept
+        the precomputed suite as generate_signals(data, indicators=...), so
+        compare_strategies() can compute shared indicators once for all of
+        them. The default (empty) means the strategy computes its own.
+        """
+        return {}
+    
+    @staticmethod
+    def signals_to_raw(signals: pd.Series) -> np.ndarray:
+        """
+        Convert a signal Series to a contiguous int8 array.
+        
+        Missing values count as HOLD (0), matching how the backtester
+        has always treated them.
+        """
+        return np.ascontiguousarray(signals.fillna(0).to_numpy(), dtype=np.int8)
+    
     def position_size(self, cash: float, price: float) -> int:
         """
         Calculate how many shares to buy.
@@ -43,16 +43,215 @@ we don't buy anything regardless of individual stock scores.
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
 from datetime import datetime, timedelta
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from numba_compat import njit, prange
 from strategies.base import Strategy
-from indicators import sma, rsi, relative_strength, rate_of_change
-from data.fundamentals import FundamentalsFetcher
+from indicators import (
+    _dual_rolling_max,
+    _dual_rolling_mean,
+    _relative_strength_values,
+    _roc_values,
+    _rolling_mean,
+    relative_strength,
+)
+from data.fundamentals import (
+    CURRENT_FUNDAMENTALS_MAX_AGE,
+    POINT_IN_TIME_FIELDS,
+    FundamentalsFetcher,
+)
+
+
+# Fetched + scored fundamentals, shared by every CANSLIMStrategy so a parameter
+# sweep loads and scores each symbol once. There is one LRU memo per data
+# source: the fetcher's FundamentalsCache (shared by default fetchers), or the
+# fetcher itself when it has none. A fetcher with its own cache dir, or a stub,
+# therefore never sees another source's results. Entries live as long as a
+# current fundamentals cache entry, and an all-empty payload (service down) is
+# never kept, mirroring FundamentalsFetcher's own caching rules.
+_FUNDAMENTALS_MEMO_MAXSIZE = 4096
+_FUNDAMENTALS_MEMO: "weakref.WeakKeyDictionary[object, OrderedDict[str, Tuple[float, Dict, Dict]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_FUNDAMENTALS_MEMO_LOCK = threading.Lock()
+
+
+def _fetch_and_score(fetcher: FundamentalsFetcher, symbol: str) -> Tuple[Dict, Dict]:
+    """Return (fundamentals, CANSLIM fundamental scores) for ``symbol``, memoized."""
+    source = getattr(fetcher, 'cache', None)
+    if source is None:
+        source = fetcher
+    now = time.monotonic()
+    with _FUNDAMENTALS_MEMO_LOCK:
+        memo = _FUNDAMENTALS_MEMO.setdefault(source, OrderedDict())
+        hit = memo.get(symbol)
+        if hit is not None:
+            if now - hit[0] < CURRENT_FUNDAMENTALS_MAX_AGE.total_seconds():
+                memo.move_to_end(symbol)
+                return dict(hit[1]), dict(hit[2])
+            del memo[symbol]
+    fundamentals = fetcher.get_fundamentals(symbol)
+    scores = fetcher.score_canslim_fundamentals(fundamentals)
+    if any(fundamentals.get(field) is not None for field in POINT_IN_TIME_FIELDS):
+        with _FUNDAMENTALS_MEMO_LOCK:
+            memo[symbol] = (now, fundamentals, scores)
+            memo.move_to_end(symbol)
+            while len(memo) > _FUNDAMENTALS_MEMO_MAXSIZE:
+                memo.popitem(last=False)
+    return dict(fundamentals), dict(scores)
+
+
+# Rolling series shared by both CANSLIM variants, in kernel output order.
+_TECHNICAL_COLUMNS = (
+    'high_252', 'resistance_20', 'sma_50', 'sma_200',
+    'volume_ratio_20', 'avg_volume_50',
+)
+
+
+@njit(cache=True, error_model="numpy")
+def _split_volume(close: np.ndarray, volume: np.ndarray, i: int) -> Tuple[float, float]:
+    """(up-day volume, down-day volume) of bar ``i``; the other side is 0."""
+    if i == 0:
+        return 0.0, 0.0
+    change = close[i] / close[i - 1] - 1
+    if change > 0:
+        return volume[i], 0.0
+    if change < 0:
+        return 0.0, volume[i]
+    return 0.0, 0.0
+
+
+@njit(cache=True, error_model="numpy")
+def _volume_ratio(close: np.ndarray, volume: np.ndarray, period: int, out: np.ndarray) -> None:
+    """Rolling mean up-day volume over (rolling mean down-day volume + 1).
+
+    Both sides are running sums updated as a bar enters and leaves the window,
+    so no per-side volume series is materialized. NaN volume on an up or down
+    day poisons that side's window, as the pandas rolling mean does.
+    """
+    n = len(close)
+    up_total = 0.0
+    down_total = 0.0
+    up_nans = 0
+    down_nans = 0
+    for i in range(n):
+        up, down = _split_volume(close, volume, i)
+        if np.isnan(up):
+            up_nans += 1
+        else:
+            up_total += up
+        if np.isnan(down):
+            down_nans += 1
+        else:
+            down_total += down
+        if i >= period:
+            up, down = _split_volume(close, volume, i - period)
+            if np.isnan(up):
+                up_nans -= 1
+            else:
+                up_total -= up
+            if np.isnan(down):
+                down_nans -= 1
+            else:
+                down_total -= down
+        if i < period - 1 or up_nans or down_nans:
+            out[i] = np.nan
+        else:
+            out[i] = (up_total / period) / (down_total / period + 1)  # +1 avoids division by zero
+
+
+@njit(cache=True, error_model="numpy")
+def _canslim_kernel(close: np.ndarray, volume: np.ndarray, out: np.ndarray) -> None:
+    """Fill ``out`` (one row per _TECHNICAL_COLUMNS entry) without touching pandas."""
+    n = len(close)
+    high_20 = np.empty(n)
+    _dual_rolling_max(close, 20, 252, high_20, out[0])
+    if n > 0:
+        out[1, 0] = np.nan
+        out[1, 1:] = high_20[:-1]  # yesterday's 20-day high
+    _dual_rolling_mean(close, 50, 200, out[2], out[3])
+    _volume_ratio(close, volume, 20, out[4])
+    _rolling_mean(volume, 50, out[5])
+
+
+@njit(parallel=True, cache=True)
+def _canslim_rows(close: np.ndarray, volume: np.ndarray, out: np.ndarray) -> None:
+    """_canslim_kernel over (symbols x bars) arrays, one symbol per thread."""
+    for row in prange(close.shape[0]):
+        _canslim_kernel(close[row], volume[row], out[row])
+
+
+def _tier_score(values, upper: float, lower: float) -> np.ndarray:
+    """Score 2 at or above ``upper``, 1 from ``lower`` up to it, else 0 (NaN scores 0)."""
+    values = np.asarray(values, dtype=np.float64)
+    # One pass bucketing: 0 below lower, 1 in [lower, upper), 2 at or above upper
+    points = np.digitize(values, (lower, upper)).astype(np.int8)
+    points[np.isnan(values)] = 0  # digitize sorts NaN past the last edge
+    return points
+
+
+def _lite_signals(close: np.ndarray, volume: np.ndarray, technicals: np.ndarray, min_score: int) -> np.ndarray:
+    """
+    CANSLIM Lite signals for (symbols x bars) arrays.
+    
+    ``technicals`` is the (symbols x _TECHNICAL_COLUMNS x bars) output of
+    _canslim_rows. Returns int64 signals: 1 (buy), -1 (sell), 0 (hold).
+    """
+    high_252, resistance_20, sma_50, sma_200, vol_ratio, avg_volume_50 = (
+        technicals[:, k] for k in range(len(_TECHNICAL_COLUMNS))
+    )
+    
+    # N — New High (0-2 points)
+    pct_from_high = close / high_252
+    n_score = _tier_score(pct_from_high, 0.95, 0.90)
+    
+    # L — Leader / Momentum (0-2 points), 6-month rate of change
+    momentum = _roc_values(close, 126)
+    l_score = _tier_score(momentum, 25, 10)
+    
+    # S — Supply/Demand (0-2 points)
+    s_score = _tier_score(vol_ratio, 2.0, 1.5)
+    
+    # M — Market Direction (gate)
+    market_healthy = (close > sma_50) & (close > sma_200)
+    
+    # Total score (max 6)
+    total_score = n_score + l_score + s_score
+    
+    # Entry
+    breakout = close > resistance_20
+    volume_surge = volume > avg_volume_50 * 1.5
+    
+    buy_condition = (
+        (total_score >= min_score) &
+        market_healthy &
+        breakout &
+        volume_surge
+    )
+    
+    # Exit
+    sell_condition = close < sma_50
+    
+    signals = np.zeros(close.shape, dtype=np.int64)
+    signals[buy_condition] = 1
+    signals[sell_condition] = -1
+    return signals
+
+
+def _canslim_technicals(close: pd.Series, volume: pd.Series) -> Dict[str, pd.Series]:
+    """Rolling highs, moving averages and the up/down volume ratio in one compiled call."""
+    out = np.empty((len(_TECHNICAL_COLUMNS), len(close)))
+    _canslim_kernel(close.to_numpy(dtype=np.float64), volume.to_numpy(dtype=np.float64), out)
+    return {name: pd.Series(row, index=close.index) for name, row in zip(_TECHNICAL_COLUMNS, out)}
 
 
 class CANSLIMStrategy(Strategy):
@@ -101,11 +300,26 @@ class CANSLIMStrategy(Strategy):
         Call this before running the backtest.
         """
         self.symbol = symbol
-        self.fundamentals = self.fundamentals_fetcher.get_fundamentals(symbol)
-        self.fundamental_scores = self.fundamentals_fetcher.score_canslim_fundamentals(
-            self.fundamentals
+        self.fundamentals, self.fundamental_scores = _fetch_and_score(
+            self.fundamentals_fetcher, symbol
         )
     
+    @property
+    def fundamental_scores(self) -> Optional[Dict]:
+        return self._fundamental_scores
+    
+    @fundamental_scores.setter
+    def fundamental_scores(self, scores: Optional[Dict]):
+        # Resolve the per-factor points once here rather than on every
+        # generate_signals call (parameter sweeps rerun it many times).
+        self._fundamental_scores = scores
+        scores = scores or {}
+        self._c_score = scores.get('C', 0)
+        self._a_score = scores.get('A', 0)
+        self._i_score = scores.get('I', 0)
+        self._s_fund_score = scores.get('S', 0)
+        self._fund_sum_ex_s = self._c_score + self._a_score + self._i_score
+    
     def generate_signals(
         self,
         data: pd.DataFrame,
@@ -131,45 +345,41 @@ class CANSLIMStrategy(Strategy):
         # TECHNICAL FACTORS (calculated daily)
         # =====================================================================
         
+        technicals = _canslim_technicals(close, volume)
+        
         # N — New High (proximity to 52-week high)
-        rolling_high = close.rolling(252).max()
+        rolling_high = technicals['high_252']
         pct_from_high = (close / rolling_high)
-        n_score = pd.Series(0, index=data.index)
-        n_score[pct_from_high >= 0.95] = 2  # Within 5% of high
-        n_score[(pct_from_high >= 0.90) & (pct_from_high < 0.95)] = 1
+        n_score = _tier_score(pct_from_high, 0.95, 0.90)  # 2 within 5% of high, 1 within 10%
         
         # L — Leader (Relative Strength)
+        close_arr = close.to_numpy(dtype=np.float64)
         if benchmark is not None:
-            rs = relative_strength(close, benchmark['close'], self.rs_period)
-            l_score = pd.Series(0, index=data.index)
-            l_score[rs >= 1.2] = 2   # Outperforming by 20%+
-            l_score[(rs >= 1.1) & (rs < 1.2)] = 1  # Outperforming by 10-20%
+            bench_close = benchmark['close']
+            if self.rs_period >= 1 and bench_close.index.equals(close.index):
+                rs = _relative_strength_values(
+                    close_arr, bench_close.to_numpy(dtype=np.float64), self.rs_period
+                )
+            else:
+                # Differently dated benchmark: label-align the ratio onto our bars
+                rs = relative_strength(close, bench_close, self.rs_period).reindex(close.index)
+            l_score = _tier_score(rs, 1.2, 1.1)  # 2 when outperforming by 20%+, 1 by 10-20%
         else:
             # Without benchmark, use price momentum as proxy
-            momentum = rate_of_change(close, 252)
-            l_score = pd.Series(0, index=data.index)
-            l_score[momentum >= 30] = 2  # Up 30%+ in a year
-            l_score[(momentum >= 15) & (momentum < 30)] = 1
+            momentum = _roc_values(close_arr, 252)
+            l_score = _tier_score(momentum, 30, 15)  # 2 when up 30%+ in a year, 1 when up 15-30%
         
         # S — Supply/Demand (volume patterns)
         # Up days should have higher volume than down days
-        daily_return = close.pct_change()
-        up_volume = volume.where(daily_return > 0, 0)
-        down_volume = volume.where(daily_return < 0, 0)
-        
-        # 20-day average up volume vs down volume
-        avg_up_vol = up_volume.rolling(20).mean()
-        avg_down_vol = down_volume.rolling(20).mean()
-        vol_ratio = avg_up_vol / (avg_down_vol + 1)  # +1 to avoid division by zero
+        # 20-day average up volume vs down volume (+1 on the denominator)
+        vol_ratio = technicals['volume_ratio_20']
         
-        s_volume_score = pd.Series(0, index=data.index)
-        s_volume_score[vol_ratio >= 1.5] = 1  # Strong accumulation
-        s_volume_score[vol_ratio >= 2.0] = 2  # Very strong accumulation
+        s_volume_score = _tier_score(vol_ratio, 2.0, 1.5)  # 2 very strong, 1 strong accumulation
         
         # M — Market Direction (simple trend filter)
         # Market is "healthy" if above 50-day and 200-day SMA
-        sma_50 = sma(close, 50)
-        sma_200 = sma(close, 200)
+        sma_50 = technicals['sma_50']
+        sma_200 = technicals['sma_200']
         market_healthy = (close > sma_50) & (close > sma_200)
         
         # =====================================================================
@@ -177,29 +387,26 @@ class CANSLIMStrategy(Strategy):
         # =====================================================================
         
         # Fundamental scores (constant for all dates in this simple version)
+        # are resolved once when fundamental_scores is assigned.
         # In a more sophisticated version, we'd use point-in-time fundamentals
-        c_score = self.fundamental_scores.get('C', 0) if self.fundamental_scores else 0
-        a_score = self.fundamental_scores.get('A', 0) if self.fundamental_scores else 0
-        i_score = self.fundamental_scores.get('I', 0) if self.fundamental_scores else 0
-        s_fund_score = self.fundamental_scores.get('S', 0) if self.fundamental_scores else 0
         
         # Total S score = fundamental (float size) + technical (volume)
         # Cap at 2 points max
-        s_total = np.minimum(s_fund_score + s_volume_score, 2)
+        s_total = np.minimum(self._s_fund_score + s_volume_score, 2)
         
-        # Total score for each day
-        total_score = c_score + a_score + n_score + s_total + l_score + i_score
+        # Total score for each day: C + A + I folded into one constant
+        total_score = self._fund_sum_ex_s + n_score + s_total + l_score
         
         # =====================================================================
         # ENTRY CONDITIONS
         # =====================================================================
         
         # Breakout detection: price crossing above recent resistance
-        resistance = close.rolling(20).max().shift(1)
+        resistance = technicals['resistance_20']
         breakout = close > resistance
         
         # Volume confirmation: volume should be higher than average
-        avg_volume = volume.rolling(50).mean()
+        avg_volume = technicals['avg_volume_50']
         volume_surge = volume > (avg_volume * 1.5)
         
         # BUY when:
@@ -234,17 +441,19 @@ class CANSLIMStrategy(Strategy):
         signals[buy_condition] = 1
         signals[sell_condition] = -1
         
-        # Store scores for analysis
-        self._scores = pd.DataFrame({
-            'C': c_score,
-            'A': a_score,
+        # Keep the score columns for analysis; get_current_scores() builds the
+        # DataFrame only if someone asks, so backtest loops don't pay for it.
+        self._score_columns = ({
+            'C': self._c_score,
+            'A': self._a_score,
             'N': n_score,
             'S': s_total,
             'L': l_score,
-            'I': i_score,
+            'I': self._i_score,
             'Total': total_score,
             'Market_Healthy': market_healthy,
-        }, index=data.index)
+        }, data.index)
+        self._scores = None
         
         return signals
     
@@ -256,7 +465,10 @@ class CANSLIMStrategy(Strategy):
     
     def get_current_scores(self) -> pd.DataFrame:
         """Get the detailed scores DataFrame (after running generate_signals)."""
-        return self._scores if hasattr(self, '_scores') else None
+        if getattr(self, '_scores', None) is None and hasattr(self, '_score_columns'):
+            columns, index = self._score_columns
+            self._scores = pd.DataFrame(columns, index=index)
+        return getattr(self, '_scores', None)
     
     def describe(self) -> str:
         """Return a human-readable description."""
@@ -325,62 +537,30 @@ class CANSLIMLite(Strategy):
     
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """Generate signals using only technical factors."""
-        close = data['close']
-        volume = data['volume']
-        
-        signals = pd.Series(0, index=data.index)
-        
-        # N — New High (0-2 points)
-        rolling_high = close.rolling(252).max()
-        pct_from_high = close / rolling_high
-        n_score = pd.Series(0, index=data.index)
-        n_score[pct_from_high >= 0.95] = 2
-        n_score[(pct_from_high >= 0.90) & (pct_from_high < 0.95)] = 1
-        
-        # L — Leader / Momentum (0-2 points)
-        momentum = rate_of_change(close, 126)  # 6-month momentum
-        l_score = pd.Series(0, index=data.index)
-        l_score[momentum >= 25] = 2
-        l_score[(momentum >= 10) & (momentum < 25)] = 1
-        
-        # S — Supply/Demand (0-2 points)
-        daily_return = close.pct_change()
-        up_volume = volume.where(daily_return > 0, 0)
-        down_volume = volume.where(daily_return < 0, 0)
-        avg_up_vol = up_volume.rolling(20).mean()
-        avg_down_vol = down_volume.rolling(20).mean()
-        vol_ratio = avg_up_vol / (avg_down_vol + 1)
-        
-        s_score = pd.Series(0, index=data.index)
-        s_score[vol_ratio >= 1.5] = 1
-        s_score[vol_ratio >= 2.0] = 2
-        
-        # M — Market Direction (gate)
-        sma_50 = sma(close, 50)
-        sma_200 = sma(close, 200)
-        market_healthy = (close > sma_50) & (close > sma_200)
-        
-        # Total score (max 6)
-        total_score = n_score + l_score + s_score
-        
-        # Entry
-        breakout = close > close.rolling(20).max().shift(1)
-        volume_surge = volume > volume.rolling(50).mean() * 1.5
+        signals = self.generate_signals_batch(data[['close']], data[['volume']].set_axis(['close'], axis=1))
+        return signals['close'].rename(None)
+    
+    def generate_signals_batch(self, closes: pd.DataFrame, volumes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Generate signals for many symbols at once.
         
-        buy_condition = (
-            (total_score >= self.min_score) &
-            market_healthy &
-            breakout &
-            volume_surge
-        )
+        Args:
+            closes: Close prices, one column per symbol (dates x symbols)
+            volumes: Volumes with the same layout (aligned to ``closes``)
         
-        # Exit
-        sell_condition = close < sma_50
+        Returns:
+            DataFrame of signals shaped like ``closes``: 1 (buy), -1 (sell), 0 (hold)
+        """
+        volumes = volumes.reindex(index=closes.index, columns=closes.columns)
+        close = np.ascontiguousarray(closes.to_numpy(dtype=np.float64).T)
+        volume = np.ascontiguousarray(volumes.to_numpy(dtype=np.float64).T)
         
-        signals[buy_condition] = 1
-        signals[sell_condition] = -1
+        # Rolling highs, SMAs and volume ratio for every symbol in parallel
+        technicals = np.empty((close.shape[0], len(_TECHNICAL_COLUMNS), close.shape[1]))
+        _canslim_rows(close, volume, technicals)
         
-        return signals
+        signals = _lite_signals(close, volume, technicals, self.min_score)
+        return pd.DataFrame(signals.T, index=closes.index, columns=closes.columns)
     
     def should_use_stop_loss(self) -> bool:
         return True
@@ -413,27 +593,19 @@ class CANSLIMLite(Strategy):
 # =============================================================================
 
 if __name__ == "__main__":
+    from strategies._demo_data import demo_ohlcv, demos_disabled
+
+    if demos_disabled():
+        sys.exit(0)
+
     print("=== Testing CANSLIM Strategy ===\n")
     
     # Test CANSLIM Lite first (no fundamentals needed)
     strategy = CANSLIMLite()
     print(strategy.describe())
     
-    # Create sample data
-    np.random.seed(42)
-    dates = pd.date_range('2023-01-01', periods=300, freq='D')
-    
-    # Simulate trending stock
-    trend = np.cumsum(np.random.randn(300) * 0.02 + 0.002)
-    prices = 100 * np.exp(trend)
-    
-    data = pd.DataFrame({
-        'open': prices * (1 + np.random.randn(300) * 0.005),
-        'high': prices * (1 + np.abs(np.random.randn(300)) * 0.01),
-        'low': prices * (1 - np.abs(np.random.randn(300)) * 0.01),
-        'close': prices,
-        'volume': np.random.randint(1000000, 5000000, 300),
-    }, index=dates)
+    # Sample data: simulated trending stock
+    data = demo_ohlcv(n=300, seed=42, start='2023-01-01', drift=0.002, log_returns=True)
     
     signals = strategy.generate_signals(data)
     
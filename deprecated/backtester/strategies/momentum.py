@@ -42,15 +42,129 @@ Why these rules?
 
 import pandas as pd
 import numpy as np
-from typing import Optional
+import math
+from collections import deque
+from typing import Dict, Iterable, Optional, Union
 
 # Import from parent directory
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from numba_compat import njit, prange
 from strategies.base import Strategy
-from indicators import sma, ema, rsi, crossover, crossunder
+from indicators import _ewm_mean, _ewm_update, _rolling_mean, _rsi_kernel
+
+
+def _close_array(data) -> np.ndarray:
+    """Contiguous float64 closes from an OHLCV DataFrame or an array of closes."""
+    close = data['close'] if isinstance(data, pd.DataFrame) else data
+    return np.ascontiguousarray(np.asarray(close, dtype=np.float64))
+
+
+@njit(cache=True)
+def _bar_signal(
+    close: float,
+    trend_ma: float,
+    spread_prev: float,
+    spread: float,
+    rsi_now: float,
+    rsi_oversold: float,
+    rsi_overbought: float,
+    rsi_exit: float,
+) -> int:
+    """Signal for one bar given fast - slow on this bar and the previous one."""
+    # Crossings from the sign of fast - slow on consecutive bars, combined
+    # with bitwise & so near-zero spreads don't cost a mispredicted branch
+    crossed_up = (spread_prev <= 0.0) & (spread > 0.0)
+    crossed_down = (spread_prev >= 0.0) & (spread < 0.0)
+    signal = 0
+    if crossed_up and rsi_oversold <= rsi_now <= rsi_overbought and close > trend_ma:
+        signal = 1
+    if crossed_down or rsi_now > rsi_exit:
+        signal = -1  # sells override buys on the same bar
+    return signal
+
+
+@njit(cache=True)
+def _momentum_rules(
+    close: np.ndarray,
+    fast_ma: np.ndarray,
+    slow_ma: np.ndarray,
+    trend_ma: np.ndarray,
+    rsi_values: np.ndarray,
+    rsi_oversold: float,
+    rsi_overbought: float,
+    rsi_exit: float,
+    out: np.ndarray,
+) -> None:
+    """Apply the entry/exit rules bar by bar; NaN inputs fail every test, as in pandas."""
+    spread_prev = np.nan  # no crossing on the first bar
+    for i in range(len(close)):
+        spread = fast_ma[i] - slow_ma[i]
+        out[i] = _bar_signal(
+            close[i], trend_ma[i], spread_prev, spread, rsi_values[i],
+            rsi_oversold, rsi_overbought, rsi_exit,
+        )
+        spread_prev = spread
+
+
+@njit(cache=True)
+def _momentum_signals_kernel(
+    close: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    trend_period: int,
+    rsi_period: int,
+    use_ema: bool,
+    rsi_oversold: float,
+    rsi_overbought: float,
+    rsi_exit: float,
+    out: np.ndarray,
+) -> None:
+    """Indicators plus rules in one compiled call; parameters arrive as plain scalars."""
+    n = len(close)
+    slow_ma = np.empty(n)
+    if use_ema:
+        _ewm_mean(close, 2.0 / (slow_period + 1.0), slow_ma)
+    else:
+        _rolling_mean(close, slow_period, slow_ma)
+    # Equal periods (common in parameter sweeps) reuse the same average
+    if fast_period == slow_period:
+        fast_ma = slow_ma
+    else:
+        fast_ma = np.empty(n)
+        if use_ema:
+            _ewm_mean(close, 2.0 / (fast_period + 1.0), fast_ma)
+        else:
+            _rolling_mean(close, fast_period, fast_ma)
+    if trend_period == slow_period and not use_ema:
+        trend_ma = slow_ma
+    else:
+        trend_ma = np.empty(n)
+        _rolling_mean(close, trend_period, trend_ma)
+    rsi_values = np.empty(n)
+    _rsi_kernel(close, rsi_period, rsi_values)
+    _momentum_rules(
+        close, fast_ma, slow_ma, trend_ma, rsi_values, rsi_oversold, rsi_overbought, rsi_exit, out
+    )
+
+
+@njit(parallel=True, cache=True)
+def _momentum_param_rows(close: np.ndarray, params: np.ndarray, out: np.ndarray) -> None:
+    """_momentum_signals_kernel for each parameter row (see _BATCH_PARAMS), one per thread."""
+    for row in prange(params.shape[0]):
+        p = params[row]
+        _momentum_signals_kernel(
+            close, int(p[0]), int(p[1]), int(p[2]), int(p[3]), p[4] != 0.0, p[5], p[6], p[7], out[row]
+        )
+
+
+# Column order of the parameter matrix handed to _momentum_param_rows.
+_BATCH_PARAMS = (
+    'fast_period', 'slow_period', 'trend_period', 'rsi_period',
+    'use_ema', 'rsi_oversold', 'rsi_overbought', 'rsi_exit',
+)
 
 
 class MomentumStrategy(Strategy):
@@ -115,8 +229,24 @@ class MomentumStrategy(Strategy):
         self.rsi_exit = rsi_exit
         self.use_ema = use_ema
         self._stop_loss_pct = stop_loss_pct
+        
+        # describe() output, keyed by the parameters it was rendered from
+        self._description_key = None
+        self._description = ""
+    
+    def required_indicators(self) -> Dict:
+        """Moving averages and RSI used by generate_signals (compute_suite spec)."""
+        # Fast and slow moving averages are for crossover signals: EMA reacts
+        # faster to price changes, SMA is smoother, less reactive.
+        ma_kind = 'ema' if self.use_ema else 'sma'
+        spec = {ma_kind: [self.fast_period, self.slow_period], 'rsi': self.rsi_period}
+        # Trend filter: only trade in direction of larger trend
+        spec['sma'] = spec.get('sma', []) + [self.trend_period]
+        return spec
     
-    def generate_signals(self, data: pd.DataFrame) -> pd.Series:
+    def generate_signals(
+        self, data: Union[pd.DataFrame, np.ndarray], indicators: Optional[Dict] = None
+    ) -> pd.Series:
         """
         Generate buy/sell signals based on momentum rules.
         
@@ -125,83 +255,105 @@ class MomentumStrategy(Strategy):
         
         Args:
             data: DataFrame with columns: open, high, low, close, volume
-                  Index should be datetime
+                  Index should be datetime. A 1-D array of closes is also
+                  accepted (skips the DataFrame lookup; result gets a RangeIndex)
+            indicators: Optional precomputed compute_suite() results covering
+                  required_indicators() (e.g. shared across compared strategies)
         
         Returns:
             Series of signals: 1 (buy), -1 (sell), 0 (hold)
         """
         # Get the closing prices (most common price used for signals)
-        close = data['close']
-        
-        # =====================================================================
-        # STEP 1: Calculate the indicators we need
-        # =====================================================================
+        close = _close_array(data)
+        signals = np.empty(len(close), dtype=np.int8)
         
-        # Fast and slow moving averages (for crossover signals)
-        if self.use_ema:
-            # EMA reacts faster to price changes
-            fast_ma = ema(close, self.fast_period)
-            slow_ma = ema(close, self.slow_period)
+        # BUY (1) when ALL hold:
+        #   - fast MA crosses above slow MA (short-term trend turning up)
+        #   - RSI is in the "goldilocks zone" [rsi_oversold, rsi_overbought]
+        #   - price is above the trend SMA (trading with the larger trend)
+        # SELL (-1) when ANY holds, overriding a same-day buy:
+        #   - fast MA crosses below slow MA (short-term trend turning down)
+        #   - RSI above rsi_exit (take profits, the stock ran too far too fast)
+        if indicators is None:
+            # Indicators and rules run in one compiled kernel over the closes
+            if min(self.fast_period, self.slow_period, self.trend_period, self.rsi_period) < 1:
+                raise ValueError("period must be >= 1")
+            _momentum_signals_kernel(
+                close,
+                int(self.fast_period),
+                int(self.slow_period),
+                int(self.trend_period),
+                int(self.rsi_period),
+                bool(self.use_ema),
+                float(self.rsi_oversold),
+                float(self.rsi_overbought),
+                float(self.rsi_exit),
+                signals,
+            )
         else:
-            # SMA is smoother, less reactive
-            fast_ma = sma(close, self.fast_period)
-            slow_ma = sma(close, self.slow_period)
+            # The caller already computed required_indicators(); only apply the rules
+            ma_kind = 'ema' if self.use_ema else 'sma'
+            
+            def column(key: str) -> np.ndarray:
+                return np.ascontiguousarray(indicators[key].to_numpy(dtype=np.float64))
+            
+            _momentum_rules(
+                close,
+                column(f'{ma_kind}_{self.fast_period}'),
+                column(f'{ma_kind}_{self.slow_period}'),
+                column(f'sma_{self.trend_period}'),
+                column(f'rsi_{self.rsi_period}'),
+                float(self.rsi_oversold),
+                float(self.rsi_overbought),
+                float(self.rsi_exit),
+                signals,
+            )
         
-        # Trend filter: only trade in direction of larger trend
-        trend_ma = sma(close, self.trend_period)
-        
-        # RSI: momentum oscillator
-        rsi_values = rsi(close, self.rsi_period)
-        
-        # =====================================================================
-        # STEP 2: Define entry conditions (when to BUY)
-        # =====================================================================
-        
-        # Condition 1: Fast MA crosses above slow MA (bullish crossover)
-        # This indicates the short-term trend is turning up
-        ma_crossover = crossover(fast_ma, slow_ma)
-        
-        # Condition 2: RSI is in the "goldilocks zone" — not overbought, not oversold
-        # We want momentum, but not chasing a stock that's already run too far
-        rsi_ok = (rsi_values >= self.rsi_oversold) & (rsi_values <= self.rsi_overbought)
-        
-        # Condition 3: Price is above the trend MA (we're in an uptrend)
-        # This keeps us trading with the larger trend, not against it
-        above_trend = close > trend_ma
-        
-        # BUY signal: ALL conditions must be true
-        buy_signal = ma_crossover & rsi_ok & above_trend
-        
-        # =====================================================================
-        # STEP 3: Define exit conditions (when to SELL)
-        # =====================================================================
-        
-        # Condition 1: Fast MA crosses below slow MA (bearish crossover)
-        # The short-term trend is turning down — time to exit
-        ma_crossunder = crossunder(fast_ma, slow_ma)
-        
-        # Condition 2: RSI is extremely overbought
-        # Take profits — the stock has run too far too fast
-        rsi_overbought_exit = rsi_values > self.rsi_exit
-        
-        # SELL signal: ANY exit condition triggers a sell
-        sell_signal = ma_crossunder | rsi_overbought_exit
-        
-        # =====================================================================
-        # STEP 4: Combine into signal series
-        # =====================================================================
-        
-        # Start with zeros (hold)
-        signals = pd.Series(0, index=data.index)
+        return pd.Series(signals, index=getattr(data, 'index', None))
+    
+    @staticmethod
+    def generate_signals_batch(data: Union[pd.DataFrame, np.ndarray], params: Iterable[Dict]) -> np.ndarray:
+        """
+        Generate signals for many parameter sets over the same price data.
         
-        # Set buy signals
-        signals[buy_signal] = 1
+        Each parameter set runs the same kernel as generate_signals, in
+        parallel across sets, with no per-candidate Series allocation.
         
-        # Set sell signals (these override buy if both happen on same day)
-        signals[sell_signal] = -1
+        Args:
+            data: DataFrame with a close column, or a 1-D array of closes
+            params: Dicts of MomentumStrategy constructor arguments; missing
+                  keys take the constructor defaults
         
+        Returns:
+            int8 array of shape (len(params), len(data)), one signal row per set
+        """
+        candidates = [MomentumStrategy(**p) for p in params]
+        grid = np.array(
+            [[float(getattr(c, name)) for name in _BATCH_PARAMS] for c in candidates],
+            dtype=np.float64,
+        ).reshape(len(candidates), len(_BATCH_PARAMS))
+        if len(grid) and grid[:, :4].min() < 1:
+            raise ValueError("period must be >= 1")
+        close = _close_array(data)
+        signals = np.empty((len(grid), len(close)), dtype=np.int8)
+        _momentum_param_rows(close, grid, signals)
         return signals
     
+    def get_online(self, data: Union[pd.DataFrame, np.ndarray, None] = None) -> 'MomentumOnline':
+        """
+        Return a MomentumOnline for live updates, primed with ``data`` if given.
+        
+        Priming replays the history once (O(N)); every update() after that
+        is O(1) per bar.
+        """
+        if min(self.fast_period, self.slow_period, self.trend_period, self.rsi_period) < 1:
+            raise ValueError("period must be >= 1")
+        online = MomentumOnline(self)
+        if data is not None:
+            for close in _close_array(data):
+                online.update(close)
+        return online
+    
     def should_use_stop_loss(self) -> bool:
         """Enable stop-loss for this strategy."""
         return True
@@ -214,8 +366,21 @@ class MomentumStrategy(Strategy):
         """
         Return a human-readable description of the strategy.
         
-        Useful for logging and understanding what the strategy does.
+        Useful for logging and understanding what the strategy does. The text
+        is rendered once and reused until a parameter attribute changes.
         """
+        key = (
+            self.fast_period, self.slow_period, self.trend_period, self.rsi_period,
+            self.rsi_oversold, self.rsi_overbought, self.rsi_exit, self.use_ema,
+            self._stop_loss_pct,
+        )
+        if key != self._description_key:
+            self._description = self._build_description()
+            self._description_key = key
+        return self._description
+    
+    def _build_description(self) -> str:
+        """Render the describe() box from the current parameters."""
         ma_type = "EMA" if self.use_ema else "SMA"
         return f"""
 ╔══════════════════════════════════════════════════════════════╗
@@ -289,27 +454,131 @@ class ConservativeMomentum(MomentumStrategy):
 
 
 # =============================================================================
-# TEST THE STRATEGY
+# ONLINE SIGNALS (live trading: one bar at a time)
 # =============================================================================
 
-if __name__ == "__main__":
-    print("=== Testing Momentum Strategy ===\n")
+class _OnlineSMA:
+    """Running-sum SMA over a ring of the last ``period`` values (see _rolling_mean)."""
     
-    # Create sample data
-    np.random.seed(42)
-    dates = pd.date_range('2024-01-01', periods=200, freq='D')
+    def __init__(self, period: int):
+        self.period = period
+        self.window = deque()
+        self.total = 0.0
+        self.nan_count = 0
     
-    # Generate realistic-ish price data (random walk with drift)
-    returns = np.random.randn(200) * 0.02 + 0.0005  # 2% daily vol, slight upward drift
-    prices = 100 * np.cumprod(1 + returns)
+    def update(self, value: float) -> float:
+        # Same operation order as _rolling_mean, so values match bit for bit
+        if math.isnan(value):
+            self.nan_count += 1
+        else:
+            self.total += value
+        if len(self.window) == self.period:
+            leaving = self.window.popleft()
+            if math.isnan(leaving):
+                self.nan_count -= 1
+            else:
+                self.total -= leaving
+        self.window.append(value)
+        if len(self.window) < self.period or self.nan_count:
+            return np.nan
+        return self.total / self.period
+
+
+class _OnlineEMA:
+    """``ewm(span=period, adjust=False).mean()`` one value at a time."""
+    
+    def __init__(self, period: int):
+        self.alpha = 2.0 / (period + 1.0)
+        self.state = np.array([np.nan, 1.0, self.alpha])
     
-    data = pd.DataFrame({
-        'open': prices * (1 + np.random.randn(200) * 0.005),
-        'high': prices * (1 + np.abs(np.random.randn(200)) * 0.01),
-        'low': prices * (1 - np.abs(np.random.randn(200)) * 0.01),
-        'close': prices,
-        'volume': np.random.randint(1000000, 5000000, 200),
-    }, index=dates)
+    def update(self, value: float) -> float:
+        return float(_ewm_update(self.state, value, self.alpha))
+
+
+class _OnlineRSI:
+    """Wilder RSI one price at a time; the state of _rsi_kernel between bars."""
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.decay = 1.0 - 1.0 / period
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.old_weight = 1.0
+        self.prev = np.nan
+        self.count = 0
+    
+    def update(self, price: float) -> float:
+        delta = price - self.prev if self.count else 0.0
+        if math.isnan(delta):
+            delta = 0.0
+        magnitude = abs(delta)
+        gain = 0.5 * (delta + magnitude)
+        loss = 0.5 * (magnitude - delta)
+        if self.count:
+            self.old_weight *= self.decay
+            if self.avg_gain != gain:
+                self.avg_gain = (self.old_weight * self.avg_gain + gain) / (self.old_weight + 1.0)
+            if self.avg_loss != loss:
+                self.avg_loss = (self.old_weight * self.avg_loss + loss) / (self.old_weight + 1.0)
+            self.old_weight += 1.0
+        self.prev = price
+        self.count += 1
+        if self.count < self.period:
+            return np.nan
+        return 100.0 - 100.0 / (1.0 + self.avg_gain / (self.avg_loss + 1e-10))
+
+
+class MomentumOnline:
+    """
+    Momentum signals for a live feed, one new close at a time.
+    
+    generate_signals recomputes every indicator over the full history, which
+    is O(N) per new bar. This keeps the running state instead (SMA ring
+    buffers, EMA and Wilder RSI recurrences), so update() is O(1) and returns
+    the same signal generate_signals would give for that bar.
+    
+    Usage:
+        online = strategy.get_online(history)   # prime with past bars
+        signal = online.update(latest_close)    # 1 / -1 / 0 per new bar
+    """
+    
+    def __init__(self, strategy: 'MomentumStrategy'):
+        ma = _OnlineEMA if strategy.use_ema else _OnlineSMA
+        self.fast_ma = ma(int(strategy.fast_period))
+        self.slow_ma = ma(int(strategy.slow_period))
+        self.trend_ma = _OnlineSMA(int(strategy.trend_period))
+        self.rsi = _OnlineRSI(int(strategy.rsi_period))
+        self.rsi_oversold = float(strategy.rsi_oversold)
+        self.rsi_overbought = float(strategy.rsi_overbought)
+        self.rsi_exit = float(strategy.rsi_exit)
+        self.spread_prev = np.nan  # no crossing on the first bar
+    
+    def update(self, close: float) -> int:
+        """Feed the next close and return its signal: 1 (buy), -1 (sell), 0 (hold)."""
+        close = float(close)
+        spread = self.fast_ma.update(close) - self.slow_ma.update(close)
+        signal = _bar_signal(
+            close, self.trend_ma.update(close), self.spread_prev, spread, self.rsi.update(close),
+            self.rsi_oversold, self.rsi_overbought, self.rsi_exit,
+        )
+        self.spread_prev = spread
+        return int(signal)
+
+
+# =============================================================================
+# TEST THE STRATEGY
+# =============================================================================
+
+if __name__ == "__main__":
+    from strategies._demo_data import demo_ohlcv, demos_disabled
+
+    if demos_disabled():
+        sys.exit(0)
+
+    # Sample data: random walk with drift (2% daily vol, slight upward drift)
+    data = demo_ohlcv(n=200, seed=42)
+
+    print("=== Testing Momentum Strategy ===\n")
     
     # Create strategy and generate signals
     strategy = MomentumStrategy()
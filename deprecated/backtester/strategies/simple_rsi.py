@@ -33,6 +33,7 @@ Think of it like a rubber band:
 """
 
 import pandas as pd
+import numpy as np
 import sys
 from pathlib import Path
 
@@ -103,20 +104,20 @@ class SimpleRSIStrategy(Strategy):
         """
         # Step 1: Calculate RSI
         # RSI looks at recent price changes and gives us a number 0-100
-        rsi_values = rsi(data['close'], self.rsi_period)
+        rsi_values = rsi(data['close'], self.rsi_period).to_numpy()
         
-        # Step 2: Start with all HOLD signals (0)
-        signals = pd.Series(0, index=data.index)
-        
-        # Step 3: Where RSI < 30, signal BUY (1)
+        # Step 2: Where RSI < 30, signal BUY (1)
         # Stock is oversold, might bounce back up
-        signals[rsi_values < self.buy_threshold] = 1
-        
-        # Step 4: Where RSI > 70, signal SELL (-1)
+        # Step 3: Where RSI > 70, signal SELL (-1)
         # Stock is overbought, might fall back down
-        signals[rsi_values > self.sell_threshold] = -1
+        # Step 4: Everything else (including NaN warm-up) is HOLD (0)
+        signals = np.where(
+            rsi_values > self.sell_threshold,
+            np.int8(-1),
+            np.where(rsi_values < self.buy_threshold, np.int8(1), np.int8(0)),
+        )
         
-        return signals
+        return pd.Series(signals, index=data.index)
 
 
 if __name__ == "__main__":
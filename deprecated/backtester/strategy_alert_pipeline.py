@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import io
+import json
 import os
 import re
 import warnings
 from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, fields
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Callable, TypeVar
 
 from advisor import TradingAdvisor
+from data.market_regime import MarketRegime, MarketStatus
 from evaluation.prediction_accuracy import persist_prediction_snapshot
 from readiness.buy_readiness import (
     apply_buy_readiness,
@@ -40,6 +45,73 @@ def run_quiet(fn: Callable[..., T], *args, **kwargs) -> T:
         return fn(*args, **kwargs)
 
 
+DEFAULT_MARKET_STATUS_CACHE_PATH = Path(".cache") / "alert_market_status.json"
+
+
+def _market_status_cache_path() -> Path:
+    return Path(
+        os.getenv("TRADING_ALERT_MARKET_STATUS_CACHE_PATH", str(DEFAULT_MARKET_STATUS_CACHE_PATH))
+    ).expanduser()
+
+
+def load_fresh_market_status(now: datetime | None = None) -> MarketStatus | None:
+    """Return the cached alert market status if it is healthy and within its TTL."""
+    ttl = float(os.getenv("TRADING_ALERT_MARKET_STATUS_TTL_SECONDS", "300") or 0)
+    if ttl <= 0:
+        return None
+    try:
+        payload = json.loads(_market_status_cache_path().read_text(encoding="utf-8"))
+        generated = datetime.fromisoformat(str(payload.get("generated_at", "")).replace("Z", "+00:00"))
+        if generated.tzinfo is None:
+            generated = generated.replace(tzinfo=UTC)
+        age_seconds = max(((now or datetime.now(UTC)) - generated).total_seconds(), 0.0)
+        if age_seconds > ttl:
+            return None
+        known = {field.name for field in fields(MarketStatus)}
+        cached = {key: value for key, value in (payload.get("market_status") or {}).items() if key in known}
+        cached["regime"] = MarketRegime(cached["regime"])
+        status = MarketStatus(**cached)
+    except Exception:
+        return None
+    if status.status != "ok":
+        return None
+    status.snapshot_age_seconds = float(status.snapshot_age_seconds or 0.0) + age_seconds
+    return status
+
+
+def write_market_status_cache(market: object) -> None:
+    """Persist a healthy live market status for the next alert run."""
+    if not isinstance(market, MarketStatus) or market.status != "ok":
+        return
+    market_status = asdict(market)
+    market_status["regime"] = market.regime.value
+    payload = {"generated_at": datetime.now(UTC).isoformat(), "market_status": market_status}
+    path = _market_status_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    except Exception:
+        return
+
+
+def get_alert_market_status(advisor: object) -> object:
+    """Market status for an alert run, reusing a recent healthy one when available.
+
+    Alert runners are launched back to back by the scheduler and each one
+    would otherwise recompute the market regime from scratch. A fresh cached
+    status is also handed to the advisor so per-symbol analysis uses it too.
+    """
+    cached = load_fresh_market_status()
+    if cached is not None:
+        prime = getattr(advisor, "prime_market_status", None)
+        if callable(prime):
+            prime(cached)
+        return cached
+    market = run_quiet(advisor.get_market_status, True)
+    write_market_status_cache(market)
+    return market
+
+
 def dedupe_reason(reason: str) -> str:
     reason = re.sub(r"\s+", " ", (reason or "").strip())
     return reason.rstrip(".")
@@ -53,3 +53,4 @@ def seed_buy_readiness_artifacts(tmp_path, monkeypatch):
     monkeypatch.setenv("BUY_READINESS_TEST_BYPASS", "1")
     monkeypatch.setenv("BUY_READINESS_MARKET_MAX_STALENESS_SECONDS", "999999")
     monkeypatch.setenv("BUY_DECISION_CALIBRATION_PATH", str(calibration_path))
+    monkeypatch.setenv("TRADING_ALERT_MARKET_STATUS_CACHE_PATH", str(tmp_path / "alert_market_status.json"))
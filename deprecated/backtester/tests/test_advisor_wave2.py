@@ -1,3 +1,4 @@
+import io
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta, UTC
@@ -208,6 +209,7 @@ def test_scan_for_opportunities_sorts_by_wave2_rank_score():
         }
 
     advisor.analyze_stock = _analysis
+    advisor.fundamentals.get_fundamentals_batch = MagicMock(return_value={})
 
     df = advisor.scan_for_opportunities(quick=True, min_score=6)
 
@@ -216,6 +218,51 @@ def test_scan_for_opportunities_sorts_by_wave2_rank_score():
     assert list(df["baseline_score"]) == [7.0, 8.0]
     assert list(df["enhanced_score"]) == [10.0, 8.5]
     assert list(df["tactical_score"]) == [10.75, 8.75]
+    advisor.fundamentals.get_fundamentals_batch.assert_called_once_with(["AAA", "BBB"])
+
+def test_analyze_stock_reuses_same_day_fundamentals_and_technicals():
+    advisor = TradingAdvisor()
+    closes = [100 + i * 0.5 for i in range(60)]
+    history = _history(closes, [1_000_000.0] * 60)
+
+    advisor.market_data.get_history = MagicMock(
+        return_value=SimpleNamespace(frame=history, source="test", staleness_seconds=0.0, status="ok")
+    )
+    advisor.fundamentals.get_fundamentals_batch = MagicMock(
+        return_value={"NVDA": {"eps_growth": 30, "revenue_growth": 25}}
+    )
+    advisor.fundamentals.get_fundamentals = MagicMock(return_value={"eps_growth": 5})
+    advisor.fundamentals.score_canslim_fundamentals = MagicMock(return_value={"C": 2, "A": 2, "I": 1, "S": 1})
+    advisor.get_market_status = MagicMock(return_value=_market())
+    advisor.headline_sentiment.analyze = MagicMock(
+        return_value={"sentiment": "UNAVAILABLE", "article_count": 0, "bearish_pct": 0.0, "bullish_pct": 0.0}
+    )
+    advisor._calculate_technical_score_from_history = MagicMock(
+        wraps=advisor._calculate_technical_score_from_history
+    )
+
+    advisor._prefetch_fundamentals(["NVDA"])
+    first = advisor.analyze_stock("NVDA", quiet=True, analysis_profile="bulk_scan")
+    second = advisor.analyze_stock("NVDA", quiet=True, analysis_profile="bulk_scan")
+
+    advisor.fundamentals.get_fundamentals.assert_not_called()
+    assert first["fundamentals"]["eps_growth"] == 30
+    assert second["technical_scores"] == first["technical_scores"]
+    assert advisor._calculate_technical_score_from_history.call_count == 1
+
+def test_analyze_stock_skips_fundamentals_when_history_is_insufficient():
+    advisor = TradingAdvisor()
+    history = _history([100 + i * 0.5 for i in range(20)])
+
+    advisor.market_data.get_history = MagicMock(
+        return_value=SimpleNamespace(frame=history, source="test", staleness_seconds=0.0, status="ok")
+    )
+    advisor.fundamentals.get_fundamentals = MagicMock(return_value={"eps_growth": 30})
+
+    analysis = advisor.analyze_stock("NVDA", quiet=True)
+
+    assert analysis == {"symbol": "NVDA", "error": "Insufficient data"}
+    advisor.fundamentals.get_fundamentals.assert_not_called()
 
 def test_scan_for_opportunities_prioritizes_buyable_candidates_over_abstaining_watchs():
     advisor = TradingAdvisor()
@@ -265,6 +312,7 @@ def test_scan_for_opportunities_prioritizes_buyable_candidates_over_abstaining_w
         }
 
     advisor.analyze_stock = _analysis
+    advisor.fundamentals.get_fundamentals_batch = MagicMock(return_value={})
 
     df = advisor.scan_for_opportunities(quick=True, min_score=6)
 
@@ -272,6 +320,41 @@ def test_scan_for_opportunities_prioritizes_buyable_candidates_over_abstaining_w
     assert list(df["action"]) == ["BUY", "WATCH"]
     assert list(df["abstain"]) == [False, True]
 
+def test_day_caches_survive_concurrent_misses():
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    advisor = TradingAdvisor()
+    today = advisor._trading_day()
+    yesterday = today - timedelta(days=1)
+    # Plenty of keys so every prune walks the caches for a while
+    for day, prefix in ((yesterday, "OLD"), (today, "KEEP")):
+        advisor._fund_cache.update({(f"{prefix}{i}", day): {} for i in range(5000)})
+        advisor._tech_cache.update({(f"{prefix}{i}", day): ((), {}) for i in range(5000)})
+    advisor.fundamentals.get_fundamentals = MagicMock(side_effect=lambda symbol: {"symbol": symbol})
+    advisor._calculate_technical_score_from_history = MagicMock(side_effect=lambda symbol, hist: {"symbol": symbol})
+    history = _history([100.0 + i for i in range(30)])
+    symbols = [f"S{i}" for i in range(256)]
+
+    def analyze(symbol):
+        return advisor._cached_fundamentals(symbol), advisor._cached_technical_score(symbol, history)
+
+    # Switch threads as often as possible so an unlocked insert lands mid-prune
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(analyze, symbols))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert [fund["symbol"] for fund, _tech in results] == symbols
+    assert [tech["symbol"] for _fund, tech in results] == symbols
+    expected_keys = {(symbol, today) for symbol in symbols} | {(f"KEEP{i}", today) for i in range(5000)}
+    assert set(advisor._fund_cache) == expected_keys
+    assert set(advisor._tech_cache) == expected_keys
+
+
 def test_get_recommendations_uses_buy_rows_in_trade_quality_order():
     advisor = TradingAdvisor()
     advisor.scan_for_opportunities = MagicMock(
@@ -283,25 +366,24 @@ def test_get_recommendations_uses_buy_rows_in_trade_quality_order():
             ]
         )
     )
-    advisor.analyze_stock = MagicMock(
-        side_effect=[
-            {
-                "symbol": "BBB",
-                "total_score": 8,
-                "recommendation": {"action": "BUY", "position_size_pct": 9.5},
-            },
-            {
-                "symbol": "AAA",
-                "total_score": 9,
-                "recommendation": {"action": "BUY", "position_size_pct": 4.0},
-            },
-        ]
-    )
+    analyses = {
+        "BBB": {
+            "symbol": "BBB",
+            "total_score": 8,
+            "recommendation": {"action": "BUY", "position_size_pct": 9.5},
+        },
+        "AAA": {
+            "symbol": "AAA",
+            "total_score": 9,
+            "recommendation": {"action": "BUY", "position_size_pct": 4.0},
+        },
+    }
+    advisor.analyze_stock = MagicMock(side_effect=lambda symbol, **_kwargs: analyses[symbol])
 
     recommendations = advisor.get_recommendations(limit=2)
 
     assert [item["symbol"] for item in recommendations] == ["BBB", "AAA"]
-    assert [call.args[0] for call in advisor.analyze_stock.call_args_list] == ["BBB", "AAA"]
+    assert sorted(call.args[0] for call in advisor.analyze_stock.call_args_list) == ["AAA", "BBB"]
 
 
 def test_get_recommendations_prefers_lower_downside_when_trade_quality_close():
@@ -309,17 +391,16 @@ def test_get_recommendations_prefers_lower_downside_when_trade_quality_close():
     advisor.scan_for_opportunities = MagicMock(
         return_value=pd.DataFrame(
             [
-                {"symbol": "AAA", "action": "BUY", "trade_quality_score": 88.0, "effective_confidence": 78, "uncertainty_pct": 8, "downside_penalty": 14.0, "churn_penalty": 4.0, "total_score": 9},
+                {"symbol": "AAA", "action": "BUY", "trade_quality_score": 87.0, "effective_confidence": 78, "uncertainty_pct": 8, "downside_penalty": 14.0, "churn_penalty": 4.0, "total_score": 9},
                 {"symbol": "BBB", "action": "BUY", "trade_quality_score": 87.0, "effective_confidence": 77, "uncertainty_pct": 8, "downside_penalty": 4.0, "churn_penalty": 2.0, "total_score": 8},
             ]
         )
     )
-    advisor.analyze_stock = MagicMock(
-        side_effect=[
-            {"symbol": "BBB", "total_score": 8, "recommendation": {"action": "BUY", "position_size_pct": 7.0}},
-            {"symbol": "AAA", "total_score": 9, "recommendation": {"action": "BUY", "position_size_pct": 4.0}},
-        ]
-    )
+    analyses = {
+        "BBB": {"symbol": "BBB", "total_score": 8, "recommendation": {"action": "BUY", "position_size_pct": 7.0}},
+        "AAA": {"symbol": "AAA", "total_score": 9, "recommendation": {"action": "BUY", "position_size_pct": 4.0}},
+    }
+    advisor.analyze_stock = MagicMock(side_effect=lambda symbol, **_kwargs: analyses[symbol])
 
     recommendations = advisor.get_recommendations(limit=2)
 
@@ -337,3 +418,32 @@ def test_sort_runtime_candidates_uses_lower_risk_penalties_as_tiebreakers():
     ranked = TradingAdvisor._sort_runtime_candidates(frame, primary_desc_columns=['trade_quality_score'])
 
     assert list(ranked['symbol']) == ['BBB', 'AAA']
+
+
+def test_print_recommendations_writes_report_to_given_stream(capsys):
+    advisor = TradingAdvisor()
+    buffer = io.StringIO()
+    advisor.print_recommendations(
+        [
+            {
+                "symbol": "NVDA",
+                "total_score": 10,
+                "recommendation": {
+                    "action": "BUY",
+                    "entry": 101.234,
+                    "stop_loss": 93.1,
+                    "stop_loss_pct": 8.0,
+                    "position_size_pct": 9.6,
+                    "reasons": ["Strong EPS", "Near highs"],
+                    "market_note": "Uptrend",
+                },
+            }
+        ],
+        file=buffer,
+    )
+
+    report = buffer.getvalue()
+    assert capsys.readouterr().out == ""
+    assert "#1 NVDA — SCORE: 10/12" in report
+    assert "  Entry:  $101.23\n" in report
+    assert "  Reasons:\n    Strong EPS\n    Near highs\n\n  Market: Uptrend\n" in report
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import TRADE_DTYPE, Backtester, compare_strategies
+from strategies.base import Strategy
+
+
+class _ScriptedStrategy(Strategy):
+    def __init__(self, signals: list[int], stop_loss_pct: float | None = None) -> None:
+        super().__init__(name="Scripted")
+        self._signals = signals
+        self._stop_loss_pct = stop_loss_pct
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.Series:
+        return pd.Series(self._signals, index=data.index)
+
+    def should_use_stop_loss(self) -> bool:
+        return self._stop_loss_pct is not None
+
+    def stop_loss_pct(self) -> float:
+        return self._stop_loss_pct or 0.0
+
+
+def _frame(closes: list[float]) -> pd.DataFrame:
+    idx = pd.date_range("2026-01-05", periods=len(closes), freq="B")
+    return pd.DataFrame({"close": closes}, index=idx)
+
+
+def test_backtester_tracks_cash_and_equity_through_round_trip():
+    data = _frame([10.0, 11.0, 12.0, 12.0])
+    result = Backtester(initial_cash=1000, commission=1.0, slippage=0.0).run(
+        _ScriptedStrategy([1, 0, -1, 0]), data
+    )
+
+    assert result.equity_curve.index.equals(data.index)
+    assert result.equity_curve.name == "equity"
+    assert result.equity_curve.tolist() == pytest.approx([999.0, 1098.0, 1196.0, 1196.0])
+    assert len(result.trades) == 1
+    trade = result.trades[0]
+    assert trade.shares == 99
+    assert trade.exit_reason == "signal"
+    assert trade.entry_date == data.index[0]
+    assert trade.exit_date == data.index[2]
+    assert trade.pnl == pytest.approx(198.0)
+
+    records = result.trade_records
+    assert records.dtype == TRADE_DTYPE
+    assert records[["entry_idx", "exit_idx", "shares"]].tolist() == [(0, 2, 99)]
+    assert records["pnl"].tolist() == pytest.approx([198.0])
+
+
+def test_backtester_trailing_stop_uses_highest_close_and_closes_at_end_of_data():
+    data = _frame([100.0, 110.0, 104.0, 103.0, 101.0, 105.0])
+    result = Backtester(initial_cash=1000, slippage=0.0).run(
+        _ScriptedStrategy([1, 0, 0, 0, 1, 0], stop_loss_pct=0.05),
+        data,
+    )
+
+    assert [trade.exit_reason for trade in result.trades] == ["stop_loss", "end_of_data"]
+    assert result.trades[0].exit_price == pytest.approx(104.0)
+    assert result.trades[1].entry_date == data.index[4]
+    assert result.trades[1].exit_price == pytest.approx(105.0)
+
+
+def test_backtester_skips_buy_when_cash_cannot_cover_one_share():
+    data = _frame([500.0, 510.0, 520.0])
+    result = Backtester(initial_cash=400, commission=1.0).run(_ScriptedStrategy([1, 1, 0]), data)
+
+    assert result.trades == []
+    assert result.equity_curve.tolist() == [400.0, 400.0, 400.0]
+
+
+def test_backtester_clips_benchmark_to_backtest_window():
+    data = _frame([10.0, 11.0, 12.0])
+    bench_idx = pd.date_range("2025-12-31", periods=7, freq="B")
+    benchmark = pd.DataFrame({"close": [50.0, 80.0, 90.0, 100.0, 105.0, 110.0, 500.0]}, index=bench_idx)
+
+    result = Backtester(initial_cash=1000).run(_ScriptedStrategy([0, 0, 0]), data, benchmark=benchmark)
+
+    assert result.metrics.benchmark_return == pytest.approx(10.0)
+
+
+def test_compare_strategies_keeps_input_order():
+    data = _frame([10.0, 11.0, 12.0, 12.0])
+    strategies = [_ScriptedStrategy([1, 0, -1, 0]), _ScriptedStrategy([0, 0, 0, 0])]
+    strategies[0].name = "Round trip"
+    strategies[1].name = "Flat"
+
+    comparison = compare_strategies(strategies, data, initial_cash=1000)
+
+    assert comparison["Strategy"].tolist() == ["Round trip", "Flat"]
+    assert comparison["Trades"].tolist() == [1, 0]
+    assert compare_strategies([], data).empty
+
+
+def test_compare_strategies_shares_precomputed_indicators(monkeypatch):
+    import backtest
+    from strategies.momentum import AggressiveMomentum, MomentumStrategy
+
+    closes = 100 + np.cumsum(np.random.default_rng(5).standard_normal(300))
+    data = _frame(list(closes))
+    strategies = [MomentumStrategy(), AggressiveMomentum()]
+    expected = [Backtester(initial_cash=1000).run(strategy, data).metrics.total_return for strategy in strategies]
+
+    calls = []
+    real_suite = backtest.compute_suite
+    monkeypatch.setattr(backtest, "compute_suite", lambda prices, spec: calls.append(spec) or real_suite(prices, spec))
+    comparison = compare_strategies(strategies, data, initial_cash=1000)
+
+    assert len(calls) == 1
+    assert comparison["Return (%)"].tolist() == expected
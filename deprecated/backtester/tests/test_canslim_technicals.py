@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+from indicators import relative_strength
+import strategies.canslim as canslim
+from strategies.canslim import CANSLIMLite, CANSLIMStrategy, _canslim_technicals, _tier_score
+
+
+def test_canslim_technicals_match_pandas_rolling_expressions():
+    rng = np.random.default_rng(3)
+    n = 320
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, n))))
+    close.iloc[[40, 41, 200]] = np.nan
+    volume = pd.Series(rng.integers(1_000_000, 5_000_000, n).astype(float))
+    volume.iloc[[90, 150]] = np.nan
+
+    technicals = _canslim_technicals(close, volume)
+
+    daily_return = close.pct_change(fill_method=None)
+    expected = {
+        "high_252": close.rolling(252).max(),
+        "resistance_20": close.rolling(20).max().shift(1),
+        "sma_50": close.rolling(50).mean(),
+        "sma_200": close.rolling(200).mean(),
+        "volume_ratio_20": volume.where(daily_return > 0, 0).rolling(20).mean()
+        / (volume.where(daily_return < 0, 0).rolling(20).mean() + 1),
+        "avg_volume_50": volume.rolling(50).mean(),
+    }
+    for name, reference in expected.items():
+        np.testing.assert_allclose(
+            technicals[name].to_numpy(), reference.to_numpy(dtype=float), rtol=1e-12, err_msg=name
+        )
+
+
+def test_tier_score_buckets_edges_and_scores_nan_as_zero():
+    values = np.array([np.nan, -np.inf, 0.89, 0.90, 0.94, 0.95, 1.3, np.inf])
+
+    points = _tier_score(values, 0.95, 0.90)
+
+    assert points.dtype == np.int8
+    assert points.tolist() == [0, 0, 0, 1, 1, 2, 2, 2]
+
+
+def test_canslim_lite_batch_signals_match_per_symbol_runs():
+    rng = np.random.default_rng(5)
+    idx = pd.bdate_range("2022-01-03", periods=400)
+    closes = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, (400, 3)), axis=0)),
+        index=idx,
+        columns=["AAA", "BBB", "CCC"],
+    )
+    volumes = pd.DataFrame(rng.integers(1, 6, (400, 3)) * 1e6, index=idx, columns=closes.columns)
+    strategy = CANSLIMLite(min_score=3)
+
+    batch = strategy.generate_signals_batch(closes, volumes)
+
+    assert batch.shape == closes.shape
+    for symbol in closes.columns:
+        single = strategy.generate_signals(pd.DataFrame({"close": closes[symbol], "volume": volumes[symbol]}))
+        pd.testing.assert_series_equal(batch[symbol], single, check_names=False)
+    assert (batch != 0).any().any()
+
+
+def test_canslim_l_score_aligns_a_differently_dated_benchmark():
+    rng = np.random.default_rng(9)
+    idx = pd.bdate_range("2021-01-04", periods=400)
+    data = pd.DataFrame(
+        {
+            "close": 100 * np.exp(np.cumsum(rng.normal(0.002, 0.02, 400))),
+            "volume": rng.integers(1, 5, 400) * 1e6,
+        },
+        index=idx,
+    )
+    bench_idx = pd.bdate_range("2020-12-01", periods=430)
+    benchmark = pd.DataFrame({"close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 430)))}, index=bench_idx)
+    strategy = CANSLIMStrategy(min_score=2)
+    strategy.fundamental_scores = {"C": 1}
+
+    strategy.generate_signals(data, benchmark)
+
+    rs = relative_strength(data["close"], benchmark["close"], 252).reindex(idx)
+    expected = np.where(rs >= 1.2, 2, np.where(rs >= 1.1, 1, 0))
+    np.testing.assert_array_equal(strategy.get_current_scores()["L"].to_numpy(), expected)
+
+
+class _CountingFetcher:
+    def __init__(self, eps_growth):
+        self.eps_growth = eps_growth
+        self.calls = 0
+
+    def get_fundamentals(self, symbol):
+        self.calls += 1
+        return {"symbol": symbol, "eps_growth": self.eps_growth}
+
+    def score_canslim_fundamentals(self, fundamentals):
+        return {"C": 2 if fundamentals["eps_growth"] else 0}
+
+
+def test_set_symbol_reuses_scored_fundamentals_across_strategies():
+    fetcher = _CountingFetcher(eps_growth=60.0)
+
+    for min_score in (6, 8, 10):
+        strategy = CANSLIMStrategy(min_score=min_score)
+        strategy.fundamentals_fetcher = fetcher
+        strategy.set_symbol("NVDA")
+        assert strategy.fundamental_scores == {"C": 2}
+
+    assert fetcher.calls == 1
+
+
+def test_set_symbol_does_not_memoize_empty_fundamentals():
+    fetcher = _CountingFetcher(eps_growth=None)
+
+    for _ in range(2):
+        strategy = CANSLIMStrategy()
+        strategy.fundamentals_fetcher = fetcher
+        strategy.set_symbol("MSFT")
+
+    assert fetcher.calls == 2
+
+
+def test_fundamentals_memo_is_per_fetcher_and_bounded(monkeypatch):
+    monkeypatch.setattr(canslim, "_FUNDAMENTALS_MEMO_MAXSIZE", 2)
+    first, second = _CountingFetcher(eps_growth=60.0), _CountingFetcher(eps_growth=30.0)
+
+    assert canslim._fetch_and_score(first, "NVDA")[1] == {"C": 2}
+    # Another source never gets the first fetcher's result
+    assert canslim._fetch_and_score(second, "NVDA")[0]["eps_growth"] == 30.0
+
+    for symbol in ("AAA", "BBB"):
+        canslim._fetch_and_score(first, symbol)
+    canslim._fetch_and_score(first, "NVDA")  # evicted as least recently used
+    assert (first.calls, second.calls) == (4, 1)
+
+
+def test_canslim_score_frame_is_built_only_when_requested():
+    rng = np.random.default_rng(12)
+    idx = pd.bdate_range("2023-01-02", periods=300)
+    data = pd.DataFrame(
+        {"close": 100 + rng.standard_normal(300).cumsum(), "volume": rng.integers(1, 5, 300) * 1e6},
+        index=idx,
+    )
+    strategy = CANSLIMStrategy()
+    strategy.fundamental_scores = {"C": 2, "A": 1}
+    assert strategy.get_current_scores() is None
+
+    strategy.generate_signals(data)
+    assert strategy._scores is None
+
+    scores = strategy.get_current_scores()
+    assert list(scores.columns) == ["C", "A", "N", "S", "L", "I", "Total", "Market_Healthy"]
+    assert scores.index.equals(idx)
+    assert (scores["C"] == 2).all() and (scores["A"] == 1).all()
+    assert strategy.get_current_scores() is scores
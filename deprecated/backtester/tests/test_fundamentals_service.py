@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import math
+
+import pandas as pd
+
 from data.fundamentals import FundamentalsCache, FundamentalsFetcher
+from data.market_data_service_client import MarketDataServiceClient
 
 
 class _StubClient:
@@ -49,3 +54,271 @@ def test_get_annual_eps_growth_only_uses_service_summary_for_default_horizon(tmp
 
     assert fetcher.get_annual_eps_growth("AAPL5Y", years=5) == 18.5
     assert fetcher.get_annual_eps_growth("AAPL5Y", years=3) is None
+
+
+def test_get_fundamentals_batch_returns_each_symbol_once_in_request_order(tmp_path):
+    fetcher = FundamentalsFetcher(service_client=_StubClient({"eps_growth": 42.0, "float_shares": 30_000_000}))
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-c"))
+
+    batch = fetcher.get_fundamentals_batch(["MSFT", "NVDA", "MSFT", ""])
+
+    assert list(batch) == ["MSFT", "NVDA"]
+    assert batch["NVDA"]["symbol"] == "NVDA"
+    assert batch["MSFT"]["eps_growth"] == 42.0
+
+
+class _UnavailableClient:
+    def __init__(self):
+        self.calls = 0
+
+    def get_symbol_payload(self, route, symbol, params=None):
+        self.calls += 1
+        return None
+
+    @staticmethod
+    def extract_data(payload):
+        return None
+
+
+def test_unavailable_service_result_is_not_cached(tmp_path):
+    client = _UnavailableClient()
+    fetcher = FundamentalsFetcher(service_client=client)
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-d"))
+
+    assert fetcher.get_eps_growth("DOWN") is None
+    assert fetcher.get_eps_growth("DOWN") is None
+    assert client.calls == 2
+
+
+def test_service_client_reuses_one_session_across_requests(monkeypatch):
+    client = MarketDataServiceClient(base_url="http://service.test", enabled=True)
+    calls = []
+
+    class _Response:
+        status_code = 200
+
+        @staticmethod
+        def json():
+            return {"status": "ok", "data": {"eps_growth": 10}}
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(url)
+        return _Response()
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    assert client.get_symbol_payload("fundamentals", "aapl") is not None
+    assert client.get_symbol_payload("fundamentals", "msft") is not None
+    assert calls == [
+        "http://service.test/market-data/fundamentals/AAPL",
+        "http://service.test/market-data/fundamentals/MSFT",
+    ]
+
+
+def test_get_fundamentals_loads_current_payload_once(tmp_path):
+    fetcher = FundamentalsFetcher(service_client=_StubClient(
+        {"eps_growth": 30, "earnings_event_window": [{"date": "2024-01-30"}]}
+    ))
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-e"))
+    loads = []
+    original = fetcher._load_payload
+
+    def counting_load(symbol, as_of_date=None):
+        loads.append((symbol, as_of_date))
+        return original(symbol, as_of_date)
+
+    fetcher._load_payload = counting_load
+
+    result = fetcher.get_fundamentals("NVDA")
+
+    assert loads == [("NVDA", None)]
+    assert result["last_earnings_date"] == "2024-01-30"
+
+
+def test_fundamentals_cache_reuses_parsed_payload_until_file_changes(tmp_path, monkeypatch):
+    import json_compat
+
+    cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-f"))
+    cache.set("NVDA", "fundamentals", {"eps_growth": 1.0})
+    parses = []
+    loads = json_compat.loads
+    monkeypatch.setattr(json_compat, "loads", lambda data: parses.append(data) or loads(data))
+
+    first = cache.get("NVDA", "fundamentals")
+    first["eps_growth"] = 99.0  # callers get their own copy
+    assert cache.get("NVDA", "fundamentals") == {"eps_growth": 1.0}
+    assert len(parses) == 1
+
+    cache.set("NVDA", "fundamentals", {"eps_growth": 2.0})
+    assert cache.get("NVDA", "fundamentals") == {"eps_growth": 2.0}
+
+
+def test_fundamentals_cache_parsed_payloads_are_bounded_and_expire(tmp_path, monkeypatch):
+    from datetime import timedelta
+
+    import data.fundamentals as fundamentals
+
+    monkeypatch.setattr(fundamentals, "PARSED_CACHE_MAXSIZE", 2)
+    cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-n"))
+    for symbol in ("AAA", "BBB", "CCC"):
+        cache.set(symbol, "fundamentals", {"symbol": symbol})
+        cache.get(symbol, "fundamentals")
+
+    assert [path.name for path in cache._parsed] == ["BBB_fundamentals.json", "CCC_fundamentals.json"]
+    assert cache.get("BBB", "fundamentals", max_age=timedelta(seconds=-1)) is None
+    assert [path.name for path in cache._parsed] == ["CCC_fundamentals.json"]
+
+
+def test_score_canslim_fundamentals_batch_matches_scalar_scoring(tmp_path):
+    fetcher = FundamentalsFetcher(service_client=_StubClient({}))
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-g"))
+    rows = [
+        {"eps_growth": 60, "annual_eps_growth": 45, "institutional_pct": 0.3, "float_shares": 10_000_000},
+        {"eps_growth": 30, "annual_eps_growth": 30, "institutional_pct": 0.7, "float_shares": 40_000_000},
+        {"eps_growth": 10, "annual_eps_growth": 5, "institutional_pct": 0.9, "float_shares": 90_000_000},
+        {"eps_growth": None, "annual_eps_growth": None, "institutional_pct": None, "float_shares": None},
+    ]
+
+    batch = fetcher.score_canslim_fundamentals_batch(pd.DataFrame(rows, index=["A", "B", "C", "D"]))
+
+    for symbol, row in zip(batch.index, rows):
+        assert batch.loc[symbol].to_dict() == fetcher.score_canslim_fundamentals(row)
+
+
+def test_fundamentals_cache_set_leaves_no_temp_files(tmp_path):
+    cache_dir = tmp_path / "fundamentals-h"
+    cache = FundamentalsCache(cache_dir=str(cache_dir))
+
+    cache.set("NVDA", "fundamentals", {"eps_growth": 1.0})
+    cache.set("NVDA", "fundamentals", {"eps_growth": 2.0})
+
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["NVDA_fundamentals.json"]
+    assert cache.get("NVDA", "fundamentals") == {"eps_growth": 2.0}
+
+
+class _DatedClient:
+    def __init__(self):
+        self.requested = []
+
+    def get_symbol_payload(self, route, symbol, params=None):
+        as_of = (params or {}).get("as_of_date")
+        self.requested.append(as_of)
+        return {"status": "ok", "data": {"eps_growth": float(as_of[-2:]), "float_shares": 20_000_000}}
+
+    @staticmethod
+    def extract_data(payload):
+        return payload.get("data")
+
+
+def test_get_fundamentals_at_dates_loads_each_date_once_and_feeds_batch_scoring(tmp_path):
+    client = _DatedClient()
+    fetcher = FundamentalsFetcher(service_client=client)
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-i"))
+
+    frame = fetcher.get_fundamentals_at_dates(
+        "NVDA", ["2024-01-30", "2024-01-10", "2024-01-30"]
+    )
+
+    assert sorted(client.requested) == ["2024-01-10", "2024-01-30"]
+    assert list(frame.index.strftime("%Y-%m-%d")) == ["2024-01-30", "2024-01-10", "2024-01-30"]
+    assert frame["eps_growth"].tolist() == [30.0, 10.0, 30.0]
+    assert frame["annual_eps_growth"].isna().all()
+    assert fetcher.score_canslim_fundamentals_batch(frame)["C"].tolist() == [1, 0, 1]
+
+
+def test_get_fundamentals_splits_event_window_into_last_and_next(tmp_path):
+    fetcher = FundamentalsFetcher(service_client=_StubClient(
+        {"earnings_event_window": [{"date": "2200-01-15"}, {"date": "2000-04-20"}, {"date": "2001-07-19"}]}
+    ))
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-j"))
+
+    result = fetcher.get_fundamentals("NVDA")
+
+    assert result["last_earnings_date"] == "2001-07-19"
+    assert result["next_earnings_date"] == "2200-01-15"
+    assert [event["date"].year for event in result["earnings_event_window"]] == [2000, 2001, 2200]
+
+
+def test_get_fundamentals_accepts_mixed_offset_event_dates(tmp_path):
+    fetcher = FundamentalsFetcher(service_client=_StubClient(
+        {
+            "earnings_event_window": [
+                {"date": "2001-07-19T16:00:00-04:00"},
+                {"date": "2000-04-20"},
+                # After-hours ET report: still Nov 3 in market time, Nov 4 in UTC
+                {"date": "2002-11-03T20:00:00-05:00"},
+                {"date": "2002-11-04T01:30:00Z"},
+            ]
+        }
+    ))
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-k"))
+
+    result = fetcher.get_fundamentals("NVDA")
+
+    assert [event["date"].strftime("%Y-%m-%d %H:%M") for event in result["earnings_event_window"]] == [
+        "2000-04-20 00:00",
+        "2001-07-19 16:00",
+        "2002-11-03 20:00",
+        "2002-11-03 20:30",
+    ]
+    assert result["last_earnings_date"] == "2002-11-03"
+
+
+def test_fetchers_share_the_default_cache():
+    assert FundamentalsFetcher(service_client=_StubClient({})).cache is FundamentalsFetcher(
+        service_client=_StubClient({})
+    ).cache
+
+
+def test_parsed_as_of_dates_share_the_string_cache_entry(tmp_path):
+    client = _DatedClient()
+    fetcher = FundamentalsFetcher(service_client=client)
+    fetcher.cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-l"))
+
+    assert fetcher.get_eps_growth("NVDA", pd.Timestamp("2024-01-30")) == 30.0
+    assert fetcher.get_eps_growth("NVDA", "2024-01-30") == 30.0
+    assert client.requested == ["2024-01-30"]
+
+
+def test_cache_writes_nan_as_null_and_reads_legacy_or_corrupt_files(tmp_path):
+    cache = FundamentalsCache(cache_dir=str(tmp_path / "fundamentals-m"))
+
+    cache.set("NVDA", "fundamentals", {"eps_growth": float("nan"), "float_shares": 1.0})
+    assert cache._cache_path("NVDA", "fundamentals").read_bytes() == b'{"eps_growth":null,"float_shares":1.0}'
+    assert cache.get("NVDA", "fundamentals") == {"eps_growth": None, "float_shares": 1.0}
+
+    # Files written by json.dump before the orjson switch carry bare NaN tokens
+    cache._cache_path("AMD", "fundamentals").write_text('{"eps_growth": NaN}')
+    assert math.isnan(cache.get("AMD", "fundamentals")["eps_growth"])
+
+    cache._cache_path("BAD", "fundamentals").write_text('{"eps_growth": ')
+    assert cache.get("BAD", "fundamentals") is None
+
+
+def test_json_compat_backends_write_identical_bytes_for_numpy_values(monkeypatch):
+    import datetime
+
+    import numpy as np
+    import pytest
+
+    import json_compat
+
+    pytest.importorskip("orjson")
+    payload = {
+        "eps_growth": np.float64(1.5),
+        "missing": np.float64("nan"),
+        "ratio": np.float32(0.25),
+        "shares": np.int64(5),
+        "flag": np.bool_(True),
+        "history": np.array([1.0, np.inf]),
+        "as_of": datetime.datetime(2024, 1, 2, 3, 4),
+    }
+
+    with_orjson = json_compat.dumps(payload, default=str)
+    monkeypatch.setattr(json_compat, "_orjson", None)
+    with_stdlib = json_compat.dumps(payload, default=str)
+
+    assert with_orjson == with_stdlib == (
+        b'{"eps_growth":1.5,"missing":null,"ratio":0.25,"shares":5,"flag":true,'
+        b'"history":[1.0,null],"as_of":"2024-01-02 03:04:00"}'
+    )
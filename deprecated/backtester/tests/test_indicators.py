@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+
+from indicators import (
+    _dual_rolling_max,
+    _dual_rolling_mean,
+    atr,
+    bollinger_bands,
+    compute_suite,
+    crossover,
+    crossunder,
+    ema,
+    ema_batch,
+    macd,
+    rate_of_change,
+    relative_strength,
+    rsi,
+    rsi_batch,
+    sma,
+    sma_batch,
+)
+
+
+def _prices(n: int = 300, seed: int = 7) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2025-01-02", periods=n, freq="B")
+    return pd.Series(100.0 + rng.standard_normal(n).cumsum(), index=idx, name="Close")
+
+
+def test_sma_matches_pandas_rolling_mean_including_nan_windows():
+    prices = _prices()
+    prices.iloc[[10, 11, 150]] = np.nan
+
+    for period in (1, 5, 20, 50, 200):
+        pd.testing.assert_series_equal(sma(prices, period), prices.rolling(window=period).mean(), rtol=1e-9)
+
+
+def test_sma_accepts_integer_series_and_short_history():
+    volume = pd.Series([100, 200, 300, 400], name="Volume")
+
+    assert sma(volume, 3).tolist()[2:] == [200.0, 300.0]
+    assert sma(volume, 10).isna().all()
+
+
+def test_dual_rolling_max_matches_pandas_for_both_windows():
+    prices = _prices().round(0)  # ties exercise the deque's pop-equal rule
+    prices.iloc[[30, 31, 220]] = np.nan
+    values = prices.to_numpy()
+    short, long = np.empty(len(values)), np.empty(len(values))
+
+    _dual_rolling_max(values, 20, 252, short, long)
+
+    np.testing.assert_array_equal(short, prices.rolling(20).max().to_numpy())
+    np.testing.assert_array_equal(long, prices.rolling(252).max().to_numpy())
+
+
+def test_dual_rolling_mean_equals_two_sma_calls():
+    prices = _prices()
+    prices.iloc[[5, 120]] = np.nan
+    values = prices.to_numpy()
+    short, long = np.empty(len(values)), np.empty(len(values))
+
+    _dual_rolling_mean(values, 50, 200, short, long)
+
+    np.testing.assert_array_equal(short, sma(prices, 50).to_numpy())
+    np.testing.assert_array_equal(long, sma(prices, 200).to_numpy())
+
+
+def test_ema_matches_pandas_ewm_including_nan_gaps():
+    prices = _prices()
+    prices.iloc[[0, 40, 41, 200]] = np.nan
+
+    for period in (1, 3, 12, 26, 50):
+        expected = prices.ewm(span=period, adjust=False).mean()
+        pd.testing.assert_series_equal(ema(prices, period), expected, rtol=1e-12)
+
+
+def test_atr_uses_span_smoothed_true_range():
+    close = _prices()
+    high, low = close + 1.5, close - 1.0
+    prev_close = close.shift(1)
+    true_range = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+
+    pd.testing.assert_series_equal(atr(high, low, close, 14), true_range.ewm(span=14, adjust=False).mean(), rtol=1e-12)
+
+
+def test_rsi_matches_wilder_ewm_reference():
+    prices = _prices()
+    prices.iloc[[5, 120]] = np.nan
+
+    delta = prices.diff()
+    gains = delta.where(delta > 0, 0)
+    losses = -delta.where(delta < 0, 0)
+    for period in (2, 14, 30):
+        avg_gain = gains.ewm(com=period - 1, min_periods=period).mean()
+        avg_loss = losses.ewm(com=period - 1, min_periods=period).mean()
+        expected = 100 - (100 / (1 + avg_gain / (avg_loss + 1e-10)))
+        pd.testing.assert_series_equal(rsi(prices, period), expected, rtol=1e-9)
+
+
+def test_macd_matches_chained_ewm_columns():
+    prices = _prices()
+    prices.iloc[[0, 90]] = np.nan
+
+    fast = prices.ewm(span=12, adjust=False).mean()
+    slow = prices.ewm(span=26, adjust=False).mean()
+    line = fast - slow
+    signal = line.ewm(span=9, adjust=False).mean()
+    expected = pd.DataFrame({'macd': line, 'signal': signal, 'histogram': line - signal})
+
+    pd.testing.assert_frame_equal(macd(prices), expected, rtol=1e-12)
+
+
+def test_crossover_and_crossunder_flag_only_the_crossing_bar():
+    fast = pd.Series([np.nan, 1.0, 3.0, 4.0, 2.0, 1.0])
+    slow = pd.Series([2.0, 2.0, 2.0, 2.0, 2.0, 2.0])
+
+    assert crossover(fast, slow).tolist() == [False, False, True, False, False, False]
+    assert crossunder(fast, slow).tolist() == [False, False, False, False, False, True]
+
+
+def test_batch_indicators_match_per_symbol_results():
+    prices = pd.DataFrame({symbol: _prices(seed=seed) for seed, symbol in enumerate(["AAPL", "MSFT", "NVDA"])})
+    prices.iloc[3, 1] = np.nan
+
+    for batch, single, period in ((sma_batch, sma, 20), (ema_batch, ema, 12), (rsi_batch, rsi, 14)):
+        expected = pd.DataFrame({symbol: single(prices[symbol], period) for symbol in prices.columns})
+        pd.testing.assert_frame_equal(batch(prices, period), expected)
+
+
+def test_batch_indicators_support_float32_storage():
+    prices = pd.DataFrame({symbol: _prices(seed=seed) for seed, symbol in enumerate(["AAPL", "MSFT"])})
+
+    result = sma_batch(prices, 20, dtype=np.float32)
+
+    assert (result.dtypes == np.float32).all()
+    np.testing.assert_allclose(result.to_numpy(), sma_batch(prices, 20).to_numpy(), rtol=1e-5)
+
+
+def test_relative_strength_matches_return_ratio():
+    stock, benchmark = _prices(seed=1), _prices(seed=2)
+    expected = (1 + stock.pct_change(20)) / (1 + benchmark.pct_change(20))
+
+    pd.testing.assert_series_equal(relative_strength(stock, benchmark, 20), expected, rtol=1e-12, check_names=False)
+    # Misaligned dates still line up by label.
+    shifted = benchmark.iloc[30:]
+    expected = (1 + stock.pct_change(20)) / (1 + shifted.pct_change(20))
+    pd.testing.assert_series_equal(relative_strength(stock, shifted, 20), expected)
+
+
+def test_bollinger_bands_match_rolling_mean_and_std():
+    prices = _prices()
+    prices.iloc[[8, 100]] = np.nan
+
+    middle = prices.rolling(20).mean()
+    std = prices.rolling(20).std()
+    expected = pd.DataFrame({'middle': middle, 'upper': middle + std * 2.0, 'lower': middle - std * 2.0})
+
+    pd.testing.assert_frame_equal(bollinger_bands(prices), expected, rtol=1e-9)
+    flat = bollinger_bands(pd.Series([50.0] * 30))
+    assert (flat['upper'].dropna() == 50.0).all()
+
+
+def test_rate_of_change_matches_shifted_percentage():
+    prices = _prices()
+    prices.iloc[12] = np.nan
+
+    expected = ((prices - prices.shift(10)) / prices.shift(10)) * 100
+    pd.testing.assert_series_equal(rate_of_change(prices, 10), expected, rtol=1e-12)
+
+
+def test_compute_suite_matches_individual_indicators():
+    prices = _prices()
+
+    suite = compute_suite(prices, {'sma': [20, 50], 'ema': 12, 'rsi': 14, 'macd': (12, 26, 9)})
+
+    assert sorted(suite) == ['ema_12', 'macd', 'rsi_14', 'sma_20', 'sma_50']
+    pd.testing.assert_series_equal(suite['sma_50'], sma(prices, 50))
+    pd.testing.assert_series_equal(suite['ema_12'], ema(prices, 12))
+    pd.testing.assert_series_equal(suite['rsi_14'], rsi(prices, 14))
+    pd.testing.assert_frame_equal(suite['macd'], macd(prices))
@@ -86,3 +86,61 @@ def test_scorecard_sanitizes_nan_rolling_metrics():
     assert np.isfinite(status.price_vs_21d_pct)
     assert np.isfinite(status.price_vs_50d_pct)
     assert "nan%" not in status.notes.lower()
+
+
+def test_distribution_and_follow_through_days_flag_expected_sessions():
+    idx = pd.date_range("2026-01-02", periods=8, freq="B")
+    frame = pd.DataFrame(
+        {
+            "Close": [100.0, 102.0, 100.0, 100.5, 102.5, 101.0, 103.0, 103.5],
+            "Volume": [10, 11, 12, 9, 15, 16, 14, 20],
+        },
+        index=idx,
+    )
+    detector = MarketRegimeDetector(cache_path=f"{tempfile.mkdtemp()}/snapshot.json")
+    detector._data = frame
+
+    assert detector.count_distribution_days(25) == [idx[2], idx[5]]
+    # The 2% gain on idx[1] falls inside the first four sessions, so it does not count.
+    assert detector.find_follow_through_days(60) == [idx[4]]
+
+
+def test_get_status_reuses_live_status_until_refresh():
+    idx = pd.date_range("2026-01-02", periods=60, freq="B")
+    frame = pd.DataFrame(
+        {"Close": np.linspace(100.0, 135.0, len(idx)), "Volume": np.full(len(idx), 1_000_000)},
+        index=idx,
+    )
+    detector = MarketRegimeDetector(cache_path=f"{tempfile.mkdtemp()}/snapshot.json")
+    fetches = []
+
+    def _fake_fetch(days: int = 90) -> pd.DataFrame:
+        fetches.append(days)
+        detector._data = frame
+        detector.last_data_source = "test"
+        return frame
+
+    detector.fetch_data = _fake_fetch  # type: ignore[method-assign]
+
+    first = detector.get_status()
+    assert detector.get_status() is first
+    assert detector.should_buy() == (True, first.position_sizing)
+    assert len(fetches) == 1
+
+    detector.get_status(refresh=True)
+    assert len(fetches) == 2
+
+
+def test_trend_direction_compares_close_against_tail_sma_means():
+    idx = pd.date_range("2026-01-02", periods=60, freq="B")
+    detector = MarketRegimeDetector(cache_path=f"{tempfile.mkdtemp()}/snapshot.json")
+
+    detector._data = pd.DataFrame({"Close": np.linspace(100.0, 160.0, len(idx))}, index=idx)
+    assert detector.get_trend_direction() == "up"
+
+    detector._data = pd.DataFrame({"Close": np.linspace(160.0, 100.0, len(idx))}, index=idx)
+    assert detector.get_trend_direction() == "down"
+
+    # Fewer than 50 sessions means no 50-day SMA yet.
+    detector._data = pd.DataFrame({"Close": np.linspace(100.0, 160.0, 40)}, index=idx[:40])
+    assert detector.get_trend_direction() == "sideways"
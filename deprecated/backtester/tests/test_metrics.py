@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from metrics import (
+    analyze_trades,
+    analyze_trades_arr,
+    calculate_metrics,
+    calmar_ratio,
+    max_drawdown,
+    sharpe_ratio,
+    sortino_ratio,
+    total_return,
+    volatility,
+)
+
+
+def test_max_drawdown_reports_depth_and_longest_underwater_streak():
+    equity = pd.Series([100.0, 120.0, 90.0, 110.0, 130.0, 125.0, 126.0, 127.0, 140.0])
+
+    max_dd, duration = max_drawdown(equity)
+
+    assert max_dd == -25.0
+    assert duration == 3
+
+
+def test_max_drawdown_handles_flat_and_gapped_curves():
+    assert max_drawdown(pd.Series([100.0, 101.0, 102.0])) == (0.0, 0)
+
+    max_dd, duration = max_drawdown(pd.Series([np.nan, 100.0, 90.0, np.nan, 95.0, 80.0]))
+    assert max_dd == -20.0
+    assert duration == 2
+
+
+def test_volatility_matches_sample_std_and_skips_nans():
+    returns = pd.Series([0.01, -0.02, np.nan, 0.015, 0.005])
+
+    expected = returns.std() * np.sqrt(252) * 100
+    assert abs(volatility(returns) - expected) < 1e-12
+    assert np.isnan(volatility(pd.Series([0.01])))
+
+
+def test_sharpe_and_sortino_match_pandas_moments():
+    returns = pd.Series([0.01, -0.02, np.nan, 0.015, -0.005, 0.03, -0.01])
+
+    excess = returns.mean() * 252 - 0.02
+    expected_sharpe = excess / (returns.std() * np.sqrt(252))
+    expected_sortino = excess / (returns[returns < 0].std() * np.sqrt(252))
+    assert abs(sharpe_ratio(returns) - expected_sharpe) < 1e-12
+    assert abs(sortino_ratio(returns) - expected_sortino) < 1e-12
+
+
+def test_sortino_edge_cases_keep_existing_semantics():
+    assert sortino_ratio(pd.Series([0.01, 0.02])) == np.inf
+    assert np.isnan(sortino_ratio(pd.Series([0.01, -0.02])))
+    assert sharpe_ratio(pd.Series([0.0, 0.0, 0.0])) == 0.0
+
+
+def test_calculate_metrics_fused_scan_matches_individual_metrics():
+    rng = np.random.default_rng(7)
+    values = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, 300))
+    values[50] = np.nan
+    equity = pd.Series(values, index=pd.bdate_range("2021-01-01", periods=300))
+    trades = pd.DataFrame(columns=["entry_date", "exit_date", "pnl_pct", "exit_reason"])
+    returns = equity.pct_change().dropna()
+
+    metrics = calculate_metrics(equity, trades)
+
+    max_dd, duration = max_drawdown(equity)
+    assert metrics.max_drawdown == max_dd
+    assert metrics.max_drawdown_duration == duration
+    assert abs(metrics.volatility - volatility(returns)) < 1e-10
+    assert abs(metrics.sharpe_ratio - sharpe_ratio(returns)) < 1e-10
+    assert abs(metrics.sortino_ratio - sortino_ratio(returns)) < 1e-10
+    # Return and Calmar share their scalar math with the public helpers
+    assert metrics.calmar_ratio == calmar_ratio(equity)
+    assert metrics.total_return == total_return(equity)
+
+
+def test_analyze_trades_reduces_pnl_column_and_ignores_nan():
+    trades = pd.DataFrame(
+        {
+            "entry_date": pd.to_datetime(["2024-01-02"] * 4),
+            "exit_date": pd.to_datetime(["2024-01-12"] * 4),
+            "pnl_pct": [6.0, -2.0, np.nan, 0.0],
+            "exit_reason": ["signal"] * 4,
+        }
+    )
+
+    stats = analyze_trades(trades)
+
+    assert stats["total_trades"] == 4
+    assert stats["win_rate"] == 25.0
+    assert stats["avg_win"] == 6.0
+    assert stats["avg_loss"] == -1.0
+    assert stats["profit_factor"] == 3.0
+    assert abs(stats["avg_trade"] - 4.0 / 3.0) < 1e-12
+
+
+def test_analyze_trades_arr_matches_dataframe_path():
+    pnl = np.array([4.0, -1.5, 2.5, -3.0, 0.0], dtype=np.float32)
+    trades = pd.DataFrame(
+        {
+            "entry_date": pd.to_datetime(["2024-02-01"] * 5),
+            "exit_date": pd.to_datetime(["2024-02-09"] * 5),
+            "pnl_pct": pnl.astype(float),
+            "exit_reason": ["signal"] * 5,
+        }
+    )
+
+    from_array = analyze_trades_arr(pnl)
+    from_frame = analyze_trades(trades)
+
+    assert from_frame.pop("outcome_breakdown")
+    assert from_array == from_frame
+    assert analyze_trades_arr(np.array([]))["total_trades"] == 0
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import compute_suite, crossover, crossunder, ema, rsi, sma
+from strategies.momentum import ConservativeMomentum, MomentumStrategy
+
+
+def _data(n: int = 600, seed: int = 21) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0.0005, 0.02, n))
+    close[[100, 101, 350]] = np.nan
+    return pd.DataFrame({"close": close}, index=pd.bdate_range("2020-01-01", periods=n))
+
+
+def _reference_signals(strategy: MomentumStrategy, data: pd.DataFrame) -> pd.Series:
+    close = data["close"]
+    ma = ema if strategy.use_ema else sma
+    fast, slow = ma(close, strategy.fast_period), ma(close, strategy.slow_period)
+    rsi_values = rsi(close, strategy.rsi_period)
+    buy = (
+        crossover(fast, slow)
+        & (rsi_values >= strategy.rsi_oversold)
+        & (rsi_values <= strategy.rsi_overbought)
+        & (close > sma(close, strategy.trend_period))
+    )
+    sell = crossunder(fast, slow) | (rsi_values > strategy.rsi_exit)
+    signals = pd.Series(0, index=data.index)
+    signals[buy] = 1
+    signals[sell] = -1
+    return signals
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [MomentumStrategy(), MomentumStrategy(fast_period=3, slow_period=8, rsi_exit=65), ConservativeMomentum()],
+)
+def test_fused_momentum_kernel_matches_pandas_rules(strategy):
+    data = _data()
+
+    signals = strategy.generate_signals(data)
+
+    assert signals.dtype == np.int8
+    np.testing.assert_array_equal(signals.to_numpy(), _reference_signals(strategy, data).to_numpy())
+    assert (signals == 1).any() and (signals == -1).any()
+
+
+def test_momentum_uses_precomputed_indicators_when_given():
+    data = _data()
+    strategy = MomentumStrategy()
+    indicators = compute_suite(data["close"], strategy.required_indicators())
+
+    pd.testing.assert_series_equal(
+        strategy.generate_signals(data, indicators=indicators), strategy.generate_signals(data)
+    )
+
+
+def test_generate_signals_batch_matches_one_run_per_parameter_set():
+    data = _data()
+    params = [{}, {"fast_period": 5, "slow_period": 15, "rsi_period": 10}, {"use_ema": False, "rsi_exit": 70}]
+
+    signals = MomentumStrategy.generate_signals_batch(data, params)
+
+    assert signals.shape == (3, len(data)) and signals.dtype == np.int8
+    for row, kwargs in zip(signals, params):
+        np.testing.assert_array_equal(row, MomentumStrategy(**kwargs).generate_signals(data).to_numpy())
+    with pytest.raises(ValueError):
+        MomentumStrategy.generate_signals_batch(data, [{"fast_period": 0}])
+
+
+def test_generate_signals_accepts_raw_close_array():
+    data = _data()
+    strategy = MomentumStrategy()
+    close = data["close"].to_numpy()
+
+    signals = strategy.generate_signals(close)
+
+    assert isinstance(signals.index, pd.RangeIndex)
+    np.testing.assert_array_equal(signals.to_numpy(), strategy.generate_signals(data).to_numpy())
+    np.testing.assert_array_equal(
+        MomentumStrategy.generate_signals_batch(close, [{}])[0], signals.to_numpy()
+    )
+
+
+@pytest.mark.parametrize("kwargs", [{"slow_period": 50, "trend_period": 50}, {"fast_period": 20, "slow_period": 20}])
+def test_momentum_kernel_with_equal_periods_matches_pandas_rules(kwargs):
+    data = _data()
+    strategy = MomentumStrategy(use_ema=False, **kwargs)
+
+    np.testing.assert_array_equal(
+        strategy.generate_signals(data).to_numpy(), _reference_signals(strategy, data).to_numpy()
+    )
+
+
+def test_describe_is_cached_until_a_parameter_changes():
+    strategy = MomentumStrategy()
+    first = strategy.describe()
+
+    assert strategy.describe() is first
+    strategy.fast_period = 12
+    assert "12-day EMA" in strategy.describe()
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [MomentumStrategy(), MomentumStrategy(fast_period=3, slow_period=8, rsi_exit=65), ConservativeMomentum()],
+)
+def test_online_updates_match_batch_signals(strategy):
+    data = _data()
+    expected = strategy.generate_signals(data).to_numpy()
+
+    online = strategy.get_online(data.iloc[:300])
+    live = [online.update(close) for close in data["close"].iloc[300:]]
+
+    np.testing.assert_array_equal(live, expected[300:])
+    unprimed = strategy.get_online()
+    assert [unprimed.update(close) for close in data["close"]] == expected.tolist()
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+from data.market_regime import MarketRegime, MarketStatus
 from strategy_alert_pipeline import (
     append_pipeline_contract_signals,
     append_pipeline_contract_summary,
+    get_alert_market_status,
     market_degraded_warning_line,
     market_recovery_line,
     top_names,
@@ -57,3 +59,57 @@ def test_trade_quality_sort_key_prioritizes_action_then_quality():
     watch = {"symbol": "B", "action": "WATCH", "trade_quality_score": 90, "effective_confidence": 90}
 
     assert trade_quality_sort_key(buy) < trade_quality_sort_key(watch)
+
+
+class _MarketAdvisor:
+    def __init__(self, market):
+        self.market = market
+        self.calls = 0
+        self.primed = None
+
+    def get_market_status(self, refresh: bool = False):
+        self.calls += 1
+        return self.market
+
+    def prime_market_status(self, status):
+        self.primed = status
+
+
+def _market_status(status: str = "ok") -> MarketStatus:
+    return MarketStatus(
+        regime=MarketRegime.CONFIRMED_UPTREND,
+        distribution_days=1,
+        last_ftd="2026-03-02",
+        trend_direction="up",
+        position_sizing=1.0,
+        notes="Regime score +4",
+        data_source="schwab",
+        status=status,
+    )
+
+
+def test_alert_market_status_reuses_fresh_healthy_status_across_runs():
+    first = _MarketAdvisor(_market_status())
+    assert get_alert_market_status(first) is first.market
+    assert first.calls == 1
+
+    second = _MarketAdvisor(_market_status())
+    reused = get_alert_market_status(second)
+
+    assert second.calls == 0
+    assert second.primed is reused
+    assert reused.regime == MarketRegime.CONFIRMED_UPTREND
+    assert reused.notes == "Regime score +4"
+
+
+def test_alert_market_status_does_not_cache_degraded_or_expired_status(monkeypatch):
+    degraded = _MarketAdvisor(_market_status(status="degraded"))
+    get_alert_market_status(degraded)
+    follow_up = _MarketAdvisor(_market_status())
+    get_alert_market_status(follow_up)
+    assert follow_up.calls == 1
+
+    monkeypatch.setenv("TRADING_ALERT_MARKET_STATUS_TTL_SECONDS", "0")
+    disabled = _MarketAdvisor(_market_status())
+    get_alert_market_status(disabled)
+    assert disabled.calls == 1
@@ -217,6 +217,27 @@ def test_calculate_technical_score_uses_market_data_provider_history(tmp_path, m
     assert calls == [("AAPL", "1y", False)]
 
 
+def test_calculate_technical_score_skips_missing_volume(tmp_path):
+    import numpy as np
+
+    rng = np.random.default_rng(3)
+    idx = pd.date_range(end="2026-03-20", periods=200, freq="D")
+    close = pd.Series(100 * np.cumprod(1 + rng.normal(0.002, 0.02, len(idx))), index=idx)
+    volume = pd.Series(rng.integers(500_000, 2_000_000, len(idx)).astype(float), index=idx)
+    volume.iloc[120] = np.nan
+    history = pd.DataFrame({"Close": close, "Volume": volume})
+    screener = UniverseScreener(cache_dir=str(tmp_path), market_data=SimpleNamespace())
+
+    result = screener.calculate_technical_score("AAA", history=history)
+
+    # Masked-Series means, which skip the missing volume
+    up_days = close.pct_change() > 0
+    volume = volume.dropna()
+    expected = volume[up_days.reindex(volume.index)].mean() / volume[~up_days.reindex(volume.index)].mean()
+    assert result["volume_ratio"] > 0
+    assert abs(result["volume_ratio"] - expected) < 1e-12
+
+
 def test_calculate_technical_score_returns_error_when_provider_history_fails(tmp_path):
     class _Provider:
         def get_history(self, symbol, period="1y", auto_adjust=False):
@@ -254,3 +275,65 @@ def test_screen_filters_symbols_when_provider_history_unavailable(tmp_path, monk
     results = screener.screen(symbols=["AAA", "BBB"], min_technical_score=0, verbose=False)
 
     assert list(results["symbol"]) == ["AAA"]
+
+
+def test_fetch_price_histories_keeps_input_order_and_skips_failures(tmp_path, monkeypatch):
+    screener = UniverseScreener(cache_dir=str(tmp_path))
+    history = _history_frame()
+
+    def fake_fetch(symbol, period="1y"):
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return history
+
+    monkeypatch.setattr(screener, "_fetch_price_history", fake_fetch)
+
+    histories = screener._fetch_price_histories(["CCC", "BAD", "AAA"], period="3mo")
+
+    assert list(histories) == ["CCC", "BAD", "AAA"]
+    assert histories["BAD"] is None
+    assert histories["AAA"] is history
+
+
+def test_fetch_stock_metadata_is_served_from_disk_cache_until_ttl(tmp_path, monkeypatch):
+    screener = UniverseScreener(cache_dir=str(tmp_path))
+    calls = []
+
+    def fake_payload(route, symbol, params=None):
+        calls.append((route, symbol))
+        return {"status": "ok", "data": {"name": "Acme", "market_cap": 5_000_000_000}} if symbol != "DOWN" else None
+
+    monkeypatch.setattr(screener.service_client, "get_symbol_payload", fake_payload)
+
+    first = screener._fetch_stock_metadata("ACME")
+    assert UniverseScreener(cache_dir=str(tmp_path))._fetch_stock_metadata("ACME") == first
+    assert first["market_cap"] == 5_000_000_000
+
+    screener._fetch_stock_metadata("DOWN")
+    screener._fetch_stock_metadata("DOWN")
+
+    screener.metadata_cache_ttl_seconds = -1
+    screener._fetch_stock_metadata("ACME")
+
+    assert calls == [("metadata", "ACME"), ("metadata", "DOWN"), ("metadata", "DOWN"), ("metadata", "ACME")]
+
+
+def test_bundled_ticker_lists_have_no_duplicates():
+    assert len(SP500_TICKERS) == len(set(SP500_TICKERS))
+    assert len(GROWTH_WATCHLIST) == len(set(GROWTH_WATCHLIST))
+
+
+def test_screen_results_store_scores_as_int8(tmp_path, monkeypatch):
+    screener = UniverseScreener(cache_dir=str(tmp_path))
+    history = _history_frame()
+    monkeypatch.setattr(screener, "_fetch_price_history", lambda symbol, period="1y": history)
+    monkeypatch.setattr(
+        screener,
+        "_fetch_stock_metadata",
+        lambda symbol: {"name": symbol, "market_cap": 5_000_000_000},
+    )
+
+    results = screener.screen(symbols=["AAA"], min_technical_score=0, verbose=False)
+
+    assert str(results["technical_score"].dtype) == "int8"
+    assert isinstance(results.to_dict("records")[0]["technical_score"], int)